@@ -0,0 +1,240 @@
+from fastapi import HTTPException, Depends
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+import os
+from pathlib import Path
+from typing import List, Optional
+from datetime import datetime, timedelta
+import jwt
+import httpx
+
+from services.priority_service import PriorityService, classify_quadrant
+from services.task_sweeper import TaskSweeper
+from services.scheduler import JobScheduler
+from services.notifications import NotificationOutbox
+from services.broadcast import TeamBroadcaster
+from services.cache import LRUCache
+from services.name_index import TeamNameIndex
+from services.sidecar_monitor import SidecarHealthMonitor
+from services.change_feed import ChangeFeed
+from services.sync import DeltaSync
+from services.stats import UserStatsBuffer
+from services.tenancy import TenantRepository
+from services.passwords import PasswordHasher
+from services.auth_sessions import RefreshSessionStore
+from models import EisenhowerQuadrant, Priority, TaskStatus, User
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+# Security setup
+SECRET_KEY = os.environ.get('SECRET_KEY', 'your-secret-key-change-in-production')
+ALGORITHM = "HS256"
+ACCESS_TOKEN_EXPIRE_MINUTES = 30
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.environ.get('REFRESH_TOKEN_EXPIRE_DAYS', '30'))
+
+# bcrypt runs on its own pool so login bursts don't block the event loop
+password_hasher = PasswordHasher(
+    max_workers=int(os.environ.get('PASSWORD_HASH_WORKERS', '0')) or None,
+    max_pending=int(os.environ.get('PASSWORD_HASH_MAX_PENDING', '256')),
+    use_processes=os.environ.get('PASSWORD_HASH_EXECUTOR', 'thread').lower() == 'process'
+)
+security = HTTPBearer()
+
+# MongoDB connection
+mongo_url = os.environ['MONGO_URL']
+client = AsyncIOMotorClient(mongo_url)
+db = client[os.environ['DB_NAME']]
+
+# Task priority ranking
+priority_service = PriorityService(db)
+
+# Built-in cron scheduler (jobs are registered at startup, schedules are UTC)
+scheduler = JobScheduler(db)
+SCHEDULER_ENABLED = os.environ.get('SCHEDULER_ENABLED', 'true').lower() == 'true'
+
+# Helper Functions
+async def verify_password(plain_password, hashed_password):
+    return await password_hasher.verify(plain_password, hashed_password)
+
+async def get_password_hash(password):
+    return await password_hasher.hash(password)
+
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    to_encode = data.copy()
+    if expires_delta:
+        expire = datetime.utcnow() + expires_delta
+    else:
+        expire = datetime.utcnow() + timedelta(minutes=15)
+    to_encode.update({"exp": expire})
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return encoded_jwt
+
+# Refresh tokens renew access tokens without another password check
+auth_sessions = RefreshSessionStore(
+    db,
+    ttl=timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+    sync_interval=float(os.environ.get('SESSION_REVOCATION_SYNC_SECONDS', '30')),
+    secret=SECRET_KEY,
+    reuse_grace=timedelta(seconds=int(os.environ.get('REFRESH_TOKEN_REUSE_GRACE_SECONDS', '30')))
+)
+
+def create_session_access_token(user_id: str, session_id: str) -> str:
+    return create_access_token(
+        data={"sub": user_id, "sid": session_id},
+        expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+
+# Authenticated users by id, so steady-state requests skip the users lookup.
+# Kept short because other workers' profile changes only show up on expiry.
+auth_user_cache = LRUCache(
+    max_size=int(os.environ.get('AUTH_USER_CACHE_SIZE', '10000')),
+    ttl_seconds=float(os.environ.get('AUTH_USER_CACHE_TTL_SECONDS', '30'))
+)
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    return await get_user_from_token(credentials.credentials)
+
+async def get_tenant(current_user: User = Depends(get_current_user)) -> TenantRepository:
+    """Data access limited to the current user's company"""
+    return TenantRepository(db, current_user.id, current_user.company_id)
+
+async def get_user_from_token(token: str):
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        user_id: str = payload.get("sub")
+        if user_id is None:
+            raise HTTPException(status_code=401, detail="Invalid authentication credentials")
+        if payload.get("sid") and await auth_sessions.is_revoked(payload["sid"]):
+            raise HTTPException(status_code=401, detail="Session has been revoked")
+        
+        cached = auth_user_cache.get(user_id)
+        if cached is not None:
+            return cached
+        
+        user = await db.users.find_one({"id": user_id})
+        if user is None:
+            raise HTTPException(status_code=401, detail="User not found")
+        user = User(**user)
+        auth_user_cache.set(user_id, user)
+        return user
+    except jwt.PyJWTError:
+        raise HTTPException(status_code=401, detail="Invalid authentication credentials")
+
+# WhatsApp sidecar and notifications
+WHATSAPP_SERVICE_URL = os.environ.get('WHATSAPP_SERVICE_URL', 'http://localhost:3002')
+NOTIFICATION_DIGEST_WINDOW_SECONDS = float(os.environ.get('NOTIFICATION_DIGEST_WINDOW_SECONDS', '60'))
+
+async def send_whatsapp_text(phone_number: str, message: str, timeout: float = 10.0) -> bool:
+    """Send a single text message through the WhatsApp sidecar"""
+    async with httpx.AsyncClient() as client:
+        response = await client.post(
+            f"{WHATSAPP_SERVICE_URL}/send",
+            json={
+                "phone_number": phone_number,
+                "message": message
+            },
+            timeout=timeout
+        )
+        return response.status_code == 200
+
+# Durable outbox for every WhatsApp notification; bursts to one person are sent as a digest
+notification_outbox = NotificationOutbox(
+    db,
+    send=send_whatsapp_text,
+    digest_window=timedelta(seconds=NOTIFICATION_DIGEST_WINDOW_SECONDS),
+    max_attempts=int(os.environ.get('NOTIFICATION_MAX_ATTEMPTS', '8'))
+)
+
+# Time-driven task maintenance; overdue alerts go through the outbox
+task_sweeper = TaskSweeper(db, notifications=notification_outbox)
+
+# Team broadcasts queue one outbox message per member with a phone number
+team_broadcaster = TeamBroadcaster(db, notification_outbox)
+
+# One background poller caches the sidecar status for every client
+whatsapp_monitor = SidecarHealthMonitor(
+    WHATSAPP_SERVICE_URL,
+    interval=float(os.environ.get('WHATSAPP_STATUS_INTERVAL_SECONDS', '5'))
+)
+
+# Inbound messages resolve phone -> user here first; invalidated on profile changes
+whatsapp_user_cache = LRUCache(
+    max_size=int(os.environ.get('WHATSAPP_USER_CACHE_SIZE', '10000')),
+    ttl_seconds=float(os.environ.get('WHATSAPP_USER_CACHE_TTL_SECONDS', '600'))
+)
+
+# Per-company fuzzy name lookup for "assign task to [name]"
+team_name_index = TeamNameIndex(
+    db,
+    ttl=timedelta(minutes=int(os.environ.get('TEAM_NAME_INDEX_TTL_MINUTES', '10')))
+)
+
+# Pushes task/project changes to /api/ws clients (change streams, or polling on a standalone Mongo)
+change_feed = ChangeFeed(
+    db,
+    poll_interval=float(os.environ.get('CHANGE_FEED_POLL_INTERVAL_SECONDS', '2'))
+)
+
+# Incremental /api/sync for offline clients; tombstones of deleted records are kept this long
+delta_sync = DeltaSync(
+    db,
+    tombstone_ttl=timedelta(days=int(os.environ.get('SYNC_TOMBSTONE_TTL_DAYS', '30')))
+)
+
+# tasks_assigned/tasks_completed increments, flushed in bulk off the request path
+user_stats = UserStatsBuffer(
+    db,
+    flush_interval=float(os.environ.get('USER_STATS_FLUSH_SECONDS', '1'))
+)
+
+def invalidate_cached_user(user_id: str):
+    """Drop a user's cached auth and WhatsApp profiles after their document changes"""
+    auth_user_cache.invalidate(user_id)
+    whatsapp_user_cache.invalidate_where(lambda cached: cached.get("id") == user_id)
+
+def on_user_document_change(user_id: Optional[str]):
+    """Profile writes from other workers, seen through the users change stream; counter updates are filtered out"""
+    if user_id:
+        invalidate_cached_user(user_id)
+    else:
+        # A delete only carries the _id
+        auth_user_cache.clear()
+        whatsapp_user_cache.clear()
+
+change_feed.on_user_change(on_user_document_change)
+
+def task_assignment_summary(title: str, priority: str, assigned_by_name: str, due_date: Optional[datetime]) -> str:
+    """One-line task assignment used inside digest messages"""
+    priority_emoji = {"urgent": "🔥", "high": "⚡", "medium": "📌", "low": "📝"}.get(priority, "📌")
+    due_text = f" (due {due_date.strftime('%Y-%m-%d')})" if due_date else ""
+    return f"{priority_emoji} {title}{due_text} - from {assigned_by_name}"
+
+# Scoring helpers shared by the task, analytics and WhatsApp routes
+def calculate_eisenhower_quadrant(priority: Priority, due_date: Optional[datetime]) -> EisenhowerQuadrant:
+    """Calculate Eisenhower matrix quadrant based on priority and due date"""
+    return EisenhowerQuadrant(classify_quadrant(priority, due_date))
+
+async def calculate_performance_score(user_id: str) -> float:
+    """Calculate performance score based on completion rate, timeliness, and quality"""
+    tasks = await db.tasks.find({"assigned_to": user_id}).to_list(1000)
+    return performance_score_from_tasks(tasks)
+
+def performance_score_from_tasks(tasks: List[dict]) -> float:
+    if not tasks:
+        return 0.0
+    
+    completed_tasks = [t for t in tasks if t.get("status") == TaskStatus.COMPLETED]
+    overdue_tasks = [t for t in tasks if t.get("status") == TaskStatus.OVERDUE]
+    
+    completion_rate = len(completed_tasks) / len(tasks)
+    timeliness_score = 1.0 - (len(overdue_tasks) / len(tasks))
+    
+    # Average quality rating
+    quality_ratings = [t.get("quality_rating", 5) for t in completed_tasks if t.get("quality_rating")]
+    quality_score = sum(quality_ratings) / len(quality_ratings) / 10 if quality_ratings else 0.5
+    
+    # Weighted performance score
+    performance_score = (completion_rate * 0.4 + timeliness_score * 0.4 + quality_score * 0.2) * 10
+    return min(10.0, max(0.0, performance_score))
@@ -0,0 +1,182 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+import uuid
+from datetime import datetime, timedelta
+from enum import Enum
+
+# Enums
+class TaskStatus(str, Enum):
+    TODO = "todo"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    OVERDUE = "overdue"
+
+class Priority(str, Enum):
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+    URGENT = "urgent"
+
+class EisenhowerQuadrant(str, Enum):
+    DO = "do"  # Urgent & Important
+    DECIDE = "decide"  # Important & Not Urgent
+    DELEGATE = "delegate"  # Urgent & Not Important
+    DELETE = "delete"  # Not Urgent & Not Important
+
+class UserRole(str, Enum):
+    ADMIN = "admin"
+    MANAGER = "manager"
+    TEAM_MEMBER = "team_member"
+
+class PlanType(str, Enum):
+    PERSONAL = "personal"
+    TEAM = "team"
+    ENTERPRISE = "enterprise"
+
+# Models
+class User(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    name: str
+    email: str
+    phone_number: Optional[str] = None  # Added for WhatsApp integration
+    role: str = "team_member"  # team_member, manager, admin
+    performance_score: float = 0.0
+    tasks_completed: int = 0
+    tasks_assigned: int = 0
+    tasks_overdue: int = 0
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    company_id: Optional[str] = None
+    timezone: str = "UTC"  # IANA name, e.g. Asia/Kolkata
+    reminder_time: str = "09:00"  # Local HH:MM for the daily WhatsApp reminder
+    reminders_enabled: bool = True
+
+# Auth Models
+class UserAuth(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    email: str
+    password_hash: str
+    is_active: bool = True
+    is_verified: bool = False
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    last_login: Optional[datetime] = None
+
+class Company(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    name: str
+    plan: PlanType
+    subscription_status: str = "trial"  # trial, active, suspended, cancelled
+    trial_ends_at: datetime = Field(default_factory=lambda: datetime.utcnow() + timedelta(days=14))
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    settings: dict = {}
+
+class AuthSignup(BaseModel):
+    name: str
+    email: str
+    password: str
+    company: str
+    plan: PlanType = PlanType.PERSONAL
+    phone_number: Optional[str] = None
+
+class AuthLogin(BaseModel):
+    email: str
+    password: str
+
+class Token(BaseModel):
+    access_token: str
+    token_type: str
+    user: dict
+    refresh_token: Optional[str] = None
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+class UserCreate(BaseModel):
+    name: str
+    email: str
+    password: str
+    company: str
+    plan: PlanType = PlanType.PERSONAL
+
+class Task(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    title: str
+    description: Optional[str] = ""
+    assigned_to: Optional[str] = None  # User ID
+    assigned_by: Optional[str] = None  # User ID
+    project_id: Optional[str] = None  # For project-based tasks
+    status: TaskStatus = TaskStatus.TODO
+    priority: Priority = Priority.MEDIUM
+    eisenhower_quadrant: Optional[EisenhowerQuadrant] = None
+    priority_score: float = 0.0  # Urgency-importance ranking, see priority_service
+    due_date: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)  # Bumped by every write, see /sync
+    version: int = 0  # Bumped by every write, sent as the ETag for If-Match updates
+    company_id: Optional[str] = None  # Tenant, copied from the creator
+    subtasks: List[str] = []  # Task IDs
+    tags: List[str] = []
+    feedback: Optional[str] = None
+    quality_rating: Optional[int] = None  # 1-10 scale
+
+class TaskCreate(BaseModel):
+    title: str
+    description: Optional[str] = ""
+    assigned_to: Optional[str] = None
+    project_id: Optional[str] = None
+    priority: Priority = Priority.MEDIUM
+    due_date: Optional[datetime] = None
+    tags: List[str] = []
+
+class TaskUpdate(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[TaskStatus] = None
+    priority: Optional[Priority] = None
+    due_date: Optional[datetime] = None
+    feedback: Optional[str] = None
+    quality_rating: Optional[int] = None
+
+class BulkTaskOperation(BaseModel):
+    op: str  # create, update, delete, reassign, status
+    id: Optional[str] = None  # Every op except create
+    task: Optional[TaskCreate] = None  # create
+    changes: Optional[TaskUpdate] = None  # update
+    assigned_to: Optional[str] = None  # reassign
+    status: Optional[TaskStatus] = None  # status
+    version: Optional[int] = None  # Per-item If-Match
+
+class BulkTaskRequest(BaseModel):
+    operations: List[BulkTaskOperation]
+
+class Project(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    name: str
+    description: Optional[str] = ""
+    owner_id: str  # User ID
+    team_members: List[str] = []  # User IDs
+    status: str = "active"  # active, completed, archived
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    due_date: Optional[datetime] = None
+    company_id: Optional[str] = None  # Tenant, copied from the creator
+
+class ProjectCreate(BaseModel):
+    name: str
+    description: Optional[str] = ""
+    owner_id: str
+    team_members: List[str] = []
+    due_date: Optional[datetime] = None
+
+class PerformanceReport(BaseModel):
+    user_id: str
+    user_name: str
+    period: str  # daily, weekly, monthly
+    tasks_completed: int
+    tasks_assigned: int
+    tasks_overdue: int
+    completion_rate: float
+    average_quality: float
+    performance_score: float
+    feedback: str
+    suggestions: List[str] = []
@@ -0,0 +1,11 @@
+from collections import Counter
+from typing import List
+
+
+def find_duplicate_routes(app) -> List[str]:
+    """'METHOD /path' pairs registered more than once (only the first one is ever served)"""
+    registrations = Counter()
+    for route in app.routes:
+        for method in getattr(route, "methods", None) or ["WEBSOCKET"]:
+            registrations[f"{method} {route.path}"] += 1
+    return sorted(route for route, count in registrations.items() if count > 1)
@@ -0,0 +1,1210 @@
+from fastapi import APIRouter, Depends, HTTPException
+import os
+import logging
+import uuid
+from datetime import datetime, timedelta
+
+from services.tenancy import TenantRepository
+from core import db, get_tenant
+from models import EisenhowerQuadrant, TaskStatus, User
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+def generate_productivity_report(context, historical, user):
+    """Generate comprehensive productivity report"""
+    
+    productivity_score = (context['completion_rate'] / 10) + (5 if context['overdue_tasks'] == 0 else 3)
+    
+    report = {
+        "productivity_score": min(10, productivity_score),
+        "trend": "improving" if context['productivity_trend'] == "improving" else "stable",
+        "trend_percentage": 12.5,  # Simplified for demo
+        "top_strength": "Task execution" if context['completion_rate'] > 80 else "Planning",
+        "improvement_area": "Time management" if context['overdue_tasks'] > 0 else "Task prioritization",
+        "historical_avg": historical.get('avg_completion_rate', 70),
+        "industry_benchmark": 78.0,
+        "efficiency_score": min(10, context['completion_rate'] / 10),
+        "time_management_score": 8.5 if context['overdue_tasks'] == 0 else 6.0,
+        "work_style": "Executor" if context['completion_rate'] > 80 else "Planner",
+        "peak_hours": "9-11 AM",
+        "complexity_preference": "Moderate",
+        "collaboration_level": "High" if context['active_projects'] > 2 else "Moderate",
+        "weekly_breakdown": {
+            "Monday": {"completed": 3, "avg_duration": 2.5},
+            "Tuesday": {"completed": 4, "avg_duration": 2.0},
+            "Wednesday": {"completed": 3, "avg_duration": 2.8},
+            "Thursday": {"completed": 4, "avg_duration": 2.2},
+            "Friday": {"completed": 2, "avg_duration": 1.5}
+        },
+        "action_items": [
+            "Complete overdue tasks first" if context['overdue_tasks'] > 0 else "Maintain current performance",
+            "Implement daily planning routine",
+            "Set up weekly review process",
+            "Optimize peak productivity hours"
+        ],
+        "most_productive_day": "Tuesday",
+        "avg_task_duration": 2.4,
+        "procrastination_index": 3.0 if context['overdue_tasks'] == 0 else 6.5,
+        "stress_level": 4 if context['overdue_tasks'] <= 2 else 7
+    }
+    
+    return report
+
+@router.post("/meeting-intelligence/analyze")
+async def analyze_meeting_intelligence(request: dict):
+    """
+    Meeting Intelligence: Analyze meeting data and extract action items
+    """
+    try:
+        meeting_data = {
+            "title": request.get("title", ""),
+            "description": request.get("description", ""),
+            "attendees": request.get("attendees", []),
+            "duration_minutes": request.get("duration_minutes", 60),
+            "meeting_type": request.get("meeting_type", "general")
+        }
+        
+        # AI-powered meeting analysis using the existing OpenAI integration
+        openai_key = os.environ.get('OPENAI_API_KEY')
+        
+        if openai_key:
+            from openai import OpenAI
+            client = OpenAI(api_key=openai_key)
+            
+            analysis_prompt = f"""
+Analyze this meeting and extract actionable insights:
+
+Meeting: {meeting_data['title']}
+Description: {meeting_data['description']}
+Duration: {meeting_data['duration_minutes']} minutes
+Attendees: {len(meeting_data['attendees'])} people
+Type: {meeting_data['meeting_type']}
+
+Please provide:
+1. Key action items that should be created as tasks
+2. Meeting preparation recommendations
+3. Follow-up suggestions
+4. Productivity score (1-10) for this meeting
+5. Recommended next steps
+
+Focus on practical, actionable advice for improving productivity and outcomes.
+"""
+            
+            response = client.chat.completions.create(
+                model="gpt-4",
+                messages=[
+                    {"role": "system", "content": "You are a meeting productivity expert. Analyze meetings and provide actionable insights for better outcomes."},
+                    {"role": "user", "content": analysis_prompt}
+                ],
+                max_tokens=800,
+                temperature=0.7
+            )
+            
+            ai_analysis = response.choices[0].message.content
+        else:
+            ai_analysis = "AI analysis unavailable - OpenAI key not configured"
+        
+        # Extract structured insights
+        meeting_intelligence = {
+            "meeting_id": str(uuid.uuid4()),
+            "analysis_timestamp": datetime.utcnow().isoformat(),
+            "meeting_summary": {
+                "title": meeting_data["title"],
+                "type": meeting_data["meeting_type"],
+                "duration": meeting_data["duration_minutes"],
+                "attendee_count": len(meeting_data["attendees"])
+            },
+            "action_items": [
+                {
+                    "id": str(uuid.uuid4()),
+                    "title": "Follow up on key decisions",
+                    "description": f"Review outcomes from {meeting_data['title']}",
+                    "priority": "high",
+                    "due_date": (datetime.utcnow() + timedelta(days=3)).isoformat(),
+                    "eisenhower_quadrant": "do" if meeting_data["meeting_type"] in ["decision", "planning"] else "decide"
+                },
+                {
+                    "id": str(uuid.uuid4()),
+                    "title": "Send meeting summary to attendees",
+                    "description": "Share key points and action items with meeting participants",
+                    "priority": "medium",
+                    "due_date": (datetime.utcnow() + timedelta(days=1)).isoformat(),
+                    "eisenhower_quadrant": "delegate"
+                }
+            ],
+            "preparation_analysis": {
+                "agenda_quality": "good" if meeting_data["description"] else "needs_improvement",
+                "estimated_prep_time": max(15, meeting_data["duration_minutes"] * 0.5),
+                "materials_needed": ["agenda", "previous_notes", "decision_framework"],
+                "pre_meeting_tasks": [
+                    "Review previous meeting notes",
+                    "Prepare talking points",
+                    "Set clear objectives"
+                ]
+            },
+            "productivity_insights": {
+                "productivity_score": 8 if len(meeting_data["attendees"]) <= 5 else 6,
+                "efficiency_rating": "high" if meeting_data["duration_minutes"] <= 60 else "medium",
+                "collaboration_potential": "high" if meeting_data["meeting_type"] in ["brainstorm", "planning"] else "medium",
+                "optimization_suggestions": [
+                    "Keep meetings under 60 minutes when possible",
+                    "Limit attendees to essential participants only", 
+                    "Always end with clear action items",
+                    "Schedule follow-up checkpoints"
+                ]
+            },
+            "follow_up_recommendations": [
+                "Schedule immediate follow-up tasks in your calendar",
+                "Set reminders for action item deadlines",
+                "Book any necessary follow-up meetings now",
+                "Share summary within 24 hours"
+            ],
+            "ai_analysis": ai_analysis,
+            "calendar_integration": {
+                "suggested_calendar_blocks": [
+                    {
+                        "title": f"Prep: {meeting_data['title']}",
+                        "duration": max(15, meeting_data["duration_minutes"] * 0.3),
+                        "schedule_before": "30 minutes before meeting"
+                    },
+                    {
+                        "title": f"Follow-up: {meeting_data['title']}",
+                        "duration": 30,
+                        "schedule_after": "2 hours after meeting"
+                    }
+                ]
+            }
+        }
+        
+        return meeting_intelligence
+        
+    except Exception as e:
+        logger.error(f"Meeting intelligence error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+# AI Coach Endpoints
+@router.get("/ai-coach/insights/{user_id}")
+async def get_ai_insights(user_id: str, tenant: TenantRepository = Depends(get_tenant)):
+    """Generate AI insights for a user's productivity patterns"""
+    # Only members of the caller's company, and only their company's tasks
+    user = await tenant.users.find_one({"id": user_id})
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    tasks = await tenant.tasks.find({"assigned_to": user_id}).to_list(1000)
+    
+    # Analyze patterns
+    insights = []
+    suggestions = []
+    
+    if not tasks:
+        return {
+            "insights": ["No tasks found for analysis"],
+            "suggestions": ["Start by creating some tasks to track your productivity"],
+            "performance_trend": "stable"
+        }
+    
+    completed_tasks = [t for t in tasks if t.get("status") == TaskStatus.COMPLETED]
+    overdue_tasks = [t for t in tasks if t.get("status") == TaskStatus.OVERDUE]
+    
+    completion_rate = len(completed_tasks) / len(tasks)
+    
+    # Generate insights based on patterns
+    if completion_rate > 0.8:
+        insights.append("Excellent task completion rate! You're consistently delivering.")
+        suggestions.append("Consider taking on more challenging projects to grow further.")
+    elif completion_rate > 0.6:
+        insights.append("Good task completion rate with room for improvement.")
+        suggestions.append("Focus on better time management for remaining tasks.")
+    else:
+        insights.append("Task completion rate needs attention.")
+        suggestions.append("Consider breaking large tasks into smaller, manageable subtasks.")
+    
+    if len(overdue_tasks) > 0:
+        insights.append(f"You have {len(overdue_tasks)} overdue tasks affecting your performance.")
+        suggestions.append("Set up reminder systems and prioritize overdue tasks first.")
+    
+    # Analyze Eisenhower quadrant distribution
+    do_tasks = [t for t in tasks if t.get("eisenhower_quadrant") == EisenhowerQuadrant.DO]
+    if len(do_tasks) > len(tasks) * 0.5:
+        insights.append("You're spending too much time on urgent tasks.")
+        suggestions.append("Focus more on important but not urgent tasks to reduce future urgency.")
+    
+    return {
+        "insights": insights,
+        "suggestions": suggestions,
+        "performance_trend": "improving" if completion_rate > 0.7 else "needs_attention"
+    }
+
+# Enhanced AI Coach with real AI integration and DATABASE ANALYSIS
+@router.post("/ai-coach/chat")
+async def ai_coach_chat(request: dict, tenant: TenantRepository = Depends(get_tenant)):
+    """AI Coach chat with real user data analysis"""
+    try:
+        message = request.get("message", "").strip()
+        user_id = request.get("user_id")
+        ai_provider = request.get("ai_provider", "openai")
+        include_context = request.get("include_user_context", True)
+        
+        if not message:
+            raise HTTPException(status_code=400, detail="Message is required")
+        
+        user_context = ""
+        if user_id and include_context:
+            # Get user's actual task data for personalized analysis
+            user = await tenant.users.find_one({"id": user_id})
+            tasks = await tenant.tasks.find({"assigned_to": user_id}).to_list(100)
+            
+            if user and tasks:
+                # Analyze user's real data
+                completed_tasks = [t for t in tasks if t.get("status") == "completed"]
+                pending_tasks = [t for t in tasks if t.get("status") != "completed"]
+                overdue_tasks = [t for t in pending_tasks if t.get("status") == "overdue"]
+                
+                # Calculate real performance metrics
+                completion_rate = (len(completed_tasks) / len(tasks) * 100) if tasks else 0
+                
+                # Get priority distribution
+                priority_dist = {}
+                for task in tasks:
+                    priority = task.get("priority", "medium")
+                    priority_dist[priority] = priority_dist.get(priority, 0) + 1
+                
+                # Get recent activity
+                week_ago = datetime.utcnow() - timedelta(days=7)
+                recent_completed = [t for t in completed_tasks if t.get("completed_at") and t["completed_at"] >= week_ago]
+                
+                user_context = f"""
+User Analysis for {user.get('name', 'User')}:
+
+CURRENT PERFORMANCE:
+- Total tasks: {len(tasks)}
+- Completed: {len(completed_tasks)} ({completion_rate:.1f}%)
+- Pending: {len(pending_tasks)}
+- Overdue: {len(overdue_tasks)}
+- This week completed: {len(recent_completed)}
+
+TASK PRIORITIES:
+- Urgent: {priority_dist.get('urgent', 0)}
+- High: {priority_dist.get('high', 0)}
+- Medium: {priority_dist.get('medium', 0)}
+- Low: {priority_dist.get('low', 0)}
+
+SPECIFIC INSIGHTS:
+{f'⚠️ CRITICAL: {len(overdue_tasks)} overdue tasks need immediate attention!' if overdue_tasks else '✅ No overdue tasks - good time management!'}
+{f'📈 POSITIVE: Completed {len(recent_completed)} tasks this week - {("excellent" if len(recent_completed) >= 10 else "good" if len(recent_completed) >= 5 else "needs improvement")} pace' if recent_completed else '⚠️ No tasks completed this week - may need productivity boost'}
+{f'🎯 FOCUS AREA: High priority tasks pending - {len([t for t in pending_tasks if t.get("priority") in ["urgent", "high"]])} urgent/high priority items' if any(t.get("priority") in ["urgent", "high"] for t in pending_tasks) else '✅ Good priority management'}
+
+RECENT TASK EXAMPLES:
+""" + "\n".join([f"- {t['title']} ({t.get('status', 'unknown')})" for t in tasks[-5:]]) if tasks else "- No tasks found"
+            else:
+                user_context = f"User {user_id}: No task data available yet. This appears to be a new user who hasn't created tasks."
+        
+        # Create personalized prompt
+        system_prompt = f"""You are an AI Productivity Coach for the Productivity Beast app. You analyze REAL user data and provide personalized, actionable advice.
+
+{user_context if user_context else "General productivity coaching mode - no specific user data available."}
+
+Guidelines:
+1. Reference the user's ACTUAL data in your response
+2. Give specific, actionable advice based on their real performance
+3. Be encouraging but honest about areas for improvement
+4. Suggest concrete next steps they can take today
+5. Keep responses focused and practical (2-3 paragraphs max)
+6. Use metrics and specific examples from their data
+
+User Question: {message}"""
+
+        # Call OpenAI with real user context
+        from openai import OpenAI
+        openai_client = OpenAI(api_key=os.environ.get('OPENAI_API_KEY'))
+        
+        response = openai_client.chat.completions.create(
+            model="gpt-4",
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": message}
+            ],
+            max_tokens=500,
+            temperature=0.7
+        )
+        
+        ai_response = response.choices[0].message.content
+        
+        return {
+            "response": ai_response,
+            "provider": ai_provider,
+            "user_context_used": bool(user_context),
+            "analysis_summary": f"Analyzed {len(tasks) if user_id and include_context else 0} tasks" if user_id else "No user context"
+        }
+        
+    except Exception as e:
+        logger.error(f"AI Coach chat error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"AI Coach error: {str(e)}")
+        return {
+            "response": "I encountered an error analyzing your data. Please try again.",
+            "provider": "error",
+            "timestamp": datetime.utcnow(),
+            "error": str(e)
+        }
+
+async def get_comprehensive_user_analysis(user_id: str):
+    """Get comprehensive analysis of user's actual data from database"""
+    try:
+        # Get user info
+        user = await db.users.find_one({"id": user_id}) if user_id != "demo_user" else None
+        
+        if not user:
+            # Use sample data for demo
+            user = await db.users.find_one({}) or {"id": "demo", "name": "Demo User"}
+            user_id = user.get("id", "demo")
+        
+        # Get actual tasks from database
+        tasks = await db.tasks.find({"assigned_to": user_id}).to_list(1000)
+        
+        # Get actual projects from database
+        projects = await db.projects.find({
+            "$or": [
+                {"owner_id": user_id},
+                {"team_members": user_id}
+            ]
+        }).to_list(100)
+        
+        # Calculate REAL performance metrics
+        completed_tasks = [t for t in tasks if t.get("status") == "completed"]
+        overdue_tasks = [t for t in tasks if t.get("status") == "overdue"]
+        in_progress_tasks = [t for t in tasks if t.get("status") == "in_progress"]
+        
+        # Calculate completion rate
+        completion_rate = (len(completed_tasks) / len(tasks) * 100) if tasks else 0
+        
+        # Analyze Eisenhower Matrix distribution
+        eisenhower_distribution = {}
+        for quadrant in ["do", "decide", "delegate", "delete"]:
+            eisenhower_distribution[quadrant] = len([t for t in tasks if t.get("eisenhower_quadrant") == quadrant])
+        
+        # Analyze recent activity patterns
+        recent_tasks = [t for t in tasks if (datetime.utcnow() - t.get("created_at", datetime.utcnow())).days <= 7]
+        
+        # Get team members for collaboration analysis
+        team_members = []
+        for project in projects:
+            team_members.extend(project.get("team_members", []))
+        unique_team_members = list(set(team_members))
+        
+        # Calculate productivity score
+        productivity_score = calculate_real_productivity_score(tasks, projects)
+        
+        # Recent task titles for specific analysis
+        recent_task_titles = [t.get("title", "") for t in recent_tasks[:5]]
+        urgent_task_titles = [t.get("title", "") for t in tasks if t.get("eisenhower_quadrant") == "do"][:3]
+        
+        # Time-based patterns
+        task_creation_by_day = {}
+        for task in tasks:
+            day = task.get("created_at", datetime.utcnow()).strftime("%A")
+            task_creation_by_day[day] = task_creation_by_day.get(day, 0) + 1
+        
+        most_productive_day = max(task_creation_by_day, key=task_creation_by_day.get) if task_creation_by_day else "Monday"
+        
+        # Project status analysis
+        active_projects = [p for p in projects if p.get("status") == "active"]
+        completed_projects = [p for p in projects if p.get("status") == "completed"]
+        
+        analysis = {
+            "user_name": user.get("name", "User"),
+            "user_role": user.get("role", "team_member"),
+            "total_tasks": len(tasks),
+            "completed_tasks": len(completed_tasks),
+            "overdue_tasks": len(overdue_tasks),
+            "in_progress_tasks": len(in_progress_tasks),
+            "completion_rate": round(completion_rate, 1),
+            "productivity_score": productivity_score,
+            "eisenhower_distribution": eisenhower_distribution,
+            "recent_activity": len(recent_tasks),
+            "recent_task_titles": recent_task_titles,
+            "urgent_task_titles": urgent_task_titles,
+            "total_projects": len(projects),
+            "active_projects": len(active_projects),
+            "completed_projects": len(completed_projects),
+            "team_size": len(unique_team_members),
+            "most_productive_day": most_productive_day,
+            "task_creation_pattern": task_creation_by_day,
+            "data_points_count": len(tasks) + len(projects),
+            "last_task_created": tasks[-1].get("title", "") if tasks else "",
+            "performance_trend": "improving" if completion_rate > 70 else "needs_attention",
+            "focus_areas": identify_focus_areas(tasks, eisenhower_distribution),
+            "collaboration_level": "high" if len(unique_team_members) > 3 else "medium" if len(unique_team_members) > 1 else "solo",
+            "workload_balance": analyze_workload_balance(eisenhower_distribution),
+            "specific_recommendations": generate_specific_recommendations(tasks, projects, completion_rate)
+        }
+        
+        return analysis
+        
+    except Exception as e:
+        logger.error(f"Error getting user analysis: {str(e)}")
+        return {"error": str(e), "data_points_count": 0}
+
+def calculate_real_productivity_score(tasks, projects):
+    """Calculate productivity score based on actual user data"""
+    if not tasks:
+        return 5.0
+    
+    completed_tasks = len([t for t in tasks if t.get("status") == "completed"])
+    total_tasks = len(tasks)
+    completion_rate = completed_tasks / total_tasks if total_tasks > 0 else 0
+    
+    # Factor in project completion
+    completed_projects = len([p for p in projects if p.get("status") == "completed"])
+    total_projects = len(projects) if projects else 1
+    project_completion_rate = completed_projects / total_projects
+    
+    # Calculate score (1-10)
+    score = (completion_rate * 6) + (project_completion_rate * 3) + 1
+    return min(10.0, max(1.0, score))
+
+def identify_focus_areas(tasks, eisenhower_distribution):
+    """Identify specific focus areas based on task distribution"""
+    focus_areas = []
+    
+    total_tasks = sum(eisenhower_distribution.values())
+    if total_tasks == 0:
+        return ["Create initial tasks and goals"]
+    
+    # Check for too many urgent tasks
+    urgent_percentage = (eisenhower_distribution.get("do", 0) / total_tasks) * 100
+    if urgent_percentage > 30:
+        focus_areas.append("Reduce urgent tasks through better planning")
+    
+    # Check for lack of important tasks
+    important_percentage = (eisenhower_distribution.get("decide", 0) / total_tasks) * 100
+    if important_percentage < 40:
+        focus_areas.append("Increase focus on important but not urgent tasks")
+    
+    # Check for delegation opportunities
+    delegate_percentage = (eisenhower_distribution.get("delegate", 0) / total_tasks) * 100
+    if delegate_percentage > 20:
+        focus_areas.append("Implement delegation strategies")
+    
+    # Check for elimination opportunities
+    delete_percentage = (eisenhower_distribution.get("delete", 0) / total_tasks) * 100
+    if delete_percentage > 10:
+        focus_areas.append("Eliminate low-value activities")
+    
+    if not focus_areas:
+        focus_areas.append("Maintain current balanced approach")
+    
+    return focus_areas
+
+def analyze_workload_balance(eisenhower_distribution):
+    """Analyze workload balance based on Eisenhower Matrix"""
+    total = sum(eisenhower_distribution.values())
+    if total == 0:
+        return "No tasks to analyze"
+    
+    do_percentage = (eisenhower_distribution.get("do", 0) / total) * 100
+    decide_percentage = (eisenhower_distribution.get("decide", 0) / total) * 100
+    
+    if do_percentage > 40:
+        return "Too much firefighting - focus on prevention"
+    elif decide_percentage > 60:
+        return "Excellent focus on important work"
+    elif do_percentage < 10 and decide_percentage > 50:
+        return "Great proactive approach"
+    else:
+        return "Balanced workload distribution"
+
+def generate_specific_recommendations(tasks, projects, completion_rate):
+    """Generate specific recommendations based on actual data"""
+    recommendations = []
+    
+    if completion_rate < 60:
+        recommendations.append("Break down large tasks into smaller 15-30 minute chunks")
+    
+    if len([t for t in tasks if t.get("status") == "overdue"]) > 0:
+        recommendations.append("Schedule daily 10-minute overdue task review")
+    
+    if len(projects) > 5:
+        recommendations.append("Consider consolidating or pausing some projects")
+    
+    recent_tasks = [t for t in tasks if (datetime.utcnow() - t.get("created_at", datetime.utcnow())).days <= 3]
+    if len(recent_tasks) > 10:
+        recommendations.append("Limit new task creation to 3 per day")
+    
+    if not recommendations:
+        recommendations.append("Continue current productive approach")
+    
+    return recommendations
+
+async def generate_data_driven_response(message: str, user_data: dict) -> str:
+    """Generate response using actual user data when AI is unavailable"""
+    lower_message = message.lower()
+    
+    # Use actual user data in responses
+    user_name = user_data.get("user_name", "User")
+    completion_rate = user_data.get("completion_rate", 0)
+    total_tasks = user_data.get("total_tasks", 0)
+    overdue_tasks = user_data.get("overdue_tasks", 0)
+    recent_tasks = user_data.get("recent_task_titles", [])
+    
+    if "performance" in lower_message or "how am i doing" in lower_message:
+        return f"""📊 **{user_name}'s Performance Analysis:**
+
+**Current Status:**
+• You have {total_tasks} total tasks with {completion_rate}% completion rate
+• {overdue_tasks} tasks are overdue and need immediate attention
+• Recent activity: {user_data.get('recent_activity', 0)} tasks this week
+
+**Your Recent Tasks:**
+{chr(10).join([f"• {task}" for task in recent_tasks[:3]])}
+
+**Focus Areas:**
+{chr(10).join([f"• {area}" for area in user_data.get('focus_areas', [])])}
+
+**Productivity Score:** {user_data.get('productivity_score', 5)}/10
+
+Based on your actual data, I recommend focusing on {"completing overdue tasks first" if overdue_tasks > 0 else "maintaining your current momentum"}."""
+    
+    return f"Based on your productivity data: {completion_rate}% completion rate, {total_tasks} tasks, I can provide specific insights. What would you like to know about your performance?"
+
+async def get_user_context_for_ai(user_id: str) -> dict:
+    """Get comprehensive user context for AI coaching"""
+    
+    # Get user's tasks
+    tasks = await db.tasks.find({"assigned_to": user_id}).to_list(1000)
+    
+    # Get user's projects
+    projects = await db.projects.find({
+        "$or": [
+            {"owner_id": user_id},
+            {"team_members": user_id}
+        ]
+    }).to_list(100)
+    
+    # Calculate performance metrics
+    completed_tasks = [t for t in tasks if t.get("status") == "completed"]
+    overdue_tasks = [t for t in tasks if t.get("status") == "overdue"]
+    in_progress_tasks = [t for t in tasks if t.get("status") == "in_progress"]
+    
+    # Eisenhower matrix distribution
+    eisenhower_distribution = {}
+    for quadrant in ["do", "decide", "delegate", "delete"]:
+        eisenhower_distribution[quadrant] = len([t for t in tasks if t.get("eisenhower_quadrant") == quadrant])
+    
+    # Recent activity pattern
+    recent_tasks = [t for t in tasks if (datetime.utcnow() - t.get("created_at", datetime.utcnow())).days <= 7]
+    
+    return {
+        "total_tasks": len(tasks),
+        "completed_tasks": len(completed_tasks),
+        "overdue_tasks": len(overdue_tasks),
+        "in_progress_tasks": len(in_progress_tasks),
+        "active_projects": len([p for p in projects if p.get("status") == "active"]),
+        "completion_rate": (len(completed_tasks) / len(tasks) * 100) if tasks else 0,
+        "eisenhower_distribution": eisenhower_distribution,
+        "recent_activity": len(recent_tasks),
+        "productivity_trend": "improving" if len(completed_tasks) > len(overdue_tasks) else "needs_attention"
+    }
+
+async def generate_ai_coaching_response(message: str, user: User, context: dict, provider: str, ai_settings: dict) -> str:
+    """Generate AI coaching response using specified provider"""
+    
+    # Create comprehensive prompt with user context
+    system_prompt = f"""You are an expert productivity coach helping {user.name} optimize their work performance. 
+
+CURRENT USER CONTEXT:
+- Total tasks: {context['total_tasks']}
+- Completion rate: {context['completion_rate']:.1f}%
+- Overdue tasks: {context['overdue_tasks']}
+- Active projects: {context['active_projects']}
+- Recent activity: {context['recent_activity']} tasks this week
+- Productivity trend: {context['productivity_trend']}
+
+EISENHOWER MATRIX DISTRIBUTION:
+- Do First (Urgent & Important): {context['eisenhower_distribution'].get('do', 0)}
+- Schedule (Important, Not Urgent): {context['eisenhower_distribution'].get('decide', 0)}
+- Delegate (Urgent, Not Important): {context['eisenhower_distribution'].get('delegate', 0)}
+- Don't Do (Neither Urgent nor Important): {context['eisenhower_distribution'].get('delete', 0)}
+
+Provide personalized, actionable productivity coaching based on their actual data. Be specific, encouraging, and offer concrete next steps."""
+
+    user_prompt = f"User Question: {message}\n\nPlease provide coaching advice based on my current productivity metrics."
+
+    try:
+        if provider == "openai" and (ai_settings and ai_settings.get("openai_api_key") or os.environ.get('OPENAI_API_KEY')):
+            # Use OpenAI
+            api_key = ai_settings.get("openai_api_key") if ai_settings else os.environ.get('OPENAI_API_KEY')
+            
+            from openai import OpenAI
+            client = OpenAI(api_key=api_key)
+            
+            response = client.chat.completions.create(
+                model="gpt-4",
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                max_tokens=1000,
+                temperature=0.7
+            )
+            
+            return response.choices[0].message.content
+            
+        elif provider == "claude" and ai_settings and ai_settings.get("claude_api_key"):
+            # Use Claude
+            import anthropic
+            client = anthropic.Anthropic(api_key=ai_settings["claude_api_key"])
+            
+            response = client.messages.create(
+                model="claude-3-sonnet-20240229",
+                max_tokens=1000,
+                messages=[
+                    {"role": "user", "content": f"{system_prompt}\n\n{user_prompt}"}
+                ]
+            )
+            
+            return response.content[0].text
+            
+        elif provider == "gemini" and ai_settings and ai_settings.get("gemini_api_key"):
+            # Use Gemini
+            import google.generativeai as genai
+            genai.configure(api_key=ai_settings["gemini_api_key"])
+            model = genai.GenerativeModel('gemini-pro')
+            
+            response = model.generate_content(f"{system_prompt}\n\n{user_prompt}")
+            return response.text
+            
+        else:
+            # Fallback to enhanced local coaching
+            return await generate_enhanced_coaching_response(message, user, context)
+            
+    except Exception as e:
+        logger.error(f"AI provider {provider} failed: {str(e)}")
+        return await generate_enhanced_coaching_response(message, user, context)
+
+
+# AI Coach Slash Commands
+@router.post("/ai-coach/command")
+async def ai_command(request: dict):
+    """AI Command endpoint - accessible without authentication for demo"""
+    command = request.get("command", "").lower().strip()
+    
+    try:
+        if command == "/help":
+            return await handle_help_command()
+        else:
+            return {
+                "response": f"Demo mode: Command `{command}` received. In full version, this would provide detailed analysis. For now, type `/help` to see available commands.",
+                "command": command,
+                "timestamp": datetime.utcnow()
+            }
+            
+    except Exception as e:
+        logger.error(f"Command error: {str(e)}")
+        return {
+            "response": "Sorry, I encountered an error processing your command. Please try again.",
+            "error": str(e),
+            "timestamp": datetime.utcnow()
+        }
+
+async def handle_analyze_command(user: User, context: dict):
+    """Deep productivity analysis"""
+    
+    # Get recent tasks for pattern analysis
+    recent_tasks = await db.tasks.find({
+        "assigned_to": user.id,
+        "created_at": {"$gte": datetime.utcnow() - timedelta(days=30)}
+    }).to_list(1000)
+    
+    # Analyze task patterns
+    patterns = {
+        "peak_day": "Monday",  # Simplified for demo
+        "peak_count": 5,
+        "peak_hour": "9",
+        "avg_completion_time": "2.5",
+        "complexity_trend": "Increasing"
+    }
+    
+    response = f"🔍 **Deep Productivity Analysis for {user.name.split()[0]}**\n\n"
+    response += f"**📊 Performance Metrics (Last 30 Days):**\n"
+    response += f"• Tasks completed: {context['completed_tasks']}\n"
+    response += f"• Completion rate: {context['completion_rate']:.1f}%\n"
+    response += f"• Average daily tasks: {len(recent_tasks)/30:.1f}\n"
+    response += f"• Overdue rate: {(context['overdue_tasks']/max(context['total_tasks'], 1)*100):.1f}%\n\n"
+    
+    response += f"**🎯 Task Distribution Analysis:**\n"
+    for quadrant, count in context['eisenhower_distribution'].items():
+        percentage = (count / max(context['total_tasks'], 1)) * 100
+        response += f"• {quadrant.title()}: {count} tasks ({percentage:.1f}%)\n"
+    
+    response += f"\n**📈 Productivity Patterns:**\n"
+    response += f"• Peak activity: {patterns['peak_day']} with {patterns['peak_count']} tasks\n"
+    response += f"• Most productive time: {patterns['peak_hour']}:00\n"
+    response += f"• Average task completion time: {patterns['avg_completion_time']} days\n"
+    response += f"• Task complexity trend: {patterns['complexity_trend']}\n\n"
+    
+    response += f"**💡 Key Insights:**\n"
+    if context['completion_rate'] > 85:
+        response += "• Excellent execution - you're in the top 10% of performers!\n"
+    elif context['completion_rate'] > 70:
+        response += "• Good performance with room for optimization\n"
+    else:
+        response += "• Focus needed on task completion and follow-through\n"
+        
+    if context['eisenhower_distribution'].get('do', 0) > context['total_tasks'] * 0.3:
+        response += "• High urgency pattern detected - focus on prevention\n"
+    else:
+        response += "• Good balance between urgent and important tasks\n"
+        
+    response += f"\n**🎯 Recommended Actions:**\n"
+    response += "1. Focus on completing existing tasks before adding new ones\n"
+    response += "2. Implement daily task review at 5 PM\n"
+    response += "3. Set up weekly planning sessions every Friday\n"
+    
+    return {
+        "response": response,
+        "command": "/analyze",
+        "data": {"context": context, "patterns": patterns},
+        "timestamp": datetime.utcnow()
+    }
+
+async def handle_optimize_command(user: User, context: dict):
+    """Task optimization recommendations"""
+    
+    # Get current tasks
+    current_tasks = await db.tasks.find({
+        "assigned_to": user.id,
+        "status": {"$ne": "completed"}
+    }).to_list(1000)
+    
+    # Create optimization plan
+    optimization_plan = {
+        "prioritized_tasks": [
+            {"title": "High priority task 1", "priority_score": 9.5, "urgency": "high"},
+            {"title": "Medium priority task", "priority_score": 7.0, "urgency": "medium"},
+            {"title": "Low priority task", "priority_score": 4.0, "urgency": "low"}
+        ],
+        "recommended_capacity": 8,
+        "time_blocks": {
+            "morning": "High-priority creative work",
+            "midday": "Meetings and collaboration",
+            "afternoon": "Admin tasks and planning"
+        },
+        "quick_wins": [
+            "Review and organize task list",
+            "Complete 2-minute tasks immediately",
+            "Set up tomorrow's top 3 priorities",
+            "Clear email inbox",
+            "Update project status"
+        ],
+        "focus_area": "Task completion and follow-through"
+    }
+    
+    response = f"⚡ **Task Optimization Plan for {user.name.split()[0]}**\n\n"
+    response += f"**🎯 Current Workload:**\n"
+    response += f"• Active tasks: {len(current_tasks)}\n"
+    response += f"• Overdue tasks: {context['overdue_tasks']}\n"
+    response += f"• This week's capacity: {optimization_plan['recommended_capacity']} tasks\n\n"
+    
+    response += f"**📋 Optimized Task Priority:**\n"
+    for i, task in enumerate(optimization_plan['prioritized_tasks'][:10], 1):
+        urgency_emoji = "🔥" if task['urgency'] == "high" else "⚡" if task['urgency'] == "medium" else "📝"
+        response += f"{i}. {urgency_emoji} {task['title']} (Score: {task['priority_score']:.1f})\n"
+    
+    response += f"\n**⏰ Time Blocking Suggestion:**\n"
+    response += f"• Morning (9-11 AM): {optimization_plan['time_blocks']['morning']}\n"
+    response += f"• Midday (11 AM-2 PM): {optimization_plan['time_blocks']['midday']}\n"
+    response += f"• Afternoon (2-5 PM): {optimization_plan['time_blocks']['afternoon']}\n\n"
+    
+    response += f"**🚀 Quick Wins (Complete Today):**\n"
+    for i, quick_win in enumerate(optimization_plan['quick_wins'][:5], 1):
+        response += f"{i}. {quick_win}\n"
+    
+    response += f"\n**💡 Optimization Tips:**\n"
+    response += f"• Focus on {optimization_plan['focus_area']} this week\n"
+    response += f"• Batch similar tasks together\n"
+    response += f"• Use 25-minute focused work blocks\n"
+    response += f"• Review and adjust daily at 5 PM\n"
+    
+    return {
+        "response": response,
+        "command": "/optimize",
+        "data": optimization_plan,
+        "timestamp": datetime.utcnow()
+    }
+
+async def handle_goals_command(user: User, context: dict):
+    """Smart goal setting based on current performance"""
+    
+    goals = {
+        "performance_goals": [
+            {
+                "title": "Improve Task Completion Rate",
+                "target": f"{min(95, context['completion_rate'] + 15):.0f}%",
+                "current": f"{context['completion_rate']:.1f}%",
+                "timeline": "30 days",
+                "action": "Complete 1 additional task per day consistently"
+            },
+            {
+                "title": "Reduce Overdue Tasks",
+                "target": "0 overdue tasks",
+                "current": f"{context['overdue_tasks']} overdue",
+                "timeline": "14 days",
+                "action": "Daily triage and prioritization review"
+            }
+        ],
+        "weekly_milestones": [
+            f"Achieve {min(100, context['completion_rate'] + 5):.0f}% completion rate",
+            "Complete all overdue tasks",
+            f"Maintain {min(95, context['completion_rate'] + 15):.0f}% rate for full week",
+            "Establish sustainable daily routine"
+        ],
+        "success_metrics": [
+            "Daily task completion tracking",
+            "Weekly performance review",
+            "Monthly goal assessment",
+            "Quarterly productivity audit"
+        ],
+        "rewards": {
+            "daily": "15-minute break for favorite activity",
+            "weekly": "Special meal or entertainment",
+            "final": "Day off or significant personal reward"
+        }
+    }
+    
+    response = f"🎯 **SMART Goals for {user.name.split()[0]}**\n\n"
+    response += f"**Based on your current performance:**\n"
+    response += f"• Completion rate: {context['completion_rate']:.1f}%\n"
+    response += f"• Weekly velocity: {context['recent_activity']} tasks\n"
+    response += f"• Current trajectory: {context['productivity_trend'].replace('_', ' ').title()}\n\n"
+    
+    response += f"**📈 30-Day Performance Goals:**\n\n"
+    
+    for i, goal in enumerate(goals['performance_goals'], 1):
+        response += f"**Goal {i}: {goal['title']}**\n"
+        response += f"• Target: {goal['target']}\n"
+        response += f"• Current: {goal['current']}\n"
+        response += f"• Timeline: {goal['timeline']}\n"
+        response += f"• Action: {goal['action']}\n\n"
+    
+    response += f"**🏆 Weekly Milestones:**\n"
+    for week, milestone in enumerate(goals['weekly_milestones'], 1):
+        response += f"• Week {week}: {milestone}\n"
+    
+    response += f"\n**📊 Success Metrics:**\n"
+    for metric in goals['success_metrics']:
+        response += f"• {metric}\n"
+    
+    response += f"\n**🎉 Reward System:**\n"
+    response += f"• Daily win: {goals['rewards']['daily']}\n"
+    response += f"• Weekly achievement: {goals['rewards']['weekly']}\n"
+    response += f"• Goal completion: {goals['rewards']['final']}\n"
+    
+    return {
+        "response": response,
+        "command": "/goals",
+        "data": goals,
+        "timestamp": datetime.utcnow()
+    }
+
+async def handle_habits_command(user: User, context: dict):
+    """Habit formation recommendations"""
+    
+    habits = {
+        "consistency_score": min(10, context['completion_rate'] / 10),
+        "planning_score": 7.0,  # Simplified for demo
+        "focus_score": 6.5,
+        "recommended_habits": [
+            {
+                "name": "Daily Task Planning",
+                "trigger": "First coffee of the day",
+                "action": "Write down top 3 priorities",
+                "reward": "Check social media for 5 minutes",
+                "start_date": "Tomorrow",
+                "difficulty": 3
+            },
+            {
+                "name": "Task Completion Celebration",
+                "trigger": "Completing any task",
+                "action": "Cross it off and say 'Done!'",
+                "reward": "Feel satisfaction and momentum",
+                "start_date": "Today",
+                "difficulty": 2
+            }
+        ],
+        "implementation_schedule": [
+            "Focus on daily planning habit",
+            "Add completion celebration",
+            "Integrate weekly review",
+            "Establish energy management"
+        ],
+        "tracking_methods": [
+            "Simple daily checklist",
+            "Weekly habit review",
+            "Monthly progress assessment",
+            "Quarterly habit optimization"
+        ]
+    }
+    
+    response = f"🌱 **Productivity Habits for {user.name.split()[0]}**\n\n"
+    response += f"**Current Habits Assessment:**\n"
+    response += f"• Task completion consistency: {habits['consistency_score']:.1f}/10\n"
+    response += f"• Weekly planning: {habits['planning_score']:.1f}/10\n"
+    response += f"• Focus maintenance: {habits['focus_score']:.1f}/10\n\n"
+    
+    response += f"**🎯 Recommended Habit Stack:**\n\n"
+    
+    for i, habit in enumerate(habits['recommended_habits'], 1):
+        response += f"**Habit {i}: {habit['name']}**\n"
+        response += f"• Trigger: {habit['trigger']}\n"
+        response += f"• Action: {habit['action']}\n"
+        response += f"• Reward: {habit['reward']}\n"
+        response += f"• Start date: {habit['start_date']}\n"
+        response += f"• Difficulty: {habit['difficulty']}/10\n\n"
+    
+    response += f"**📅 Implementation Schedule:**\n"
+    for week, focus in enumerate(habits['implementation_schedule'], 1):
+        response += f"• Week {week}: {focus}\n"
+    
+    response += f"\n**📈 Habit Tracking:**\n"
+    for tracker in habits['tracking_methods']:
+        response += f"• {tracker}\n"
+    
+    response += f"\n**💡 Success Tips:**\n"
+    response += f"• Start with just one habit at a time\n"
+    response += f"• Track daily for the first 30 days\n"
+    response += f"• Link new habits to existing routines\n"
+    response += f"• Celebrate small wins consistently\n"
+    
+    return {
+        "response": response,
+        "command": "/habits",
+        "data": habits,
+        "timestamp": datetime.utcnow()
+    }
+
+async def handle_report_command(user: User, context: dict):
+    """Generate comprehensive productivity report"""
+    
+    # Get historical data for trends
+    historical_data = {
+        "avg_completion_rate": 75.0,
+        "trend": "improving",
+        "best_day": "Tuesday",
+        "worst_day": "Monday"
+    }
+    
+    report = {
+        "productivity_score": min(10, (context['completion_rate'] / 10) + (5 if context['overdue_tasks'] == 0 else 3)),
+        "trend": "improving" if context['productivity_trend'] == "improving" else "stable",
+        "trend_percentage": 12.5,  # Simplified for demo
+        "top_strength": "Task execution" if context['completion_rate'] > 80 else "Planning",
+        "improvement_area": "Time management" if context['overdue_tasks'] > 0 else "Task prioritization",
+        "historical_avg": historical_data.get('avg_completion_rate', 70),
+        "industry_benchmark": 78.0,
+        "efficiency_score": min(10, context['completion_rate'] / 10),
+        "time_management_score": 8.5 if context['overdue_tasks'] == 0 else 6.0,
+        "work_style": "Executor" if context['completion_rate'] > 80 else "Planner",
+        "peak_hours": "9-11 AM",
+        "complexity_preference": "Moderate",
+        "collaboration_level": "High" if context.get('active_projects', 0) > 2 else "Moderate",
+        "weekly_breakdown": {
+            "Monday": {"completed": 3, "avg_duration": 2.5},
+            "Tuesday": {"completed": 4, "avg_duration": 2.0},
+            "Wednesday": {"completed": 3, "avg_duration": 2.8},
+            "Thursday": {"completed": 4, "avg_duration": 2.2},
+            "Friday": {"completed": 2, "avg_duration": 1.5}
+        },
+        "action_items": [
+            "Complete overdue tasks first" if context['overdue_tasks'] > 0 else "Maintain current performance",
+            "Implement daily planning routine",
+            "Set up weekly review process",
+            "Optimize peak productivity hours"
+        ],
+        "most_productive_day": "Tuesday",
+        "avg_task_duration": 2.4,
+        "procrastination_index": 3.0 if context['overdue_tasks'] == 0 else 6.5,
+        "stress_level": 4 if context['overdue_tasks'] <= 2 else 7
+    }
+    
+    response = f"📊 **Productivity Report for {user.name.split()[0]}**\n"
+    response += f"*Generated on {datetime.utcnow().strftime('%B %d, %Y')}*\n\n"
+    
+    response += f"**🎯 Executive Summary:**\n"
+    response += f"• Overall productivity score: {report['productivity_score']:.1f}/10\n"
+    response += f"• Performance trend: {report['trend']} ({report['trend_percentage']:+.1f}%)\n"
+    response += f"• Key strength: {report['top_strength']}\n"
+    response += f"• Improvement area: {report['improvement_area']}\n\n"
+    
+    response += f"**📈 Performance Metrics:**\n"
+    response += f"• Tasks completed: {context['completed_tasks']} (vs {report['historical_avg']:.1f} avg)\n"
+    response += f"• Completion rate: {context['completion_rate']:.1f}% (vs {report['industry_benchmark']:.1f}% benchmark)\n"
+    response += f"• Efficiency score: {report['efficiency_score']:.1f}/10\n"
+    response += f"• Time management: {report['time_management_score']:.1f}/10\n\n"
+    
+    response += f"**🎭 Work Style Analysis:**\n"
+    response += f"• Primary work style: {report['work_style']}\n"
+    response += f"• Peak productivity hours: {report['peak_hours']}\n"
+    response += f"• Task complexity preference: {report['complexity_preference']}\n"
+    response += f"• Collaboration level: {report['collaboration_level']}\n\n"
+    
+    response += f"**📅 Weekly Breakdown:**\n"
+    for day, stats in report['weekly_breakdown'].items():
+        response += f"• {day}: {stats['completed']} completed, {stats['avg_duration']:.1f}h avg\n"
+    
+    response += f"\n**🚀 Action Items for Next Week:**\n"
+    for i, action in enumerate(report['action_items'], 1):
+        response += f"{i}. {action}\n"
+    
+    response += f"\n**📊 Detailed Analytics:**\n"
+    response += f"• Most productive day: {report['most_productive_day']}\n"
+    response += f"• Average task duration: {report['avg_task_duration']} hours\n"
+    response += f"• Procrastination index: {report['procrastination_index']:.1f}/10\n"
+    response += f"• Stress level indicator: {report['stress_level']}/10\n"
+    
+    return {
+        "response": response,
+        "command": "/report",
+        "data": report,
+        "timestamp": datetime.utcnow()
+    }
+
+async def handle_help_command():
+    """Show available AI Coach commands"""
+    
+    response = """🤖 **AI Productivity Coach - Command Guide**
+
+**Available Commands:**
+
+🔍 `/analyze` - Deep dive into your productivity patterns and performance metrics
+
+⚡ `/optimize` - Get a personalized task prioritization and time-blocking plan  
+
+🎯 `/goals` - Generate SMART goals based on your current performance data
+
+🌱 `/habits` - Receive productivity habit recommendations and implementation plans
+
+📊 `/report` - Generate comprehensive productivity report with trends and insights
+
+❓ `/help` - Show this command guide
+
+**Chat Examples:**
+• "How can I improve my productivity?"
+• "I'm feeling overwhelmed with my tasks"
+• "Help me prioritize my work"
+• "What are best practices for team collaboration?"
+
+**Pro Tips:**
+• Use commands for structured analysis
+• Ask specific questions for targeted advice
+• Reference your current tasks and projects for personalized guidance
+• Regular check-ins help build better productivity habits
+
+Start by typing a command or asking me any productivity question! 🚀"""
+
+    return {
+        "response": response,
+        "command": "/help",
+        "timestamp": datetime.utcnow()
+    }
+async def generate_enhanced_coaching_response(message: str, user: User, context: dict = None) -> str:
+    """Enhanced fallback coaching response with real user data"""
+    
+    if context is None:
+        context = await get_user_context_for_ai(user.id)
+    
+    lower_message = message.lower()
+    user_name = user.name.split()[0]  # First name
+    
+    # Personalized greeting with data
+    if any(word in lower_message for word in ['hello', 'hi', 'hey']):
+        return f"Hello {user_name}! 👋 I'm your AI Productivity Coach. \n\nI can see you have {context['total_tasks']} tasks with a {context['completion_rate']:.1f}% completion rate. Let's work together to optimize your productivity! \n\nI can help you with:\n• Task prioritization and optimization\n• Time management strategies\n• Goal setting and achievement\n• Performance analysis\n• Habit formation\n\nWhat would you like to focus on today?"
+    
+    # Data-driven overwhelm response
+    if any(word in lower_message for word in ['stuck', 'overwhelmed', 'help']):
+        insights = []
+        if context['overdue_tasks'] > 0:
+            insights.append(f"You have {context['overdue_tasks']} overdue tasks that need immediate attention")
+        if context['eisenhower_distribution'].get('do', 0) > context['total_tasks'] * 0.3:
+            insights.append("Too many urgent tasks - let's work on prevention strategies")
+        if context['completion_rate'] < 70:
+            insights.append("Your completion rate could be improved with better task breakdown")
+            
+        response = f"I understand you're feeling overwhelmed, {user_name}. Based on your data, here's my immediate action plan:\n\n"
+        
+        if insights:
+            response += "**Key Issues I Found:**\n"
+            for insight in insights:
+                response += f"• {insight}\n"
+            response += "\n"
+        
+        response += """**Immediate Relief Strategy:**
+1. **Focus on {do_tasks} urgent tasks first** - These need immediate attention
+2. **Break down large tasks** - Aim for 15-30 minute chunks
+3. **Use the 2-minute rule** - If it takes less than 2 minutes, do it now
+4. **Schedule {decide_tasks} important tasks** - Don't let them become urgent
+
+**Next Steps:**
+• Complete 1 overdue task right now
+• Block 25 minutes for focused work
+• Review and reschedule unrealistic deadlines
+
+Which of these strategies feels most helpful for your current situation?""".format(
+            do_tasks=context['eisenhower_distribution'].get('do', 0),
+            decide_tasks=context['eisenhower_distribution'].get('decide', 0)
+        )
+        
+        return response
+    
+    # Performance optimization with real data
+    if any(word in lower_message for word in ['productivity', 'improve', 'better', 'efficient']):
+        performance_insights = []
+        
+        if context['completion_rate'] > 80:
+            performance_insights.append("Excellent completion rate! You're already performing well.")
+        elif context['completion_rate'] > 60:
+            performance_insights.append("Good completion rate with room for optimization.")
+        else:
+            performance_insights.append("Completion rate needs attention - let's focus on this first.")
+            
+        if context['eisenhower_distribution'].get('delete', 0) > 0:
+            performance_insights.append(f"You have {context['eisenhower_distribution']['delete']} low-priority tasks to eliminate.")
+            
+        response = f"Great question, {user_name}! Based on your productivity data analysis:\n\n"
+        response += "📊 **Your Current Performance:**\n"
+        for insight in performance_insights:
+            response += f"• {insight}\n"
+        response += f"\n🎯 **Personalized Optimization Plan:**\n\n"
+        
+        if context['completion_rate'] < 70:
+            response += "**1. Completion Rate Boost:**\n• Break tasks into smaller, specific actions\n• Set realistic daily task limits (3-5 important tasks)\n• Use time-blocking for focused work\n\n"
+        
+        if context['eisenhower_distribution'].get('do', 0) > context['total_tasks'] * 0.3:
+            response += "**2. Reduce Urgency Addiction:**\n• Schedule important tasks before they become urgent\n• Build buffer time into deadlines\n• Focus on prevention vs. firefighting\n\n"
+        
+        response += f"**3. Energy Management:**\n• Schedule demanding tasks during peak energy hours\n• Batch similar tasks together\n• Take breaks every 90 minutes\n\n**Next Action:** Would you like me to analyze your specific task patterns and suggest a custom daily routine?"
+        
+        return response
+    
+    # Team performance insights
+    if any(word in lower_message for word in ['team', 'collaboration', 'meeting']):
+        return f"Team productivity insights for {user_name}:\n\n**🤝 Current Team Involvement:**\n• Active in {context['active_projects']} projects\n• Contributing to team success\n\n**📈 Team Optimization Strategies:**\n\n1. **Communication Excellence:**\n   - Async updates for non-urgent items\n   - Clear agenda for all meetings\n   - Document decisions and action items\n\n2. **Workload Distribution:**\n   - Regular capacity check-ins\n   - Cross-training to prevent bottlenecks\n   - Fair distribution of challenging work\n\n3. **Collaboration Tools:**\n   - Shared task visibility\n   - Clear ownership and deadlines\n   - Regular retrospectives\n\nWhich team challenge would you like specific help with?"
+    
+    # Goal setting with data context
+    if any(word in lower_message for word in ['goal', 'target', 'objective']):
+        return f"Goal setting guidance for {user_name} based on your current performance:\n\n**🎯 SMART+ Goals Framework:**\n\n**Current Baseline:**\n• Completion Rate: {context['completion_rate']:.1f}%\n• Weekly Activity: {context['recent_activity']} tasks\n• Active Projects: {context['active_projects']}\n\n**Recommended Goals:**\n• **Performance Goal:** Increase completion rate to {min(95, context['completion_rate'] + 15):.0f}% within 30 days\n• **Efficiency Goal:** Reduce overdue tasks from {context['overdue_tasks']} to 0 within 2 weeks\n• **Balance Goal:** Maintain 60% Important/Non-Urgent tasks in your matrix\n\n**Implementation Strategy:**\n✓ Weekly goal reviews every Friday\n✓ Track leading indicators (daily completed tasks)\n✓ Adjust targets based on realistic capacity\n✓ Celebrate milestone achievements\n\nWhich specific goal area would you like help structuring?"
+    
+    # Stress and burnout with personalized data
+    if any(word in lower_message for word in ['stress', 'burnout', 'tired', 'exhausted']):
+        workload_analysis = "high" if context['total_tasks'] > 20 else "moderate" if context['total_tasks'] > 10 else "manageable"
+        
+        return f"I understand you're feeling overwhelmed, {user_name}. Let me help you regain balance. 🌱\n\n**📊 Workload Analysis:**\n• Current load: {workload_analysis} ({context['total_tasks']} tasks)\n• Overdue pressure: {context['overdue_tasks']} tasks behind\n• Recent activity: {context['recent_activity']} tasks this week\n\n**🚨 Immediate Relief Plan:**\n\n1. **Take a break right now** - Even 5 minutes helps reset your mind\n2. **Triage ruthlessly:**\n   - Focus only on {context['eisenhower_distribution'].get('do', 0)} urgent tasks today\n   - Defer {context['eisenhower_distribution'].get('decide', 0)} important tasks to tomorrow\n   - Delegate or delete {context['eisenhower_distribution'].get('delegate', 0) + context['eisenhower_distribution'].get('delete', 0)} lower-priority items\n\n3. **Capacity reset:**\n   - Limit yourself to 3 important tasks per day\n   - Build 25% buffer time into estimates\n   - Say no to new commitments this week\n\n**🛡️ Prevention Strategy:**\n• Weekly workload review (Fridays)\n• Daily energy check-ins\n• Proactive boundary setting\n\nWhat's the ONE thing you can remove from your plate today to reduce pressure?"
+    
+    # Analysis and insights
+    if any(word in lower_message for word in ['analyze', 'analysis', 'insight', 'pattern']):
+        return f"📊 **Productivity Analysis for {user_name}**\n\n**Performance Snapshot:**\n• Overall completion rate: {context['completion_rate']:.1f}%\n• Task velocity: {context['recent_activity']} tasks/week\n• Project engagement: {context['active_projects']} active projects\n• Trend: {context['productivity_trend'].replace('_', ' ').title()}\n\n**🎯 Eisenhower Matrix Analysis:**\n• Do First: {context['eisenhower_distribution'].get('do', 0)} tasks ({context['eisenhower_distribution'].get('do', 0)/max(context['total_tasks'], 1)*100:.0f}%)\n• Schedule: {context['eisenhower_distribution'].get('decide', 0)} tasks ({context['eisenhower_distribution'].get('decide', 0)/max(context['total_tasks'], 1)*100:.0f}%)\n• Delegate: {context['eisenhower_distribution'].get('delegate', 0)} tasks ({context['eisenhower_distribution'].get('delegate', 0)/max(context['total_tasks'], 1)*100:.0f}%)\n• Eliminate: {context['eisenhower_distribution'].get('delete', 0)} tasks ({context['eisenhower_distribution'].get('delete', 0)/max(context['total_tasks'], 1)*100:.0f}%)\n\n**🔍 Key Insights:**\n• Optimal distribution: 20% Do, 60% Schedule, 15% Delegate, 5% Eliminate\n• Your pattern shows: {'Balanced approach' if context['eisenhower_distribution'].get('decide', 0) > context['eisenhower_distribution'].get('do', 0) else 'Too much urgency - focus on prevention'}\n\n**📈 Recommendations:**\n• {'Excellent balance! Maintain current approach.' if context['completion_rate'] > 80 else 'Focus on completing existing tasks before adding new ones.'}\n• {'Reduce urgent tasks by planning ahead' if context['eisenhower_distribution'].get('do', 0) > 5 else 'Good urgency management'}\n\nWould you like specific recommendations for any particular area?"
+    
+    # Default comprehensive response with data
+    return f"Thanks for reaching out, {user_name}! Based on your productivity data, here's my assessment:\n\n**📊 Current Status:**\n• {context['total_tasks']} total tasks with {context['completion_rate']:.1f}% completion rate\n• {context['overdue_tasks']} overdue tasks need attention\n• {context['active_projects']} active projects\n• Productivity trend: {context['productivity_trend'].replace('_', ' ')}\n\n**🎯 Key Productivity Principles:**\n• **Clarity** - Know exactly what needs to be done (Eisenhower Matrix)\n• **Focus** - Single-task with deep attention\n• **Energy Management** - Work with your natural rhythms\n• **Continuous Improvement** - Small, consistent optimizations\n\n**💡 Actionable Next Steps:**\n1. Complete {min(3, context['overdue_tasks'] or 1)} highest-priority tasks today\n2. Schedule important non-urgent work to prevent future urgency\n3. Work in focused 25-minute blocks with 5-minute breaks\n4. Track what works and iterate weekly\n\n**I can help you with:**\n• `/analyze` - Deep dive into your productivity patterns\n• `/optimize` - Custom task prioritization\n• `/goals` - SMART goal setting with your data\n• `/habits` - Build sustainable productivity habits\n\nWhat specific area would you like to focus on improving?"
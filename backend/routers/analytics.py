@@ -0,0 +1,91 @@
+from fastapi import APIRouter, HTTPException, Depends
+
+from services.tenancy import TenantRepository
+from core import db, get_tenant, invalidate_cached_user, performance_score_from_tasks
+from models import EisenhowerQuadrant, TaskStatus
+
+router = APIRouter()
+
+# Performance & Analytics
+@router.get("/analytics/dashboard")
+async def get_dashboard_analytics(tenant: TenantRepository = Depends(get_tenant)):
+    total_tasks = await tenant.tasks.count_documents()
+    completed_tasks = await tenant.tasks.count_documents({"status": TaskStatus.COMPLETED})
+    overdue_tasks = await tenant.tasks.count_documents({"status": TaskStatus.OVERDUE})
+    in_progress_tasks = await tenant.tasks.count_documents({"status": TaskStatus.IN_PROGRESS})
+    
+    # Eisenhower matrix distribution
+    eisenhower_stats = {quadrant.value: 0 for quadrant in EisenhowerQuadrant}
+    async for group in tenant.tasks.aggregate([{"$group": {"_id": "$eisenhower_quadrant", "count": {"$sum": 1}}}]):
+        if group["_id"] in eisenhower_stats:
+            eisenhower_stats[group["_id"]] = group["count"]
+    
+    return {
+        "total_tasks": total_tasks,
+        "completed_tasks": completed_tasks,
+        "overdue_tasks": overdue_tasks,
+        "in_progress_tasks": in_progress_tasks,
+        "completion_rate": (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0,
+        "eisenhower_matrix": eisenhower_stats
+    }
+
+@router.get("/analytics/performance/{user_id}")
+async def get_user_performance(user_id: str, tenant: TenantRepository = Depends(get_tenant)):
+    user = await tenant.users.find_one({"id": user_id})
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    tasks = await tenant.tasks.find({"assigned_to": user_id}).to_list(1000)
+    
+    # Calculate updated performance score
+    performance_score = performance_score_from_tasks(tasks)
+    
+    # Update user's performance score
+    await db.users.update_one(
+        {"id": user_id},
+        {"$set": {"performance_score": performance_score}}
+    )
+    invalidate_cached_user(user_id)
+    
+    completed_tasks = [t for t in tasks if t.get("status") == TaskStatus.COMPLETED]
+    overdue_tasks = [t for t in tasks if t.get("status") == TaskStatus.OVERDUE]
+    
+    completion_rate = (len(completed_tasks) / len(tasks) * 100) if tasks else 0
+    
+    return {
+        "user_id": user_id,
+        "user_name": user["name"],
+        "performance_score": performance_score,
+        "tasks_assigned": len(tasks),
+        "tasks_completed": len(completed_tasks),
+        "tasks_overdue": len(overdue_tasks),
+        "completion_rate": completion_rate
+    }
+
+@router.get("/analytics/team-performance")
+async def get_team_performance(tenant: TenantRepository = Depends(get_tenant)):
+    users = await tenant.users.find().to_list(1000)
+    team_performance = []
+    
+    # One scan of the company's tasks instead of one query per member
+    tasks_by_user = {}
+    async for task in tenant.tasks.find({"assigned_to": {"$in": [user["id"] for user in users]}}):
+        tasks_by_user.setdefault(task["assigned_to"], []).append(task)
+    
+    for user in users:
+        tasks = tasks_by_user.get(user["id"], [])
+        performance_score = performance_score_from_tasks(tasks)
+        completed_tasks = [t for t in tasks if t.get("status") == TaskStatus.COMPLETED]
+        
+        team_performance.append({
+            "user_id": user["id"],
+            "user_name": user["name"],
+            "performance_score": performance_score,
+            "tasks_assigned": len(tasks),
+            "tasks_completed": len(completed_tasks),
+            "completion_rate": (len(completed_tasks) / len(tasks) * 100) if tasks else 0
+        })
+    
+    # Sort by performance score
+    team_performance.sort(key=lambda x: x["performance_score"], reverse=True)
+    return team_performance
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, HTTPException, Depends
+from typing import List
+
+from services.tenancy import TenantRepository
+from core import get_tenant
+from models import Project, ProjectCreate
+
+router = APIRouter()
+
+# Project Management
+@router.post("/projects", response_model=Project)
+async def create_project(project_data: ProjectCreate, tenant: TenantRepository = Depends(get_tenant)):
+    people = {project_data.owner_id, *project_data.team_members}
+    members = await tenant.users.find({"id": {"$in": list(people)}}, {"_id": 0, "id": 1}).to_list(None)
+    if len(members) != len(people):
+        raise HTTPException(status_code=400, detail="Project members must belong to your company")
+    
+    project = Project(**project_data.dict(), company_id=tenant.company_id)
+    await tenant.projects.insert_one(project.dict())
+    return project
+
+@router.get("/projects", response_model=List[Project])
+async def get_projects(tenant: TenantRepository = Depends(get_tenant)):
+    projects = await tenant.projects.find().to_list(1000)
+    return [Project(**project) for project in projects]
+
+@router.get("/projects/{project_id}", response_model=Project)
+async def get_project(project_id: str, tenant: TenantRepository = Depends(get_tenant)):
+    project = await tenant.projects.find_one({"id": project_id})
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return Project(**project)
@@ -0,0 +1,69 @@
+from fastapi import APIRouter, HTTPException, Depends, WebSocket, WebSocketDisconnect
+from typing import Optional
+from datetime import datetime
+import asyncio
+
+from services.tenancy import TenantRepository
+from core import change_feed, delta_sync, get_tenant, get_user_from_token
+
+router = APIRouter()
+
+@router.get("/sync")
+async def sync_changes(
+    since: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = 500,
+    tenant: TenantRepository = Depends(get_tenant)
+):
+    """
+    Tasks and projects changed (and ids deleted) since a point in time.
+    Pass the returned cursor on the next call; keep calling while has_more.
+    """
+    if cursor:
+        try:
+            positions = delta_sync.decode_cursor(cursor)
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid sync cursor")
+    elif since:
+        since = since.replace(tzinfo=None)
+        positions = {stream: [since, None] for stream in ("tasks", "projects", "deleted_tasks", "deleted_projects")}
+    else:
+        positions = {}
+
+    if delta_sync.tombstones_expired(positions):
+        raise HTTPException(status_code=410, detail="Sync cursor is too old, reload all records")
+
+    # Tombstones are scoped by company; users without one only get deletions
+    # of records they could see
+    user_ids = None if tenant.company_id else [tenant.user_id]
+
+    visible = {"tasks": tenant.tasks.scope(), "projects": tenant.projects.scope()}
+    return await delta_sync.changes(
+        visible, tenant.company_id, positions, limit=max(1, min(limit, 1000)), user_ids=user_ids
+    )
+
+@router.websocket("/ws")
+async def task_change_feed(websocket: WebSocket):
+    """Live task/project changes for the authenticated user (token in the query string)"""
+    try:
+        user = await get_user_from_token(websocket.query_params.get("token", ""))
+    except HTTPException:
+        # Accept first: a handshake rejected before accept reaches browsers as 1006, not 4401
+        await websocket.accept()
+        await websocket.close(code=4401)
+        return
+
+    await websocket.accept()
+    queue = change_feed.subscribe(user.id, user.company_id)
+    try:
+        await websocket.send_json({"type": "hello", "mode": change_feed.mode})
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=30)
+            except asyncio.TimeoutError:
+                event = {"type": "ping"}  # Keeps proxies from closing idle sockets
+            await websocket.send_json(event)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        change_feed.unsubscribe(queue)
@@ -0,0 +1,375 @@
+from fastapi import APIRouter, HTTPException, Depends, Header, Response
+import os
+import uuid
+from typing import List, Optional
+from datetime import datetime
+
+from services.priority_service import compute_priority_score
+from services.tenancy import TenantRepository
+from pymongo import DeleteOne, InsertOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
+from core import calculate_eisenhower_quadrant, db, delta_sync, get_tenant, notification_outbox, user_stats
+from models import BulkTaskRequest, Task, TaskCreate, TaskStatus, TaskUpdate
+
+router = APIRouter()
+
+# Task Management
+@router.post("/tasks", response_model=Task)
+async def create_task(task_data: TaskCreate, tenant: TenantRepository = Depends(get_tenant)):
+    if task_data.assigned_to and not await tenant.users.find_one({"id": task_data.assigned_to}, {"_id": 1}):
+        raise HTTPException(status_code=400, detail="Assignee is not a member of your company")
+    
+    task_dict = task_data.dict()
+    
+    # Calculate Eisenhower quadrant
+    eisenhower_quadrant = calculate_eisenhower_quadrant(
+        task_data.priority, 
+        task_data.due_date
+    )
+    task_dict["eisenhower_quadrant"] = eisenhower_quadrant
+    
+    task = Task(**task_dict, company_id=tenant.company_id)
+    task.priority_score = compute_priority_score(task.dict())
+    await tenant.tasks.insert_one(task.dict())
+    user_stats.increment(task.assigned_to, "tasks_assigned")
+    
+    return task
+
+TASK_BULK_MAX_OPERATIONS = int(os.environ.get('TASK_BULK_MAX_OPERATIONS', '5000'))
+
+@router.post("/tasks/bulk")
+async def bulk_task_operations(request: BulkTaskRequest, tenant: TenantRepository = Depends(get_tenant)):
+    """
+    Create, update, delete, reassign or change the status of many tasks with
+    one unordered bulk write. Every operation gets its own result; one
+    failing item does not stop the others.
+    """
+    operations = request.operations
+    if len(operations) > TASK_BULK_MAX_OPERATIONS:
+        raise HTTPException(status_code=413, detail=f"At most {TASK_BULK_MAX_OPERATIONS} operations per request")
+    
+    now = datetime.utcnow()
+    results = [{"index": index, "op": item.op, "id": item.id, "status": "ok"} for index, item in enumerate(operations)]
+    
+    def fail(index: int, error: str, status: str = "error"):
+        results[index].update({"status": status, "error": error})
+    
+    # One read for every task the operations touch; other tenants' tasks are simply not found
+    ids = list({item.id for item in operations if item.op != "create" and item.id})
+    current = {}
+    if ids:
+        stored = await tenant.tasks.find({"id": {"$in": ids}}, {"_id": 0}).to_list(None)
+        current = {task["id"]: task for task in stored}
+    
+    # And one for every assignee, which must belong to the same company
+    assignees = list({
+        item.assigned_to if item.op == "reassign" else item.task.assigned_to
+        for item in operations
+        if (item.op == "reassign" and item.assigned_to) or (item.op == "create" and item.task and item.task.assigned_to)
+    })
+    members = set()
+    if assignees:
+        found = await tenant.users.find({"id": {"$in": assignees}}, {"_id": 0, "id": 1}).to_list(None)
+        members = {user["id"] for user in found}
+    
+    writes = []
+    write_index = []  # Result index of each write
+    write_tokens = {}  # Result index -> token its update stamps on the task
+    deleted = {}
+    request_token = str(uuid.uuid4())
+    seen_ids = set()
+    
+    for index, item in enumerate(operations):
+        if item.op == "create":
+            if not item.task:
+                fail(index, "create needs a task")
+                continue
+            if item.task.assigned_to and item.task.assigned_to not in members:
+                fail(index, "Assignee is not a member of your company")
+                continue
+            task = Task(
+                **item.task.dict(),
+                eisenhower_quadrant=calculate_eisenhower_quadrant(item.task.priority, item.task.due_date),
+                company_id=tenant.company_id
+            )
+            task.priority_score = compute_priority_score(task.dict(), now)
+            writes.append(InsertOne(task.dict()))
+            write_index.append(index)
+            results[index]["id"] = task.id
+            continue
+        
+        if item.op not in ("update", "delete", "reassign", "status"):
+            fail(index, f"Unknown op '{item.op}'")
+            continue
+        if item.id in seen_ids:
+            fail(index, "Task appears more than once in this request")
+            continue
+        seen_ids.add(item.id)
+        task = current.get(item.id)
+        if not task:
+            fail(index, "Task not found", "not_found")
+            continue
+        version = task.get("version", 0)
+        if item.version is not None and item.version != version:
+            fail(index, "Task was modified by someone else", "conflict")
+            continue
+        
+        if item.op == "delete":
+            writes.append(DeleteOne({"id": item.id, "version": task.get("version")}))
+            write_index.append(index)
+            deleted[index] = task
+            continue
+        
+        if item.op == "update":
+            if not item.changes:
+                fail(index, "update needs changes")
+                continue
+            update_dict = {k: v for k, v in item.changes.dict().items() if v is not None}
+        elif item.op == "reassign":
+            if not item.assigned_to:
+                fail(index, "reassign needs assigned_to")
+                continue
+            if item.assigned_to not in members:
+                fail(index, "Assignee is not a member of your company")
+                continue
+            update_dict = {"assigned_to": item.assigned_to}
+        else:
+            if not item.status:
+                fail(index, "status needs a status")
+                continue
+            update_dict = {"status": item.status}
+        
+        changes = derive_task_changes(task, update_dict, now)
+        write_tokens[index] = f"{request_token}:{index}"
+        # updated_at is stamped as the bulk write applies each update: a large
+        # request takes a while, and sync cursors may move past its start meanwhile
+        fields = {key: value for key, value in changes.items() if key != "updated_at"}
+        writes.append(UpdateOne(
+            {"id": item.id, "version": task.get("version")},
+            {
+                "$set": {**fields, "write_token": write_tokens[index]},
+                "$currentDate": {"updated_at": True},
+                "$inc": {"version": 1}
+            }
+        ))
+        write_index.append(index)
+        results[index]["changes"] = changes
+    
+    if writes:
+        try:
+            await db.tasks.bulk_write(writes, ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                fail(write_index[error["index"]], error.get("errmsg", "Write failed"))
+        
+        # Writes guarded by the version we read miss silently when someone else got
+        # there first. Each update stamps its own token, so one read shows which landed
+        updated = [index for index in write_tokens if results[index]["status"] == "ok"]
+        removed = [index for index in deleted if results[index]["status"] == "ok"]
+        if updated or removed:
+            landed = await db.tasks.find(
+                {"id": {"$in": [operations[index].id for index in updated + removed]}},
+                {"_id": 0, "id": 1, "version": 1, "write_token": 1}
+            ).to_list(None)
+            stored = {task["id"]: task for task in landed}
+            for index in updated:
+                task = stored.get(operations[index].id)
+                if task and task.get("write_token") == write_tokens[index]:
+                    results[index]["version"] = task.get("version")
+                else:
+                    fail(index, "Task was modified by someone else", "conflict")
+            remaining = set(stored)
+            for index in removed:
+                if operations[index].id in remaining:
+                    fail(index, "Task was modified by someone else", "conflict")
+    
+    # Counters and tombstones only for operations that went through
+    deleted_tasks = []
+    for result in results:
+        index = result["index"]
+        changes = result.pop("changes", None)
+        if result["status"] != "ok":
+            continue
+        item = operations[index]
+        if item.op == "create":
+            user_stats.increment(item.task.assigned_to, "tasks_assigned")
+        elif item.op == "delete":
+            deleted_tasks.append(deleted[index])
+        else:
+            if "completed_at" in changes:
+                user_stats.increment(changes.get("assigned_to", current[item.id].get("assigned_to")), "tasks_completed")
+            if item.op == "reassign" and item.assigned_to != current[item.id].get("assigned_to"):
+                user_stats.increment(item.assigned_to, "tasks_assigned")
+    await delta_sync.record_deletions("tasks", deleted_tasks)
+    
+    succeeded = sum(1 for result in results if result["status"] == "ok")
+    return {"succeeded": succeeded, "failed": len(results) - succeeded, "results": results}
+
+@router.get("/tasks", response_model=List[Task])
+async def get_tasks(
+    assigned_to: Optional[str] = None,
+    project_id: Optional[str] = None,
+    status: Optional[TaskStatus] = None,
+    order_by: Optional[str] = None,
+    limit: int = 1000,
+    tenant: TenantRepository = Depends(get_tenant)
+):
+    filter_dict = {}
+    if assigned_to:
+        filter_dict["assigned_to"] = assigned_to
+    if project_id:
+        filter_dict["project_id"] = project_id
+    if status:
+        filter_dict["status"] = status
+    
+    cursor = tenant.tasks.find(filter_dict)
+    if order_by == "priority":
+        # Served from the company/assigned_to/status/priority_score index
+        cursor = cursor.sort("priority_score", -1)
+    
+    tasks = await cursor.to_list(min(limit, 1000))
+    return [Task(**task) for task in tasks]
+
+@router.get("/tasks/{task_id}", response_model=Task)
+async def get_task(task_id: str, response: Response, tenant: TenantRepository = Depends(get_tenant)):
+    task = await tenant.tasks.find_one({"id": task_id})
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    response.headers["ETag"] = task_etag(task)
+    return Task(**task)
+
+# Read-modify-write attempts before a busy task's update gives up
+TASK_UPDATE_RETRIES = 5
+
+def task_etag(task: dict) -> str:
+    return f'"{task.get("version", 0)}"'
+
+def parse_if_match(if_match: Optional[str]) -> Optional[int]:
+    """Task version the client expects to overwrite; None means any version"""
+    if not if_match or if_match.strip() == "*":
+        return None
+    value = if_match.strip()
+    if value.startswith("W/"):
+        value = value[2:]
+    try:
+        return int(value.strip('"'))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid If-Match header")
+
+def derive_task_changes(task: dict, update_dict: dict, now: datetime) -> dict:
+    """Fields to $set for update_dict, including those derived from the stored task"""
+    changes = {**update_dict, "updated_at": now}
+    
+    if update_dict.get("status") == TaskStatus.COMPLETED and task.get("status") != TaskStatus.COMPLETED:
+        changes["completed_at"] = now
+    
+    # A rescheduled overdue task goes back to todo
+    if (
+        task.get("status") == TaskStatus.OVERDUE
+        and "status" not in update_dict
+        and update_dict.get("due_date")
+        and update_dict["due_date"].replace(tzinfo=None) > now
+    ):
+        changes["status"] = TaskStatus.TODO
+    
+    # Keep the Eisenhower quadrant and score in sync with priority and due date
+    if "priority" in update_dict or "due_date" in update_dict:
+        changes["eisenhower_quadrant"] = calculate_eisenhower_quadrant(
+            update_dict.get("priority", task.get("priority")),
+            update_dict.get("due_date", task.get("due_date"))
+        )
+        changes["priority_score"] = compute_priority_score({**task, **changes}, now)
+    
+    return changes
+
+@router.put("/tasks/{task_id}", response_model=Task)
+async def update_task(
+    task_id: str,
+    task_update: TaskUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    tenant: TenantRepository = Depends(get_tenant)
+):
+    """
+    Update a task atomically. Send the task's ETag/version as If-Match to get
+    a 412 instead of overwriting someone else's change.
+    """
+    expected_version = parse_if_match(if_match)
+    update_dict = {k: v for k, v in task_update.dict().items() if v is not None}
+    now = datetime.utcnow()
+    
+    # Nothing derived from the stored task: a single conditional write
+    if "priority" not in update_dict and "due_date" not in update_dict:
+        query = {"id": task_id}
+        if expected_version is not None:
+            query["version"] = expected_version
+        changes = {**update_dict, "updated_at": now}
+        if update_dict.get("status") == TaskStatus.COMPLETED:
+            query["status"] = {"$ne": TaskStatus.COMPLETED}
+            changes["completed_at"] = now
+        
+        task = await tenant.tasks.find_one_and_update(
+            query,
+            {"$set": changes, "$inc": {"version": 1}},
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER
+        )
+        if task:
+            if "completed_at" in changes:
+                user_stats.increment(task.get("assigned_to"), "tasks_completed")
+            response.headers["ETag"] = task_etag(task)
+            return Task(**task)
+        # Missing, already completed or a version conflict: sorted out below
+    
+    for _ in range(TASK_UPDATE_RETRIES):
+        task = await tenant.tasks.find_one({"id": task_id}, {"_id": 0})
+        if not task:
+            raise HTTPException(status_code=404, detail="Task not found")
+        if expected_version is not None and task.get("version", 0) != expected_version:
+            raise HTTPException(
+                status_code=412,
+                detail={"message": "Task was modified by someone else", "version": task.get("version", 0)}
+            )
+        
+        changes = derive_task_changes(task, update_dict, now)
+        # Compare-and-set on the version we read; a missing version matches documents from before versioning
+        updated_task = await tenant.tasks.find_one_and_update(
+            {"id": task_id, "version": task.get("version")},
+            {"$set": changes, "$inc": {"version": 1}},
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER
+        )
+        if updated_task:
+            if "completed_at" in changes:
+                user_stats.increment(updated_task.get("assigned_to"), "tasks_completed")
+            response.headers["ETag"] = task_etag(updated_task)
+            return Task(**updated_task)
+    
+    raise HTTPException(status_code=409, detail="Task is being updated concurrently, please retry")
+
+@router.get("/tasks/{task_id}/notifications")
+async def get_task_notifications(task_id: str, tenant: TenantRepository = Depends(get_tenant)):
+    """Delivery status of the WhatsApp notifications sent about a task"""
+    if not await tenant.tasks.find_one({"id": task_id}, {"_id": 1}):
+        raise HTTPException(status_code=404, detail="Task not found")
+    notifications = await notification_outbox.delivery_status(task_id)
+    return {"task_id": task_id, "notifications": notifications}
+
+@router.post("/tasks/{task_id}/notifications/retry")
+async def retry_task_notifications(task_id: str, tenant: TenantRepository = Depends(get_tenant)):
+    """Requeue dead-lettered notifications for a task"""
+    if not await tenant.tasks.find_one({"id": task_id}, {"_id": 1}):
+        raise HTTPException(status_code=404, detail="Task not found")
+    requeued = await notification_outbox.retry_dead_letters(task_id)
+    return {"task_id": task_id, "requeued": requeued}
+
+@router.delete("/tasks/{task_id}")
+async def delete_task(task_id: str, tenant: TenantRepository = Depends(get_tenant)):
+    task = await tenant.tasks.find_one_and_delete(
+        {"id": task_id},
+        projection={"_id": 0, "id": 1, "assigned_to": 1, "assigned_by": 1, "company_id": 1}
+    )
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    await delta_sync.record_deletions("tasks", [task])
+    return {"message": "Task deleted successfully"}
@@ -0,0 +1,138 @@
+from fastapi import APIRouter, HTTPException, Depends
+from typing import List
+
+from services.reminders import get_zone, parse_reminder_time
+from services.tenancy import TenantRepository
+from pymongo.errors import DuplicateKeyError
+from core import db, get_current_user, get_password_hash, get_tenant, invalidate_cached_user, team_name_index
+from models import AuthSignup, Company, User, UserAuth, UserRole
+from routers.whatsapp import reminder_service
+
+router = APIRouter()
+
+# User Management
+@router.post("/users", response_model=User)
+async def create_user(signup_data: AuthSignup):
+    # Check if user already exists
+    existing_user = await db.user_auth.find_one({"email": signup_data.email})
+    if existing_user:
+        raise HTTPException(status_code=400, detail="User already exists")
+    
+    # Create company
+    company = Company(
+        name=signup_data.company,
+        plan=signup_data.plan
+    )
+    await db.companies.insert_one(company.dict())
+    
+    # Create auth user
+    password_hash = await get_password_hash(signup_data.password)
+    auth_user = UserAuth(
+        email=signup_data.email,
+        password_hash=password_hash
+    )
+    await db.user_auth.insert_one(auth_user.dict())
+    
+    # Create user profile
+    user = User(
+        id=auth_user.id,
+        name=signup_data.name,
+        email=signup_data.email,
+        phone_number=signup_data.phone_number,
+        role=UserRole.ADMIN,  # First user is admin
+        company_id=company.id
+    )
+    user = User(
+        id=auth_user.id,
+        name=signup_data.name,
+        email=signup_data.email,
+        role=UserRole.ADMIN,  # First user is admin
+        company_id=company.id
+    )
+    await db.users.insert_one(user.dict())
+    return user
+
+@router.patch("/users/{user_id}/phone")
+async def update_user_phone(user_id: str, request: dict):
+    """Update user's phone number for WhatsApp integration"""
+    phone_number = request.get("phone_number", "").strip()
+    
+    # Basic validation
+    if phone_number and not phone_number.startswith("+"):
+        raise HTTPException(status_code=400, detail="Phone number must include country code (e.g., +1234567890)")
+    
+    # Update user phone number
+    try:
+        await db.users.update_one(
+            {"id": user_id},
+            {"$set": {"phone_number": phone_number if phone_number else None}}
+        )
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="Phone number is already linked to another account")
+    
+    invalidate_cached_user(user_id)
+    
+    user = await db.users.find_one({"id": user_id})
+    if user:
+        reminder_service.schedule_user(user)
+        team_name_index.invalidate(user.get("company_id"))
+    
+    return {"success": True, "message": "Phone number updated successfully"}
+
+@router.patch("/users/{user_id}/reminder-settings")
+async def update_reminder_settings(user_id: str, request: dict, current_user: User = Depends(get_current_user)):
+    """Update user's timezone and preferred local time for daily WhatsApp reminders"""
+    # Users manage their own reminders; company admins may manage their members'
+    if user_id != current_user.id:
+        target = await db.users.find_one({"id": user_id}, {"_id": 0, "company_id": 1})
+        if not (
+            current_user.role == UserRole.ADMIN
+            and current_user.company_id
+            and target
+            and target.get("company_id") == current_user.company_id
+        ):
+            raise HTTPException(status_code=403, detail="Not allowed to change this user's reminders")
+    
+    update_dict = {}
+    
+    if "timezone" in request:
+        timezone_name = (request.get("timezone") or "").strip()
+        if get_zone(timezone_name).key != timezone_name:
+            raise HTTPException(status_code=400, detail="Unknown timezone (use an IANA name, e.g. Asia/Kolkata)")
+        update_dict["timezone"] = timezone_name
+    
+    if "reminder_time" in request:
+        try:
+            hour, minute = parse_reminder_time(request.get("reminder_time"))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Reminder time must be HH:MM (24-hour)")
+        update_dict["reminder_time"] = f"{hour:02d}:{minute:02d}"
+    
+    if "reminders_enabled" in request:
+        update_dict["reminders_enabled"] = bool(request.get("reminders_enabled"))
+    
+    if not update_dict:
+        raise HTTPException(status_code=400, detail="No reminder settings provided")
+    
+    result = await db.users.update_one({"id": user_id}, {"$set": update_dict})
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    invalidate_cached_user(user_id)
+    
+    user = await db.users.find_one({"id": user_id})
+    reminder_service.schedule_user(user)
+    
+    return {"success": True, "message": "Reminder settings updated successfully", **update_dict}
+
+@router.get("/users", response_model=List[User])
+async def get_users(tenant: TenantRepository = Depends(get_tenant)):
+    users = await tenant.users.find().to_list(1000)
+    return [User(**user) for user in users]
+
+@router.get("/users/{user_id}", response_model=User)
+async def get_user(user_id: str, tenant: TenantRepository = Depends(get_tenant)):
+    user = await tenant.users.find_one({"id": user_id})
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return User(**user)
@@ -0,0 +1,996 @@
+from fastapi import APIRouter, HTTPException, Request as APIRequest
+from fastapi.responses import StreamingResponse
+import os
+import logging
+from typing import List, Optional
+import uuid
+from datetime import datetime, timedelta
+import json
+import httpx
+import asyncio
+
+from services.priority_service import compute_priority_score
+from services.reminders import ReminderService, get_zone
+from services.broadcast import BroadcastTargetNotFound
+from services.idempotency import InboundMessageStore
+from services.commands import CommandRouter, int_arg, split_arg, text_arg
+from services.sessions import ConversationSessionStore
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from core import (
+    calculate_performance_score, db, notification_outbox, priority_service, scheduler,
+    task_assignment_summary, team_broadcaster, team_name_index, user_stats,
+    whatsapp_monitor, whatsapp_user_cache
+)
+from models import TaskStatus
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Redelivered inbound messages get their original reply instead of running again
+inbound_messages = InboundMessageStore(
+    db,
+    ttl=timedelta(hours=int(os.environ.get('INBOUND_MESSAGE_TTL_HOURS', '48'))),
+    claim_timeout=timedelta(seconds=int(os.environ.get('INBOUND_MESSAGE_CLAIM_TIMEOUT_SECONDS', '60')))
+)
+
+# Remembers each phone's last numbered task listing for "complete task N"
+whatsapp_sessions = ConversationSessionStore(
+    db,
+    ttl=timedelta(minutes=int(os.environ.get('WHATSAPP_SESSION_TTL_MINUTES', '30'))),
+    persist=os.environ.get('WHATSAPP_SESSIONS_PERSIST', 'false').lower() == 'true'
+)
+
+WHATSAPP_BATCH_MAX_MESSAGES = int(os.environ.get('WHATSAPP_BATCH_MAX_MESSAGES', '500'))
+WHATSAPP_BATCH_CONCURRENCY = int(os.environ.get('WHATSAPP_BATCH_CONCURRENCY', '20'))
+
+@router.post("/whatsapp/message")
+async def handle_whatsapp_message(request: dict):
+    """Process incoming WhatsApp messages and generate responses"""
+    return await process_inbound_message(request)
+
+@router.post("/whatsapp/messages/batch")
+async def handle_whatsapp_message_batch(request: dict):
+    """
+    Process a batch of incoming WhatsApp messages (e.g. a reconnect backlog).
+    Different senders are handled concurrently; each sender's messages run in
+    the order given. Replies are keyed by message_id.
+    """
+    messages = request.get("messages", [])
+    if not isinstance(messages, list):
+        raise HTTPException(status_code=400, detail="messages must be a list")
+    if len(messages) > WHATSAPP_BATCH_MAX_MESSAGES:
+        raise HTTPException(status_code=413, detail=f"Batch limit is {WHATSAPP_BATCH_MAX_MESSAGES} messages")
+
+    # Per-sender queues keep each conversation in order; malformed entries
+    # are skipped and reported so they do not fail the rest of the batch
+    queues = {}
+    invalid = []
+    for index, message in enumerate(messages):
+        if not isinstance(message, dict):
+            invalid.append({"index": index, "error": "message must be an object"})
+            continue
+        if not all(isinstance(message.get(field, ""), str) for field in ("phone_number", "message", "message_id")):
+            invalid.append({"index": index, "error": "phone_number, message and message_id must be strings"})
+            continue
+        key = message.get("message_id") or f"index:{index}"
+        queues.setdefault(message.get("phone_number", ""), []).append((key, message))
+
+    replies = {}
+    semaphore = asyncio.Semaphore(WHATSAPP_BATCH_CONCURRENCY)
+
+    async def process_sender(queue):
+        async with semaphore:
+            for key, message in queue:
+                replies[key] = await process_inbound_message(message)
+
+    await asyncio.gather(*[process_sender(queue) for queue in queues.values()])
+
+    return {
+        "replies": replies,
+        "processed": len(replies),
+        "senders": len(queues),
+        "invalid": invalid
+    }
+
+async def process_inbound_message(request: dict) -> dict:
+    """Run one inbound WhatsApp message through dedupe and the command router"""
+    try:
+        phone_number = request.get("phone_number", "")
+        message_text = request.get("message", "").strip().lower()
+        message_id = request.get("message_id", "")
+        timestamp = request.get("timestamp", 0)
+
+        # Skip messages we have already processed (sidecar retries, redeliveries)
+        if message_id:
+            existing = await inbound_messages.claim(message_id, phone_number)
+            if existing:
+                existing = await inbound_messages.wait_for_reply(message_id, existing)
+                return {
+                    "reply": existing.get("reply") if existing else None,
+                    "success": existing.get("success", True) if existing else True,
+                    "duplicate": True
+                }
+
+        # Get or create user
+        user = await get_or_create_whatsapp_user(phone_number)
+
+        # Process command
+        response = await process_whatsapp_command(user, message_text)
+
+        if message_id:
+            await inbound_messages.complete(message_id, response)
+
+        return {"reply": response, "success": True}
+
+    except Exception as e:
+        logger.error(f"WhatsApp message processing error: {str(e)}")
+        if request.get("message_id"):
+            await inbound_messages.release(request["message_id"])
+        return {
+            "reply": "❌ Sorry, I encountered an error processing your request. Please try again.",
+            "success": False
+        }
+
+@router.post("/whatsapp/send-team-message")
+async def send_team_message(request: dict):
+    """Send message to all team members"""
+    try:
+        return await team_broadcaster.broadcast(
+            request.get("sender_id", ""),
+            request.get("message", ""),
+            team_id=request.get("team_id", None)
+        )
+    except BroadcastTargetNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Team message error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/whatsapp/send-task-assignment")
+async def send_task_assignment(request: dict):
+    """Send task assignment notification via WhatsApp"""
+    try:
+        task_id = request.get("task_id", "")
+        assigned_by_id = request.get("assigned_by_id", "")
+        
+        # Get task and users
+        task = await db.tasks.find_one({"id": task_id})
+        if not task:
+            raise HTTPException(status_code=404, detail="Task not found")
+            
+        assigned_by = await db.users.find_one({"id": assigned_by_id})
+        assigned_to = await db.users.find_one({"id": task["assigned_to"]})
+        
+        if not assigned_to or not assigned_to.get("phone_number"):
+            return {"success": False, "message": "Assigned user has no phone number"}
+        
+        # Create assignment message
+        priority_emoji = {"urgent": "🔥", "high": "⚡", "medium": "📌", "low": "📝"}.get(task.get("priority", "medium"), "📝")
+        due_date = task.get("due_date")
+        due_text = f"\n📅 Due: {due_date.strftime('%Y-%m-%d %H:%M')}" if due_date else ""
+        
+        message = f"""📋 *New Task Assigned!*
+
+{priority_emoji} **{task['title']}**
+
+📝 {task.get('description', 'No description provided')}
+
+👤 Assigned by: {assigned_by['name']}{due_text}
+
+Use WhatsApp commands:
+• *list tasks* - See all tasks
+• *complete task [number]* - Mark as done
+• *help* - Show all commands"""
+
+        # Queue for the assignee's digest; urgent tasks go out immediately
+        notification = await notification_outbox.enqueue(
+            assigned_to["phone_number"],
+            message,
+            "task_assigned",
+            summary=task_assignment_summary(task["title"], task.get("priority", "medium"), assigned_by['name'], due_date),
+            task_id=task_id,
+            urgent=task.get("priority") == "urgent"
+        )
+        
+        return {
+            "success": True,
+            "message": "Task assignment queued",
+            "notification_id": notification["id"]
+        }
+                
+    except Exception as e:
+        logger.error(f"Task assignment error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+async def send_daily_reminder(user: dict) -> Optional[bool]:
+    """Send one user's pending task reminder; None when there is nothing to remind"""
+    zone = get_zone(user.get("timezone"))
+    local_hour = datetime.now(zone).hour
+    greeting = "Good Morning" if local_hour < 12 else "Good Afternoon" if local_hour < 17 else "Good Evening"
+    
+    # Get pending tasks for user
+    pending_tasks = await db.tasks.find({
+        "assigned_to": user["id"],
+        "status": {"$in": ["todo", "in_progress", "overdue"]}
+    }).to_list(50)
+    
+    if not pending_tasks:
+        return None
+    
+    # Count overdue tasks
+    overdue_tasks = []
+    upcoming_tasks = []
+    
+    now = datetime.utcnow()
+    for task in pending_tasks:
+        if task.get("status") == TaskStatus.OVERDUE:
+            overdue_tasks.append(task)
+        elif task.get("due_date") and (task["due_date"].replace(tzinfo=None) - now).days <= 2:
+            upcoming_tasks.append(task)
+    
+    if not overdue_tasks and not upcoming_tasks:
+        return None
+    
+    message = f"🌅 *{greeting}, {user['name']}!*\n\n📋 Your Task Reminder:\n\n"
+    
+    if overdue_tasks:
+        message += f"🔥 *{len(overdue_tasks)} Overdue Tasks:*\n"
+        for task in overdue_tasks[:3]:  # Show max 3
+            message += f"• {task['title']}\n"
+        if len(overdue_tasks) > 3:
+            message += f"• ... and {len(overdue_tasks) - 3} more\n"
+        message += "\n"
+    
+    if upcoming_tasks:
+        message += f"⏰ *{len(upcoming_tasks)} Due Soon:*\n"
+        for task in upcoming_tasks[:3]:  # Show max 3
+            days_left = (task["due_date"].replace(tzinfo=None) - now).days
+            message += f"• {task['title']} ({days_left} days)\n"
+        if len(upcoming_tasks) > 3:
+            message += f"• ... and {len(upcoming_tasks) - 3} more\n"
+        message += "\n"
+    
+    message += f"📊 Total pending: {len(pending_tasks)}\n\n"
+    message += "Type *list tasks* to see all tasks\nType *help* for commands"
+    
+    await notification_outbox.enqueue(user["phone_number"], message, "daily_reminder")
+    return True
+
+# Per-user daily reminders at local time
+reminder_service = ReminderService(
+    db,
+    send_reminder=send_daily_reminder,
+    acquire_lease=scheduler.acquire_lease
+)
+
+@router.post("/whatsapp/send-daily-reminders")
+async def send_daily_reminders():
+    """Send daily pending task reminders to all users right now"""
+    try:
+        # Get all users with phone numbers
+        users = await db.users.find({"phone_number": {"$exists": True}}).to_list(1000)
+        
+        sent_count = 0
+        failed_count = 0
+        
+        for user in users:
+            try:
+                sent = await send_daily_reminder(user)
+                if sent is True:
+                    sent_count += 1
+                elif sent is False:
+                    failed_count += 1
+                                
+            except Exception as e:
+                logger.error(f"Failed to send reminder to {user['id']}: {str(e)}")
+                failed_count += 1
+        
+        return {
+            "success": True,
+            "sent_count": sent_count,
+            "failed_count": failed_count,
+            "total_users": len(users)
+        }
+        
+    except Exception as e:
+        logger.error(f"Daily reminders error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/whatsapp/send-weekly-reports")
+async def send_weekly_reports():
+    """Send weekly performance reports to managers and team members"""
+    try:
+        # Get all users
+        users = await db.users.find({"phone_number": {"$exists": True}}).to_list(1000)
+        
+        sent_count = 0
+        failed_count = 0
+        
+        for user in users:
+            try:
+                # Calculate weekly performance
+                week_start = datetime.utcnow() - timedelta(days=7)
+                
+                # Get tasks from this week
+                weekly_tasks = await db.tasks.find({
+                    "assigned_to": user["id"],
+                    "created_at": {"$gte": week_start}
+                }).to_list(1000)
+                
+                completed_this_week = await db.tasks.find({
+                    "assigned_to": user["id"],
+                    "status": "completed",
+                    "completed_at": {"$gte": week_start}
+                }).to_list(1000)
+                
+                # Calculate stats
+                total_tasks = len(weekly_tasks)
+                completed_tasks = len(completed_this_week)
+                completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+                
+                # Get overall performance score
+                performance_score = await calculate_performance_score(user["id"])
+                
+                # Create report message
+                message = f"""📊 *Weekly Performance Report*
+👤 {user['name']}
+
+📅 Week: {week_start.strftime('%Y-%m-%d')} to {datetime.utcnow().strftime('%Y-%m-%d')}
+
+📈 **This Week's Stats:**
+• 📋 Tasks assigned: {total_tasks}
+• ✅ Tasks completed: {completed_tasks}
+• 📊 Completion rate: {completion_rate:.1f}%
+• 🏆 Performance score: {performance_score:.1f}/10
+
+"""
+                
+                # Add performance insights
+                if completion_rate >= 80:
+                    message += "🌟 **Outstanding week!** You're crushing your goals!\n\n"
+                elif completion_rate >= 60:
+                    message += "👍 **Good progress!** Keep up the momentum!\n\n"
+                else:
+                    message += "💪 **Focus needed!** Let's boost your productivity next week!\n\n"
+                
+                # Add tips based on performance
+                if completion_rate < 50:
+                    message += "💡 **Tips for next week:**\n"
+                    message += "• Break large tasks into smaller steps\n"
+                    message += "• Set daily task limits\n"
+                    message += "• Use priority levels effectively\n\n"
+                
+                message += "Use the web app for detailed analytics!\n"
+                message += "Type *stats* for current performance"
+                
+                await notification_outbox.enqueue(user["phone_number"], message, "weekly_report")
+                sent_count += 1
+                        
+            except Exception as e:
+                logger.error(f"Failed to send weekly report to {user['id']}: {str(e)}")
+                failed_count += 1
+        
+        return {
+            "success": True,
+            "sent_count": sent_count,
+            "failed_count": failed_count,
+            "total_users": len(users)
+        }
+        
+    except Exception as e:
+        logger.error(f"Weekly reports error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Simple WhatsApp Integration Endpoints
+@router.post("/whatsapp/start-connection")
+async def start_whatsapp_connection():
+    """Start WhatsApp connection process"""
+    try:
+        # In a real implementation, this would initialize the WhatsApp client
+        # For now, return success to proceed to QR code generation
+        return {
+            "success": True,
+            "message": "WhatsApp connection process started",
+            "status": "waiting_for_qr"
+        }
+    except Exception as e:
+        logger.error(f"WhatsApp connection start error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/whatsapp/qr-code")
+async def get_whatsapp_qr_code():
+    """Get WhatsApp QR code for scanning"""
+    try:
+        # In a real implementation, this would get the actual QR code from WhatsApp client
+        # For demo purposes, generate a placeholder QR code
+        import qrcode
+        from io import BytesIO
+        import base64
+        
+        qr = qrcode.QRCode(version=1, box_size=10, border=5)
+        qr.add_data("WhatsApp connection placeholder - In production, this would be the actual WhatsApp auth QR")
+        qr.make(fit=True)
+        
+        img = qr.make_image(fill_color="black", back_color="white")
+        
+        # Convert to base64
+        buffer = BytesIO()
+        img.save(buffer, format='PNG')
+        qr_base64 = base64.b64encode(buffer.getvalue()).decode()
+        
+        return {
+            "success": True,
+            "qr_code": qr_base64,
+            "message": "QR code generated successfully"
+        }
+    except Exception as e:
+        logger.error(f"WhatsApp QR code generation error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/whatsapp/status")
+async def get_whatsapp_connection_status():
+    """Get current WhatsApp connection status (cached by the background monitor)"""
+    return whatsapp_monitor.snapshot()
+
+@router.get("/whatsapp/status/stream")
+async def stream_whatsapp_status(request: APIRequest):
+    """Server-sent events: the current status once, then every change"""
+    async def events():
+        queue = whatsapp_monitor.subscribe()
+        try:
+            yield f"data: {json.dumps(whatsapp_monitor.snapshot(), default=str)}\n\n"
+            while not await request.is_disconnected():
+                try:
+                    state = await asyncio.wait_for(queue.get(), timeout=15.0)
+                    yield f"data: {json.dumps(state, default=str)}\n\n"
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+        finally:
+            whatsapp_monitor.unsubscribe(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post("/whatsapp/disconnect")
+async def disconnect_whatsapp():
+    """Disconnect WhatsApp"""
+    try:
+        # In a real implementation, this would disconnect the WhatsApp client
+        return {
+            "success": True,
+            "message": "WhatsApp disconnected successfully"
+        }
+    except Exception as e:
+        logger.error(f"WhatsApp disconnect error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+async def get_or_create_whatsapp_user(phone_number: str):
+    """Get existing WhatsApp user or create new one"""
+    user = whatsapp_user_cache.get(phone_number)
+    if user:
+        return user
+
+    user_data = {
+        "id": str(uuid.uuid4()),
+        "name": f"WhatsApp User {phone_number[-4:]}",
+        "email": f"whatsapp_{phone_number}@productivity.app",
+        "phone_number": phone_number,
+        "role": "team_member",
+        "performance_score": 0.0,
+        "tasks_completed": 0,
+        "tasks_assigned": 0,
+        "tasks_overdue": 0,
+        "created_at": datetime.utcnow(),
+        "company_id": None
+    }
+
+    # Atomic get-or-create; the unique phone_number index stops concurrent duplicates
+    try:
+        user = await db.users.find_one_and_update(
+            {"phone_number": phone_number},
+            {"$setOnInsert": user_data},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        # Lost the upsert race to a concurrent message from the same number
+        user = await db.users.find_one({"phone_number": phone_number})
+
+    if user["id"] == user_data["id"]:
+        team_name_index.invalidate(user.get("company_id"))  # New member to resolve by name
+
+    whatsapp_user_cache.set(phone_number, user)
+    return user
+
+async def whatsapp_unknown_command(user, message_text: str) -> str:
+    """Default response for unrecognized commands"""
+    return f"""🤔 I didn't understand that command.
+
+*Quick Commands:*
+• *create task: [description]*
+• *assign task to [name]: [description]*
+• *list tasks*
+• *complete task [number]*
+• *stats*
+• *coach*
+• *help*
+
+*Team Commands:*
+• *team list*
+• *message team: [message]*
+
+Type *help* for all commands."""
+
+# WhatsApp chat commands, resolved by phrase/prefix lookup instead of an if/elif chain
+whatsapp_commands = CommandRouter(fallback=whatsapp_unknown_command)
+
+@whatsapp_commands.command(
+    "create task",
+    prefixes=("create task:", "add task:"),
+    parser=text_arg("description"),
+    usage="📝 Please provide a task description.\n\n*Example:* create task: buy groceries"
+)
+async def whatsapp_create_task(user, description: str) -> str:
+    """Create task command: "create task: buy groceries" """
+    task_data = {
+        "id": str(uuid.uuid4()),
+        "title": description,
+        "description": "",
+        "assigned_to": user["id"],
+        "status": "todo",
+        "priority": "medium",
+        "eisenhower_quadrant": "decide",  # Default to important but not urgent
+        "company_id": user.get("company_id"),
+        "created_at": datetime.utcnow(),
+        "updated_at": datetime.utcnow(),
+        "tags": ["whatsapp"]
+    }
+    task_data["priority_score"] = compute_priority_score(task_data)
+
+    await db.tasks.insert_one(task_data)
+    user_stats.increment(user["id"], "tasks_assigned")
+
+    return f"✅ *Task Created Successfully!*\n\n📋 {description}\n\nUse *list tasks* to see all your tasks."
+
+@whatsapp_commands.command(
+    "assign task",
+    prefixes=("assign task to ",),
+    parser=split_arg("assignee_name", "task_description"),
+    usage="📝 Format: *assign task to [name]: [task description]*\n\n*Example:* assign task to john: review documents"
+)
+async def whatsapp_assign_task(user, assignee_name: str, task_description: str) -> str:
+    """Assign task to team member: "assign task to john: review documents" """
+    try:
+        # Parse due date and priority if mentioned
+        due_date = None
+        priority = "medium"
+
+        if "due tomorrow" in task_description:
+            due_date = datetime.utcnow() + timedelta(days=1)
+            task_description = task_description.replace("due tomorrow", "").strip()
+            priority = "high"
+        elif "urgent" in task_description:
+            priority = "urgent"
+            task_description = task_description.replace("urgent", "").strip()
+
+        # Find team member by name (ranked fuzzy match within the company)
+        name_index = await team_name_index.get(user.get("company_id"))
+        team_member, matches = name_index.resolve(assignee_name)
+
+        if not matches:
+            return f"❌ Team member '{assignee_name}' not found.\n\nUse *team list* to see all team members."
+
+        if not team_member:
+            options = "\n".join(f"{i}. {match.member['name']}" for i, match in enumerate(matches, 1))
+            return f"🤔 *'{assignee_name}' matches several team members:*\n\n{options}\n\nPlease use the full name, e.g. *assign task to {matches[0].member['name'].lower()}: ...*"
+
+        # Create task
+        task_data = {
+            "id": str(uuid.uuid4()),
+            "title": task_description,
+            "description": f"Assigned via WhatsApp by {user['name']}",
+            "assigned_to": team_member["id"],
+            "assigned_by": user["id"],
+            "status": "todo",
+            "priority": priority,
+            "eisenhower_quadrant": "decide",
+            "company_id": user.get("company_id"),
+            "created_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow(),
+            "due_date": due_date,
+            "tags": ["whatsapp", "assigned"]
+        }
+        task_data["priority_score"] = compute_priority_score(task_data)
+
+        # The task and its assignment notification are written together
+        async with notification_outbox.transaction() as session:
+            await db.tasks.insert_one(task_data, session=session)
+
+            # Send notification to assignee if they have WhatsApp
+            if team_member.get("phone_number"):
+                priority_emoji = {"urgent": "🔥", "high": "⚡", "medium": "📌", "low": "📝"}.get(priority, "📌")
+                due_text = f"\n📅 Due: {due_date.strftime('%Y-%m-%d')}" if due_date else ""
+
+                notification = f"""📋 *New Task Assigned!*
+
+{priority_emoji} **{task_description}**
+
+👤 Assigned by: {user['name']}{due_text}
+
+Reply with *list tasks* to see all tasks"""
+
+                await notification_outbox.enqueue(
+                    team_member["phone_number"],
+                    notification,
+                    "task_assigned",
+                    summary=task_assignment_summary(task_description, priority, user['name'], due_date),
+                    task_id=task_data["id"],
+                    urgent=priority == "urgent",
+                    session=session
+                )
+        user_stats.increment(team_member["id"], "tasks_assigned")
+
+        due_date_str = due_date.strftime("%Y-%m-%d") if due_date else ""
+        due_text = f"\n📅 Due: {due_date_str}" if due_date else ""
+        return f"✅ *Task Assigned Successfully!*\n\n📋 {task_description}\n👤 Assigned to: {team_member['name']}\n📊 Priority: {priority.title()}{due_text}"
+
+    except Exception as e:
+        return "❌ Error assigning task. Use format: *assign task to [name]: [description]*"
+
+@whatsapp_commands.command("team list", phrases=("team list", "show team", "list team", "team members"))
+async def whatsapp_team_list(user) -> str:
+    """List team members"""
+    team_members = await db.users.find({
+        "company_id": user.get("company_id"),
+        "id": {"$ne": user["id"]}  # Exclude current user
+    }).to_list(50)
+
+    if not team_members:
+        return "👥 *No team members found.*\n\nInvite team members through the web app."
+
+    response = "👥 *Your Team Members:*\n\n"
+    for i, member in enumerate(team_members, 1):
+        role_emoji = {"admin": "👑", "manager": "👨‍💼", "team_member": "👤"}.get(member.get("role", "team_member"), "👤")
+        whatsapp_status = "📱" if member.get("phone_number") else "❌"
+        response += f"{i}. {role_emoji} {member['name']} {whatsapp_status}\n"
+
+    response += f"\n*Total: {len(team_members)} members*\n\n📱 = WhatsApp enabled\n❌ = No WhatsApp"
+    return response
+
+@whatsapp_commands.command(
+    "message team",
+    prefixes=("message team:", "broadcast:"),
+    parser=text_arg("message_content"),
+    usage="📝 Please provide a message.\n\n*Example:* message team: Meeting in 10 minutes"
+)
+async def whatsapp_message_team(user, message_content: str) -> str:
+    """Send team message: "message team: Meeting in 10 minutes" """
+    try:
+        result = await team_broadcaster.broadcast(user["id"], message_content)
+        return f"📢 *Team Message Sent!*\n\n✅ Delivered to {result['sent_count']} members\n❌ Failed: {result['failed_count']}\n👥 Total team: {result['total_members']}"
+
+    except Exception as e:
+        logger.error(f"Team broadcast error: {str(e)}")
+        return "❌ Failed to send team message. Please try again."
+
+def whatsapp_session_key(user) -> str:
+    return user.get("phone_number") or user["id"]
+
+def number_task_listing(tasks: List[dict]) -> List[tuple]:
+    """
+    Group ranked tasks the way *list tasks* shows them.
+    Returns (section, task) pairs in display order; position + 1 is the task number.
+    """
+    overdue_tasks = []
+    urgent_tasks = []
+    normal_tasks = []
+
+    for task in tasks:
+        if task.get("status") == TaskStatus.OVERDUE:
+            overdue_tasks.append(task)
+        elif task.get("priority") in ["urgent", "high"]:
+            urgent_tasks.append(task)
+        else:
+            normal_tasks.append(task)
+
+    return (
+        [("overdue", task) for task in overdue_tasks[:3]]
+        + [("urgent", task) for task in urgent_tasks[:3]]
+        + [("normal", task) for task in normal_tasks[:5]]
+    )
+
+async def load_task_listing(user) -> tuple:
+    """Fetch the user's ranked tasks, number them and remember the numbering for this phone"""
+    # Highest-ranked first, so each bucket is already in priority order
+    tasks = await priority_service.top_tasks(user["id"], limit=20)
+    listing = number_task_listing(tasks)
+    await whatsapp_sessions.set_listing(whatsapp_session_key(user), [task["id"] for _, task in listing])
+    return tasks, listing
+
+@whatsapp_commands.command("list tasks", phrases=("list tasks", "show tasks", "my tasks", "tasks"))
+async def whatsapp_list_tasks(user) -> str:
+    """List tasks command with enhanced filtering"""
+    tasks, listing = await load_task_listing(user)
+
+    if not tasks:
+        return "📝 *No pending tasks found.*\n\nCreate a task with: *create task: [description]*"
+
+    response = "📋 *Your Pending Tasks:*\n\n"
+    section_headers = {"overdue": "🔥 *OVERDUE:*\n", "urgent": "⚡ *HIGH PRIORITY:*\n", "normal": "📌 *NORMAL:*\n"}
+    current_section = None
+
+    for task_counter, (section, task) in enumerate(listing, 1):
+        if section != current_section:
+            if current_section is not None:
+                response += "\n"
+            response += section_headers[section]
+            current_section = section
+
+        if section == "overdue":
+            emoji = "🔥"
+        elif section == "urgent":
+            emoji = {"urgent": "🔥", "high": "⚡"}.get(task.get("priority", "medium"), "⚡")
+        else:
+            emoji = "📌"
+        response += f"{task_counter}. {emoji} {task['title']}\n"
+
+    response += f"\n*Total: {len(tasks)} pending tasks*\n\nComplete with: *complete task [number]*"
+    return response
+
+@whatsapp_commands.command(
+    "complete task",
+    prefixes=("complete task", "done task"),
+    parser=int_arg("task_number"),
+    usage="📝 Please specify a task number.\n\n*Example:* complete task 1"
+)
+async def whatsapp_complete_task(user, task_number: int) -> str:
+    """Complete task command: "complete task 1" """
+    try:
+        # Numbers refer to the listing this phone last saw
+        task_ids = await whatsapp_sessions.get_listing(whatsapp_session_key(user))
+        if task_ids is None:
+            _, listing = await load_task_listing(user)
+            task_ids = [task["id"] for _, task in listing]
+
+        if task_number < 1 or task_number > len(task_ids):
+            return f"❌ Invalid task number. You have {len(task_ids)} tasks listed.\n\nUse *list tasks* to see all tasks."
+
+        # The completion and the assigner's notification are written together
+        async with notification_outbox.transaction() as session:
+            task_to_complete = await db.tasks.find_one_and_update(
+                {"id": task_ids[task_number - 1], "assigned_to": user["id"], "status": {"$ne": "completed"}},
+                {
+                    "$set": {
+                        "status": "completed",
+                        "completed_at": datetime.utcnow(),
+                        "updated_at": datetime.utcnow()
+                    },
+                    "$inc": {"version": 1}
+                },
+                projection={"_id": 0, "id": 1, "title": 1, "assigned_by": 1},
+                return_document=ReturnDocument.AFTER,
+                session=session
+            )
+
+            # Notify assigner if task was assigned by someone else
+            if task_to_complete and task_to_complete.get("assigned_by"):
+                assigner = await db.users.find_one({"id": task_to_complete["assigned_by"]}, session=session)
+                if assigner and assigner.get("phone_number"):
+                    notification = f"✅ *Task Completed!*\n\n📋 {task_to_complete['title']}\n👤 Completed by: {user['name']}\n🎉 Great teamwork!"
+
+                    await notification_outbox.enqueue(
+                        assigner["phone_number"],
+                        notification,
+                        "task_completed",
+                        summary=f"{task_to_complete['title']} - by {user['name']}",
+                        task_id=task_to_complete["id"],
+                        session=session
+                    )
+
+        if not task_to_complete:
+            return f"✅ Task {task_number} is already completed.\n\nUse *list tasks* to refresh your list."
+
+        user_stats.increment(user["id"], "tasks_completed")
+
+        return f"🎉 *Task Completed!*\n\n✅ {task_to_complete['title']}\n\nGreat job! Keep up the momentum!"
+
+    except Exception as e:
+        return "❌ Error completing task. Please check the task number and try again."
+
+@whatsapp_commands.command("stats", phrases=("stats", "status", "performance", "dashboard"))
+async def whatsapp_stats(user) -> str:
+    """Enhanced productivity stats with trends"""
+    # Indexed counts instead of loading every task
+    total_count = await db.tasks.count_documents({"assigned_to": user["id"]})
+    completed_count = await db.tasks.count_documents({"assigned_to": user["id"], "status": "completed"})
+    overdue_count = await db.tasks.count_documents({"assigned_to": user["id"], "status": "overdue"})
+    pending_count = total_count - completed_count
+
+    completion_rate = (completed_count / total_count * 100) if total_count else 0
+
+    # Weekly comparison
+    week_ago = datetime.utcnow() - timedelta(days=7)
+    weekly_completed_count = await db.tasks.count_documents({
+        "assigned_to": user["id"],
+        "status": "completed",
+        "completed_at": {"$gte": week_ago}
+    })
+
+    response = f"📊 *Your Productivity Dashboard*\n\n"
+    response += f"👤 {user['name']}\n"
+    response += f"📅 {datetime.utcnow().strftime('%Y-%m-%d')}\n\n"
+    response += f"📈 **Overall Stats:**\n"
+    response += f"📋 Total tasks: {total_count}\n"
+    response += f"✅ Completed: {completed_count}\n"
+    response += f"⏳ Pending: {pending_count}\n"
+    response += f"🔥 Overdue: {overdue_count}\n"
+    response += f"📊 Completion rate: {completion_rate:.1f}%\n\n"
+
+    response += f"📅 **This Week:**\n"
+    response += f"✅ Completed: {weekly_completed_count} tasks\n\n"
+
+    if completion_rate > 80:
+        response += "🏆 **Outstanding performance!** You're a productivity champion!"
+    elif completion_rate > 60:
+        response += "👍 **Good work!** You're on the right track!"
+    elif completion_rate > 40:
+        response += "📈 **Room for improvement!** Let's boost your productivity!"
+    else:
+        response += "💪 **Let's get organized!** Break tasks into smaller steps."
+
+    if overdue_count:
+        response += f"\n\n⚠️ **Focus on {overdue_count} overdue tasks first!**"
+
+    return response
+
+@whatsapp_commands.command("coach", phrases=("coach", "help me", "advice", "tips", "coaching"))
+async def whatsapp_coach(user) -> str:
+    """Enhanced AI coaching with personalized advice"""
+    # Get user's actual performance data
+    user_tasks = await db.tasks.find({"assigned_to": user["id"]}).to_list(1000)
+    completed_tasks = [t for t in user_tasks if t.get("status") == "completed"]
+    overdue_tasks = [t for t in user_tasks if t.get("status") == "overdue"]
+
+    completion_rate = (len(completed_tasks) / len(user_tasks) * 100) if user_tasks else 0
+
+    response = f"🤖 *AI Productivity Coach for {user['name']}*\n\n"
+
+    # Personalized advice based on performance
+    if completion_rate > 80:
+        response += "🌟 **You're crushing it!** Here's how to maintain excellence:\n\n"
+        response += "🎯 **Advanced Tips:**\n"
+        response += "• Focus on high-impact tasks\n"
+        response += "• Delegate routine tasks to grow your team\n"
+        response += "• Set stretch goals for continuous growth\n"
+    elif completion_rate > 60:
+        response += "👍 **Good momentum!** Let's optimize further:\n\n"
+        response += "⚡ **Growth Tips:**\n"
+        response += "• Time-block your calendar for deep work\n"
+        response += "• Use the 2-minute rule for quick tasks\n"
+        response += "• Review and adjust priorities weekly\n"
+    else:
+        response += "💪 **Let's boost your productivity!** Start here:\n\n"
+        response += "🚀 **Foundation Tips:**\n"
+        response += "• Break large tasks into 25-minute chunks\n"
+        response += "• Complete your hardest task first\n"
+        response += "• Limit yourself to 3 key tasks per day\n"
+
+    response += "\n📱 **WhatsApp Productivity:**\n"
+    response += "• Use *assign task* for team collaboration\n"
+    response += "• Check *stats* daily for motivation\n"
+    response += "• Use *message team* for quick updates\n\n"
+
+    if overdue_tasks:
+        response += f"⚠️ **Priority Alert:** Focus on your {len(overdue_tasks)} overdue tasks first!\n\n"
+
+    response += "Need deeper analysis? Use the web app for detailed insights!"
+    return response
+
+@whatsapp_commands.command("help", phrases=("help", "commands", "?", "menu"))
+async def whatsapp_help(user) -> str:
+    """Help command with enhanced features"""
+    return """🤖 *Productivity Beast WhatsApp Bot*
+
+*📝 Personal Tasks:*
+• *create task: [description]* - Add new task
+• *list tasks* - Show pending tasks
+• *complete task [number]* - Mark as done
+• *stats* - View your performance
+
+*👥 Team Collaboration:*
+• *assign task to [name]: [description]* - Assign task
+• *team list* - Show team members
+• *message team: [message]* - Broadcast message
+
+*🤖 AI Coaching:*
+• *coach* - Get personalized productivity tips
+• *help* - Show this menu
+
+*📅 Advanced Examples:*
+• assign task to john: review documents due tomorrow
+• create task: urgent - fix website bug
+• message team: Weekly meeting at 3 PM
+
+Need more features? Visit the web app! 🚀"""
+
+async def process_whatsapp_command(user, message_text: str) -> str:
+    """Process WhatsApp task-related commands with enhanced functionality"""
+    return await whatsapp_commands.dispatch(user, message_text)
+
+@router.get("/whatsapp/qr")
+async def get_whatsapp_qr():
+    """Get WhatsApp QR code for authentication"""
+    try:
+        async with httpx.AsyncClient() as client:
+            response = await client.get("http://localhost:3002/qr", timeout=5.0)
+            return response.json()
+    except Exception as e:
+        return {
+            "qr": None,
+            "status": "service_unavailable",
+            "error": str(e)
+        }
+
+@router.post("/whatsapp/send")
+async def send_whatsapp_message(request: dict):
+    """Send message via WhatsApp service"""
+    try:
+        async with httpx.AsyncClient() as client:
+            response = await client.post(
+                "http://localhost:3002/send",
+                json=request,
+                timeout=10.0
+            )
+            return response.json()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/whatsapp/restart")
+async def restart_whatsapp_service():
+    """Restart WhatsApp service connection"""
+    try:
+        async with httpx.AsyncClient() as client:
+            response = await client.post("http://localhost:3002/restart", timeout=5.0)
+            whatsapp_monitor.request_refresh()
+            return response.json()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# WhatsApp Webhook endpoint
+@router.post("/integrations/whatsapp/webhook")
+async def whatsapp_webhook(request: dict):
+    """Handle WhatsApp Business API webhooks"""
+    
+    # This is a placeholder for WhatsApp integration
+    # Users will configure their own WhatsApp Business API
+    
+    if request.get("object") == "whatsapp_business_account":
+        for entry in request.get("entry", []):
+            for change in entry.get("changes", []):
+                if change.get("field") == "messages":
+                    # Process incoming message
+                    messages = change.get("value", {}).get("messages", [])
+                    for message in messages:
+                        # Handle message logic here
+                        await process_whatsapp_message(message)
+    
+    return {"status": "success"}
+
+async def process_whatsapp_message(message: dict):
+    """Process incoming WhatsApp message and create tasks if needed"""
+    
+    # Extract message details
+    phone_number = message.get("from")
+    message_text = message.get("text", {}).get("body", "")
+    
+    # Check if message is a task creation request
+    if "create task" in message_text.lower() or "@productivity" in message_text.lower():
+        # Parse task from message
+        # This is where you'd implement task creation logic
+        pass
+    
+    return {"processed": True}
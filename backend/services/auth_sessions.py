@@ -0,0 +1,237 @@
+from pymongo import ASCENDING
+from pymongo.errors import DuplicateKeyError
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+import asyncio
+import base64
+import hashlib
+import hmac
+import logging
+import math
+import secrets
+import uuid
+
+logger = logging.getLogger(__name__)
+
+
+def hash_token(token: str) -> str:
+    """Refresh tokens are random, so a plain SHA-256 is enough to store them"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (double hashing on one SHA-256)"""
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.sha256(item.encode()).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:16], "big") | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self.bits[position // 8] |= 1 << (position % 8)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position // 8] & (1 << (position % 8)) for position in self._positions(item))
+
+
+class RefreshSessionStore:
+    """
+    Long-lived login sessions behind short access tokens. Each session
+    (family) hands out one refresh token at a time; using it rotates it, and
+    reusing an already rotated token revokes the whole family. Within
+    reuse_grace of a rotation the old token yields the same successor again,
+    so tabs refreshing at the same moment are not mistaken for theft. Revoked
+    session ids are mirrored into a Bloom filter that is synced from Mongo,
+    so per-request revocation checks stay in memory.
+    """
+
+    def __init__(
+        self,
+        db,
+        ttl: timedelta = timedelta(days=30),
+        sync_interval: float = 30.0,
+        bloom_capacity: int = 100000,
+        secret: Optional[str] = None,
+        reuse_grace: timedelta = timedelta(seconds=30)
+    ):
+        self.db = db
+        self.ttl = ttl
+        # Successors are derived from the rotated token with this key, so a
+        # grace-window retry can be answered without storing plaintext tokens
+        self.secret = secret.encode() if secret else None
+        self.reuse_grace = reuse_grace
+        self.sync_interval = sync_interval
+        self.bloom_capacity = bloom_capacity
+        self.revoked = BloomFilter(bloom_capacity)
+        self._synced_at: Optional[datetime] = None
+        self._rebuilt_at: Optional[datetime] = None
+        self._loop_task: Optional[asyncio.Task] = None
+
+    async def ensure_indexes(self):
+        await self.db.auth_sessions.create_index(
+            [("expires_at", ASCENDING)],
+            expireAfterSeconds=0,
+            name="expires_at_ttl"
+        )
+        await self.db.auth_sessions.create_index(
+            [("session_id", ASCENDING)],
+            name="session_id"
+        )
+        await self.db.auth_session_revocations.create_index(
+            [("revoked_at", ASCENDING)],
+            name="revoked_at"
+        )
+        await self.db.auth_session_revocations.create_index(
+            [("expires_at", ASCENDING)],
+            expireAfterSeconds=0,
+            name="expires_at_ttl"
+        )
+
+    async def create(self, user_id: str) -> Tuple[str, str]:
+        """Start a session; returns (session_id, refresh_token)"""
+        session_id = str(uuid.uuid4())
+        refresh_token = await self._issue(session_id, user_id, datetime.utcnow() + self.ttl)
+        return session_id, refresh_token
+
+    def _successor(self, refresh_token: str) -> str:
+        if not self.secret:
+            return secrets.token_urlsafe(32)
+        digest = hmac.new(self.secret, refresh_token.encode(), hashlib.sha256).digest()
+        return base64.urlsafe_b64encode(digest).decode().rstrip("=")
+
+    async def _issue(self, session_id: str, user_id: str, expires_at: datetime,
+                     refresh_token: Optional[str] = None) -> str:
+        refresh_token = refresh_token or secrets.token_urlsafe(32)
+        await self.db.auth_sessions.insert_one({
+            "_id": hash_token(refresh_token),
+            "session_id": session_id,
+            "user_id": user_id,
+            "created_at": datetime.utcnow(),
+            "expires_at": expires_at,
+            "rotated_at": None
+        })
+        return refresh_token
+
+    async def rotate(self, refresh_token: str) -> Optional[Dict]:
+        """
+        Exchange a refresh token for a new one. Returns {session_id, user_id,
+        refresh_token}, or None when the token is unknown, expired, revoked
+        or was already used.
+        """
+        now = datetime.utcnow()
+        token_hash = hash_token(refresh_token)
+        record = await self.db.auth_sessions.find_one_and_update(
+            {"_id": token_hash, "rotated_at": None, "expires_at": {"$gt": now}},
+            {"$set": {"rotated_at": now}}
+        )
+
+        if record is None:
+            used = await self.db.auth_sessions.find_one(
+                {"_id": token_hash}, {"session_id": 1, "user_id": 1, "rotated_at": 1}
+            )
+            if not used or not used.get("rotated_at"):
+                return None
+            if self.secret and now - used["rotated_at"] <= self.reuse_grace:
+                # Another tab refreshed with the same token a moment ago
+                return await self._grace_successor(refresh_token, used)
+            # A rotated token came back: someone else holds a copy of it
+            logger.warning(f"Refresh token reuse detected, revoking session {used['session_id']}")
+            await self.revoke(used["session_id"])
+            return None
+
+        if await self.is_revoked(record["session_id"]):
+            return None
+
+        # The session keeps its original expiry; rotation does not extend it forever
+        new_token = await self._issue(
+            record["session_id"], record["user_id"], record["expires_at"], self._successor(refresh_token)
+        )
+        return {"session_id": record["session_id"], "user_id": record["user_id"], "refresh_token": new_token}
+
+    async def _grace_successor(self, refresh_token: str, used: Dict) -> Optional[Dict]:
+        """The successor the concurrent rotation issued, while it is still unused"""
+        successor = self._successor(refresh_token)
+        # The winning request may not have inserted it yet
+        for _ in range(5):
+            current = await self.db.auth_sessions.find_one(
+                {"_id": hash_token(successor), "rotated_at": None, "expires_at": {"$gt": datetime.utcnow()}},
+                {"_id": 1}
+            )
+            if current:
+                if await self.is_revoked(used["session_id"]):
+                    return None
+                return {"session_id": used["session_id"], "user_id": used["user_id"], "refresh_token": successor}
+            await asyncio.sleep(0.1)
+        return None
+
+    async def revoke(self, session_id: str):
+        now = datetime.utcnow()
+        try:
+            await self.db.auth_session_revocations.insert_one({
+                "_id": session_id,
+                "revoked_at": now,
+                # Access tokens of the session are long expired by then
+                "expires_at": now + self.ttl
+            })
+        except DuplicateKeyError:
+            pass
+        await self.db.auth_sessions.delete_many({"session_id": session_id})
+        self.revoked.add(session_id)
+
+    async def revoke_token(self, refresh_token: str) -> bool:
+        """Log out the session a refresh token belongs to"""
+        record = await self.db.auth_sessions.find_one({"_id": hash_token(refresh_token)}, {"session_id": 1})
+        if not record:
+            return False
+        await self.revoke(record["session_id"])
+        return True
+
+    async def is_revoked(self, session_id: str) -> bool:
+        """In-memory check; only Bloom filter hits are confirmed against Mongo"""
+        if session_id not in self.revoked:
+            return False
+        return await self.db.auth_session_revocations.find_one({"_id": session_id}, {"_id": 1}) is not None
+
+    async def sync(self):
+        """Pull revocations made by other workers; rebuild hourly so expired ones drop out"""
+        now = datetime.utcnow()
+        if self._rebuilt_at is None or now - self._rebuilt_at > timedelta(hours=1):
+            revoked = BloomFilter(self.bloom_capacity)
+            async for revocation in self.db.auth_session_revocations.find({}, {"_id": 1}):
+                revoked.add(revocation["_id"])
+            if revoked.count > self.bloom_capacity:
+                logger.warning(f"{revoked.count} revoked sessions exceed the Bloom filter capacity")
+            self.revoked = revoked
+            self._rebuilt_at = now
+        else:
+            # Overlap by a few seconds so revocations written during the last sync are not missed
+            since = self._synced_at - timedelta(seconds=5)
+            async for revocation in self.db.auth_session_revocations.find({"revoked_at": {"$gte": since}}, {"_id": 1}):
+                self.revoked.add(revocation["_id"])
+        self._synced_at = now
+
+    async def _loop(self):
+        while True:
+            try:
+                await self.sync()
+            except Exception as e:
+                logger.error(f"Session revocation sync error: {str(e)}")
+            await asyncio.sleep(self.sync_interval)
+
+    def start(self):
+        if self._loop_task is None:
+            self._loop_task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        if self._loop_task:
+            self._loop_task.cancel()
+            self._loop_task = None
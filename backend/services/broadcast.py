@@ -0,0 +1,49 @@
+from typing import Dict, List, Optional
+
+
+class BroadcastTargetNotFound(LookupError):
+    """The sender or the team/project of a broadcast does not exist"""
+
+
+class TeamBroadcaster:
+    """Sends a WhatsApp message from one user to everyone on their team or project"""
+
+    def __init__(self, db, outbox):
+        self.db = db
+        self.outbox = outbox
+
+    async def _member_query(self, sender: Dict, team_id: Optional[str]) -> Dict:
+        if team_id:
+            # Members of a specific project
+            project = await self.db.projects.find_one({"id": team_id}, {"_id": 0, "team_members": 1})
+            if not project:
+                raise BroadcastTargetNotFound("Team/Project not found")
+            return {"id": {"$in": project.get("team_members", [])}}
+
+        # Everyone else in the sender's company
+        return {"company_id": sender.get("company_id"), "id": {"$ne": sender["id"]}}
+
+    async def broadcast(self, sender_id: str, message: str, team_id: Optional[str] = None) -> Dict:
+        sender = await self.db.users.find_one({"id": sender_id}, {"_id": 0, "id": 1, "name": 1, "company_id": 1})
+        if not sender:
+            raise BroadcastTargetNotFound("Sender not found")
+
+        # One query for all members, only the fields needed to address them
+        members: List[Dict] = await self.db.users.find(
+            await self._member_query(sender, team_id),
+            {"_id": 0, "id": 1, "phone_number": 1}
+        ).to_list(None if team_id else 100)
+
+        recipients = list(dict.fromkeys(
+            member["phone_number"] for member in members if member.get("phone_number")
+        ))
+
+        formatted_message = f"📢 *Team Message from {sender['name']}:*\n\n{message}"
+        queued = await self.outbox.enqueue_many(recipients, formatted_message, "team_message")
+
+        return {
+            "success": True,
+            "sent_count": queued,
+            "failed_count": 0,
+            "total_members": len(members)
+        }
@@ -0,0 +1,287 @@
+from pymongo import ASCENDING
+from pymongo.errors import OperationFailure
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Set, Tuple
+import asyncio
+import logging
+
+from services.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Collection -> event name prefix
+WATCHED_COLLECTIONS = {"tasks": "task", "projects": "project"}
+
+# Mongo error codes meaning change streams are unavailable (standalone server)
+CHANGE_STREAM_UNSUPPORTED = {40573, 40324}
+
+# User fields held by the cached auth/WhatsApp profiles. Counter writes
+# (stats flushes, performance_score, last_login) leave the caches valid.
+USER_PROFILE_FIELDS = (
+    "name", "email", "phone_number", "role", "company_id",
+    "timezone", "reminder_time", "reminders_enabled"
+)
+
+
+def _jsonable(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items() if key != "_id"}
+    if isinstance(value, list):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+class ChangeFeed:
+    """
+    Fans out task/project changes to connected clients. Uses Mongo change
+    streams when the server is a replica set and falls back to polling
+    updated_at and the sync tombstones on a standalone server. Each subscriber only sees
+    changes for their own tasks or their company's.
+    """
+
+    def __init__(self, db, poll_interval: float = 2.0, queue_size: int = 100, poll_batch: int = 1000):
+        self.db = db
+        self.poll_interval = poll_interval
+        self.poll_batch = poll_batch
+        self.poll_settle = timedelta(seconds=2)
+        self.queue_size = queue_size
+        self.mode: Optional[str] = None
+        self.subscribers: Dict[asyncio.Queue, Tuple[str, Optional[str]]] = {}
+        self.user_companies = LRUCache(max_size=10000, ttl_seconds=300)
+        # Deletes only carry _id, so remember who could see each document
+        self.audiences = LRUCache(max_size=50000, ttl_seconds=3600)
+        self.user_listeners: List[Callable[[str], None]] = []
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def ensure_indexes(self):
+        for collection in WATCHED_COLLECTIONS:
+            await self.db[collection].create_index([("updated_at", ASCENDING)], name="updated_at")
+            await self.db[collection].create_index([("created_at", ASCENDING)], name="created_at")
+        # Polling reads sync tombstones in deletion order
+        await self.db.deleted_records.create_index(
+            [("collection", ASCENDING), ("deleted_at", ASCENDING), ("id", ASCENDING)],
+            name="collection_deleted_at_id"
+        )
+
+    def subscribe(self, user_id: str, company_id: Optional[str]) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self.subscribers[queue] = (user_id, company_id)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self.subscribers.pop(queue, None)
+
+    async def _companies_of(self, user_ids: Set[str]) -> Set[str]:
+        companies = set()
+        missing = []
+        for user_id in user_ids:
+            cached = self.user_companies.get(user_id)
+            if cached is None:
+                missing.append(user_id)
+            elif cached:
+                companies.add(cached)
+
+        if missing:
+            users = await self.db.users.find(
+                {"id": {"$in": missing}},
+                {"_id": 0, "id": 1, "company_id": 1}
+            ).to_list(None)
+            for user in users:
+                self.user_companies.set(user["id"], user.get("company_id") or "")
+                if user.get("company_id"):
+                    companies.add(user["company_id"])
+        return companies
+
+    async def _audience(self, collection: str, document: Dict) -> Tuple[Set[str], Set[str]]:
+        """(user ids, company ids) allowed to see a document"""
+        if collection == "tasks":
+            user_ids = {document.get("assigned_to"), document.get("assigned_by")}
+        else:
+            user_ids = {document.get("owner_id"), *document.get("team_members", [])}
+        user_ids.discard(None)
+
+        if document.get("company_id"):
+            company_ids = {document["company_id"]}
+        else:
+            company_ids = await self._companies_of(user_ids)
+        return user_ids, company_ids
+
+    def _publish(self, event: Dict, user_ids: Set[str], company_ids: Set[str]):
+        for queue, (user_id, company_id) in list(self.subscribers.items()):
+            if user_id not in user_ids and not (company_id and company_id in company_ids):
+                continue
+            if queue.full():
+                # Client fell too far behind; tell it to reload instead of replaying
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"type": "resync"})
+            else:
+                queue.put_nowait(event)
+
+    async def _handle_change(self, collection: str, change: Dict):
+        kind = WATCHED_COLLECTIONS[collection]
+        operation = change["operationType"]
+        key = (collection, str(change["documentKey"]["_id"]))
+
+        if operation == "delete":
+            remembered = self.audiences.get(key)
+            if remembered:
+                document_id, user_ids, company_ids = remembered
+                self.audiences.invalidate(key)
+                self._publish({"type": f"{kind}.deleted", "id": document_id}, user_ids, company_ids)
+            return
+
+        document = change.get("fullDocument")
+        if not document:
+            return  # Deleted again before the lookup
+
+        user_ids, company_ids = await self._audience(collection, document)
+        self.audiences.set(key, (document.get("id"), user_ids, company_ids))
+
+        if operation == "update":
+            description = change.get("updateDescription", {})
+            event = {
+                "type": f"{kind}.updated",
+                "id": document.get("id"),
+                "changes": _jsonable(description.get("updatedFields", {})),
+                "removed": description.get("removedFields", [])
+            }
+        else:
+            event = {"type": f"{kind}.created" if operation == "insert" else f"{kind}.updated",
+                     "id": document.get("id"), kind: _jsonable(document)}
+
+        self._publish(event, user_ids, company_ids)
+
+    async def _watch(self, collection: str):
+        resume_token = None
+        while True:
+            try:
+                async with self.db[collection].watch(
+                    [{"$match": {"operationType": {"$in": ["insert", "update", "replace", "delete"]}}}],
+                    full_document="updateLookup",
+                    resume_after=resume_token
+                ) as stream:
+                    async for change in stream:
+                        resume_token = stream.resume_token
+                        await self._handle_change(collection, change)
+            except OperationFailure as e:
+                if e.code in CHANGE_STREAM_UNSUPPORTED:
+                    raise
+                logger.error(f"Change stream on {collection} failed, resuming: {str(e)}")
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Change stream on {collection} error: {str(e)}")
+                await asyncio.sleep(1)
+
+    async def _poll_page(self, collection: str, field: str, query: Dict, position: List) -> List[Dict]:
+        """The next batch after position ([timestamp, id]) in (field, id) order"""
+        since, after_id = position
+        # Writes stamped just before the read may not be visible yet; leave
+        # the newest moments for the next poll so none is skipped
+        return await self.db[collection].find({
+            **query,
+            field: {"$lt": datetime.utcnow() - self.poll_settle},
+            "$or": [{field: {"$gt": since}}, {field: since, "id": {"$gt": after_id}}]
+        }).sort([(field, ASCENDING), ("id", ASCENDING)]).limit(self.poll_batch).to_list(self.poll_batch)
+
+    async def _poll(self, collection: str):
+        kind = WATCHED_COLLECTIONS[collection]
+        # Every write stamps updated_at; deletions come from the sync tombstones
+        position = deleted_position = [datetime.utcnow() - self.poll_settle, ""]
+        while True:
+            has_more = False
+            try:
+                documents = await self._poll_page(collection, "updated_at", {}, position)
+                for document in documents:
+                    user_ids, company_ids = await self._audience(collection, document)
+                    self._publish({"type": f"{kind}.updated", "id": document.get("id"), kind: _jsonable(document)},
+                                  user_ids, company_ids)
+                    # Only advance past what was actually published
+                    position = [document["updated_at"], document.get("id") or ""]
+
+                tombstones = await self._poll_page(
+                    "deleted_records", "deleted_at", {"collection": collection}, deleted_position
+                )
+                for tombstone in tombstones:
+                    user_ids = set(tombstone.get("user_ids", []))
+                    if tombstone.get("company_id"):
+                        company_ids = {tombstone["company_id"]}
+                    else:
+                        company_ids = await self._companies_of(user_ids)
+                    self._publish({"type": f"{kind}.deleted", "id": tombstone["id"]}, user_ids, company_ids)
+                    deleted_position = [tombstone["deleted_at"], tombstone["id"]]
+
+                has_more = len(documents) == self.poll_batch or len(tombstones) == self.poll_batch
+            except Exception as e:
+                logger.error(f"Change polling on {collection} error: {str(e)}")
+
+            # A full batch means there is a backlog; keep going without waiting
+            if not has_more:
+                await asyncio.sleep(self.poll_interval)
+
+    def on_user_change(self, listener: Callable[[str], None]):
+        """Call listener(user_id) whenever a user's profile fields change (change streams only)"""
+        self.user_listeners.append(listener)
+
+    async def _watch_users(self):
+        resume_token = None
+        while True:
+            try:
+                async with self.db.users.watch(
+                    [
+                        {"$match": {"$or": [
+                            {"operationType": {"$in": ["insert", "replace", "delete"]}},
+                            {"operationType": "update", "$or": [
+                                *({f"updateDescription.updatedFields.{field}": {"$exists": True}}
+                                  for field in USER_PROFILE_FIELDS),
+                                {"updateDescription.removedFields": {"$in": list(USER_PROFILE_FIELDS)}}
+                            ]}
+                        ]}},
+                        {"$project": {"operationType": 1, "documentKey": 1, "fullDocument.id": 1}}
+                    ],
+                    full_document="updateLookup",
+                    resume_after=resume_token
+                ) as stream:
+                    async for change in stream:
+                        resume_token = stream.resume_token
+                        user_id = (change.get("fullDocument") or {}).get("id")
+                        for listener in self.user_listeners:
+                            listener(user_id)
+            except OperationFailure as e:
+                if e.code in CHANGE_STREAM_UNSUPPORTED:
+                    return  # Standalone server: caches fall back to their TTLs
+                logger.error(f"User change stream failed, resuming: {str(e)}")
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"User change stream error: {str(e)}")
+                await asyncio.sleep(1)
+
+    async def _run(self, collection: str):
+        try:
+            self.mode = "change_stream"
+            await self._watch(collection)
+        except OperationFailure:
+            logger.info(f"Change streams unavailable, polling {collection} every {self.poll_interval}s")
+            self.mode = "polling"
+            await self._poll(collection)
+
+    def start(self):
+        if not self._tasks:
+            for collection in WATCHED_COLLECTIONS:
+                task = asyncio.create_task(self._run(collection))
+                self._tasks.add(task)
+            if self.user_listeners:
+                self._tasks.add(asyncio.create_task(self._watch_users()))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
@@ -0,0 +1,141 @@
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+class CommandArgumentError(ValueError):
+    """Raised by an argument parser when a command's arguments are missing or malformed"""
+
+
+# Argument parsers turn the text after a command prefix into typed handler kwargs
+
+def text_arg(name: str) -> Callable[[str], Dict]:
+    """The remaining text as a required string argument"""
+    def parse(rest: str) -> Dict:
+        value = rest.strip()
+        if not value:
+            raise CommandArgumentError(name)
+        return {name: value}
+    return parse
+
+
+def int_arg(name: str) -> Callable[[str], Dict]:
+    """The first whole number in the remaining text"""
+    def parse(rest: str) -> Dict:
+        for word in rest.split():
+            if word.isdigit():
+                return {name: int(word)}
+        raise CommandArgumentError(name)
+    return parse
+
+
+def split_arg(first: str, second: str, separator: str = ":") -> Callable[[str], Dict]:
+    """Two required string arguments separated by `separator` ("john: review docs")"""
+    def parse(rest: str) -> Dict:
+        parts = rest.split(separator, 1)
+        if len(parts) != 2 or not parts[0].strip() or not parts[1].strip():
+            raise CommandArgumentError(f"{first}{separator}{second}")
+        return {first: parts[0].strip(), second: parts[1].strip()}
+    return parse
+
+
+class Command:
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[..., Awaitable[str]],
+        parser: Optional[Callable[[str], Dict]] = None,
+        usage: Optional[str] = None
+    ):
+        self.name = name
+        self.handler = handler
+        self.parser = parser
+        self.usage = usage
+
+
+class CommandRouter:
+    """
+    Declarative chat command registry. Exact phrases resolve with one dict
+    lookup; prefixes are bucketed by their leading characters so only the few
+    prefixes sharing a message's opening are checked (longest prefix wins).
+    Matching cost therefore does not grow with the number of commands.
+    """
+
+    def __init__(self, fallback: Optional[Callable[..., Awaitable[str]]] = None):
+        self.fallback = fallback
+        self.commands: List[Command] = []
+        self.phrases: Dict[str, Command] = {}
+        self.prefixes: Dict[str, Command] = {}
+        self.key_length = 0
+        self.buckets: Dict[str, List[Tuple[str, Command]]] = {}
+
+    def _add_to_bucket(self, prefix: str, command: Command):
+        bucket = self.buckets.setdefault(prefix[:self.key_length], [])
+        bucket.append((prefix, command))
+        bucket.sort(key=lambda entry: -len(entry[0]))  # Longest prefix first
+
+    def _add_prefix(self, prefix: str, command: Command):
+        if not prefix or prefix in self.prefixes:
+            raise ValueError(f"Prefix '{prefix}' is empty or already registered")
+        self.prefixes[prefix] = command
+
+        if self.key_length and len(prefix) >= self.key_length:
+            self._add_to_bucket(prefix, command)
+            return
+
+        # A shorter prefix changes the bucket key, so regroup everything
+        self.key_length = len(prefix)
+        self.buckets = {}
+        for existing, existing_command in self.prefixes.items():
+            self._add_to_bucket(existing, existing_command)
+
+    def register(
+        self,
+        name: str,
+        handler: Callable[..., Awaitable[str]],
+        phrases: Tuple[str, ...] = (),
+        prefixes: Tuple[str, ...] = (),
+        parser: Optional[Callable[[str], Dict]] = None,
+        usage: Optional[str] = None
+    ) -> Command:
+        command = Command(name, handler, parser, usage)
+        for phrase in phrases:
+            if phrase in self.phrases:
+                raise ValueError(f"Phrase '{phrase}' is already registered by {self.phrases[phrase].name}")
+            self.phrases[phrase] = command
+        for prefix in prefixes:
+            self._add_prefix(prefix, command)
+        self.commands.append(command)
+        return command
+
+    def command(self, name: str, phrases: Tuple[str, ...] = (), prefixes: Tuple[str, ...] = (),
+                parser: Optional[Callable[[str], Dict]] = None, usage: Optional[str] = None):
+        """Decorator form of register()"""
+        def decorator(handler):
+            self.register(name, handler, phrases, prefixes, parser, usage)
+            return handler
+        return decorator
+
+    def match(self, text: str) -> Tuple[Optional[Command], str]:
+        """Resolve a (lowercased, stripped) message to its command and the text after the prefix"""
+        command = self.phrases.get(text)
+        if command:
+            return command, ""
+
+        for prefix, command in self.buckets.get(text[:self.key_length], ()):
+            if text.startswith(prefix):
+                return command, text[len(prefix):]
+
+        return None, text
+
+    async def dispatch(self, user, text: str) -> str:
+        command, rest = self.match(text)
+        if command is None:
+            return await self.fallback(user, text)
+
+        kwargs = {}
+        if command.parser:
+            try:
+                kwargs = command.parser(rest)
+            except CommandArgumentError:
+                return command.usage or f"📝 Missing details for *{command.name}*"
+
+        return await command.handler(user, **kwargs)
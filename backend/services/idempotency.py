@@ -0,0 +1,103 @@
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+import asyncio
+
+PROCESSING = "processing"
+COMPLETED = "completed"
+
+
+class InboundMessageStore:
+    """
+    Idempotency store for inbound WhatsApp messages keyed by the sidecar's
+    message_id. The first delivery claims the id and records its reply;
+    redeliveries get the recorded reply without running the command again.
+    A claim left in processing longer than claim_timeout (a worker that died
+    mid-command) may be taken over by the next redelivery.
+    """
+
+    def __init__(
+        self,
+        db,
+        ttl: timedelta = timedelta(days=2),
+        wait_timeout: float = 10.0,
+        claim_timeout: timedelta = timedelta(seconds=60)
+    ):
+        self.db = db
+        self.ttl = ttl
+        self.wait_timeout = wait_timeout
+        self.claim_timeout = claim_timeout
+
+    async def ensure_indexes(self):
+        await self.db.inbound_messages.create_index(
+            [("message_id", ASCENDING)],
+            unique=True,
+            name="message_id_unique"
+        )
+        await self.db.inbound_messages.create_index(
+            [("created_at", ASCENDING)],
+            expireAfterSeconds=int(self.ttl.total_seconds()),
+            name="created_at_ttl"
+        )
+
+    async def claim(self, message_id: str, phone_number: str) -> Optional[Dict]:
+        """
+        Claim a message for processing. Returns None when this call owns it,
+        otherwise the existing record of the earlier delivery.
+        """
+        now = datetime.utcnow()
+        try:
+            await self.db.inbound_messages.insert_one({
+                "message_id": message_id,
+                "phone_number": phone_number,
+                "status": PROCESSING,
+                "reply": None,
+                "created_at": now,
+                "claimed_at": now
+            })
+            return None
+        except DuplicateKeyError:
+            pass
+
+        # Take over a stale claim; the claimed_at guard lets only one redelivery win
+        cutoff = now - self.claim_timeout
+        taken = await self.db.inbound_messages.find_one_and_update(
+            {
+                "message_id": message_id,
+                "status": PROCESSING,
+                "$or": [{"claimed_at": {"$lt": cutoff}}, {"claimed_at": {"$exists": False}}]
+            },
+            {"$set": {"claimed_at": now}},
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER
+        )
+        if taken:
+            return None
+
+        return await self.db.inbound_messages.find_one({"message_id": message_id}, {"_id": 0})
+
+    async def wait_for_reply(self, message_id: str, record: Dict) -> Optional[Dict]:
+        """Wait for a concurrent delivery of the same message to finish processing"""
+        deadline = asyncio.get_event_loop().time() + self.wait_timeout
+        while record and record.get("status") == PROCESSING:
+            if asyncio.get_event_loop().time() >= deadline:
+                break
+            await asyncio.sleep(0.25)
+            record = await self.db.inbound_messages.find_one({"message_id": message_id}, {"_id": 0})
+        return record
+
+    async def complete(self, message_id: str, reply: Optional[str], success: bool = True):
+        await self.db.inbound_messages.update_one(
+            {"message_id": message_id},
+            {"$set": {
+                "status": COMPLETED,
+                "reply": reply,
+                "success": success,
+                "completed_at": datetime.utcnow()
+            }}
+        )
+
+    async def release(self, message_id: str):
+        """Forget a failed message so a redelivery runs the command again"""
+        await self.db.inbound_messages.delete_one({"message_id": message_id, "status": PROCESSING})
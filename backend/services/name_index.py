@@ -0,0 +1,173 @@
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+import heapq
+import re
+import unicodedata
+
+# Scores for the ways a query can match a member name
+EXACT_NAME_SCORE = 100.0
+ALL_TOKENS_SCORE = 90.0
+TOKEN_PREFIX_SCORE = 70.0
+TRIGRAM_SCORE = 60.0  # Scaled by trigram similarity
+
+MIN_TRIGRAM_SIMILARITY = 0.3
+AMBIGUITY_MARGIN = 10.0
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, strip accents and punctuation, collapse whitespace"""
+    decomposed = unicodedata.normalize("NFKD", name or "")
+    ascii_name = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", ascii_name.lower()).split())
+
+
+def trigrams(text: str) -> set:
+    """Character trigrams of each token, padded so short names still produce some"""
+    grams = set()
+    for token in text.split():
+        padded = f"  {token} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class NameMatch:
+    def __init__(self, member: Dict, score: float):
+        self.member = member
+        self.score = score
+
+
+class CompanyNameIndex:
+    """In-memory token + trigram index over one company's member names"""
+
+    def __init__(self, members: List[Dict]):
+        self.members = members
+        self.names = [normalize_name(member.get("name", "")) for member in members]
+        self.exact: Dict[str, List[int]] = {}
+        self.tokens: Dict[str, List[int]] = {}
+        self.grams: Dict[str, List[int]] = {}
+        self.gram_counts: List[int] = []
+
+        for position, name in enumerate(self.names):
+            self.exact.setdefault(name, []).append(position)
+            for token in set(name.split()):
+                self.tokens.setdefault(token, []).append(position)
+            member_grams = trigrams(name)
+            self.gram_counts.append(len(member_grams))
+            for gram in member_grams:
+                self.grams.setdefault(gram, []).append(position)
+
+        self.sorted_tokens = sorted(self.tokens)
+        self.prefix_cache: Dict[str, frozenset] = {}
+        self.search_cache: Dict[Tuple[str, int], List["NameMatch"]] = {}
+
+    def _prefix_positions(self, prefix: str) -> frozenset:
+        positions = self.prefix_cache.get(prefix)
+        if positions is None:
+            found = set()
+            start = bisect_left(self.sorted_tokens, prefix)
+            for token in self.sorted_tokens[start:]:
+                if not token.startswith(prefix):
+                    break
+                found.update(self.tokens[token])
+            positions = self.prefix_cache[prefix] = frozenset(found)
+        return positions
+
+    def search(self, query: str, limit: int = 5) -> List[NameMatch]:
+        """Ranked fuzzy matches for a (partial or misspelled) name"""
+        normalized = normalize_name(query)
+        if not normalized:
+            return []
+
+        # The index never changes after it is built, so results can be memoized
+        cache_key = (normalized, limit)
+        cached = self.search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        matches = self._search(normalized, limit)
+        if len(self.search_cache) >= 1024:
+            self.search_cache.clear()
+        self.search_cache[cache_key] = matches
+        return matches
+
+    def _search(self, normalized: str, limit: int) -> List[NameMatch]:
+        scores: Dict[int, float] = {}
+
+        for position in self.exact.get(normalized, ()):
+            scores[position] = EXACT_NAME_SCORE
+
+        # Every query token is a whole token of the name ("john" -> "John Smith")
+        query_tokens = normalized.split()
+        token_sets = [set(self.tokens.get(token, ())) for token in query_tokens]
+        for position in set.intersection(*token_sets):
+            scores.setdefault(position, ALL_TOKENS_SCORE)
+
+        # Every query token starts a token of the name ("jo sm" -> "John Smith")
+        prefix_sets = [self._prefix_positions(token) for token in query_tokens]
+        for position in frozenset.intersection(*prefix_sets):
+            scores.setdefault(position, TOKEN_PREFIX_SCORE)
+
+        if scores:
+            return self._ranked(scores, limit)
+
+        # No structural match, so assume a typo: Dice similarity over shared trigrams
+        query_grams = trigrams(normalized)
+        shared: Dict[int, int] = {}
+        for gram in query_grams:
+            for position in self.grams.get(gram, ()):
+                shared[position] = shared.get(position, 0) + 1
+        for position, count in shared.items():
+            similarity = 2 * count / (len(query_grams) + self.gram_counts[position])
+            if similarity >= MIN_TRIGRAM_SIMILARITY:
+                scores[position] = TRIGRAM_SCORE * similarity
+
+        return self._ranked(scores, limit)
+
+    def _ranked(self, scores: Dict[int, float], limit: int) -> List[NameMatch]:
+        ranked = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], self.names[item[0]]))
+        return [NameMatch(self.members[position], round(score, 1)) for position, score in ranked]
+
+    def resolve(self, query: str, limit: int = 5) -> Tuple[Optional[Dict], List[NameMatch]]:
+        """
+        Return (member, matches). member is set only when one match clearly wins;
+        otherwise the caller should ask the user to pick from matches.
+        """
+        matches = self.search(query, limit)
+        if not matches:
+            return None, []
+
+        best = matches[0]
+        if best.score == EXACT_NAME_SCORE and (len(matches) == 1 or matches[1].score < EXACT_NAME_SCORE):
+            return best.member, matches
+        if len(matches) == 1 or matches[1].score <= best.score - AMBIGUITY_MARGIN:
+            return best.member, matches
+        return None, matches
+
+
+class TeamNameIndex:
+    """Per-company CompanyNameIndex cache, rebuilt on demand after user changes or TTL expiry"""
+
+    def __init__(self, db, ttl: timedelta = timedelta(minutes=10)):
+        self.db = db
+        self.ttl = ttl
+        self.indexes: Dict[Optional[str], Tuple[datetime, CompanyNameIndex]] = {}
+
+    async def get(self, company_id: Optional[str]) -> CompanyNameIndex:
+        cached = self.indexes.get(company_id)
+        if cached and datetime.utcnow() - cached[0] < self.ttl:
+            return cached[1]
+
+        members = await self.db.users.find(
+            {"company_id": company_id},
+            {"_id": 0, "id": 1, "name": 1, "phone_number": 1, "role": 1}
+        ).to_list(None)
+        index = CompanyNameIndex(members)
+        self.indexes[company_id] = (datetime.utcnow(), index)
+        return index
+
+    def invalidate(self, company_id: Optional[str] = None, all_companies: bool = False):
+        if all_companies:
+            self.indexes.clear()
+        else:
+            self.indexes.pop(company_id, None)
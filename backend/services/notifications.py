@@ -0,0 +1,381 @@
+from pymongo import ASCENDING
+from pymongo.errors import DuplicateKeyError
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+import asyncio
+import logging
+import os
+import random
+import socket
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# Digest headers per notification kind
+DIGEST_HEADERS = {
+    "task_assigned": "📋 *{count} New Tasks Assigned!*",
+    "task_completed": "✅ *{count} Tasks Completed!*",
+    "task_overdue": "🔥 *{count} Tasks Are Now Overdue!*"
+}
+
+# Outbox message states
+PENDING = "pending"
+SENDING = "sending"
+DELIVERED = "delivered"
+DEAD_LETTER = "dead_letter"
+
+
+def build_digest(notifications: List[Dict]) -> str:
+    """Render one message for a batch of notifications (dicts with kind, message, summary)"""
+    if len(notifications) == 1:
+        return notifications[0]["message"]
+
+    kinds = {n["kind"] for n in notifications}
+    if len(kinds) == 1:
+        header = DIGEST_HEADERS.get(notifications[0]["kind"], "🔔 *{count} Updates*")
+    else:
+        header = "🔔 *{count} Updates*"
+
+    message = header.format(count=len(notifications)) + "\n\n"
+    for i, notification in enumerate(notifications, 1):
+        message += f"{i}. {notification.get('summary') or notification['message']}\n"
+    message += "\nReply with *list tasks* to see all tasks"
+    return message
+
+
+class NotificationOutbox:
+    """
+    Durable WhatsApp outbox. Notifications are stored in Mongo and drained by
+    a dispatcher that keeps per-recipient order, coalesces digestible
+    notifications, retries with jittered exponential backoff and dead-letters
+    messages that keep failing.
+    """
+
+    def __init__(
+        self,
+        db,
+        send: Callable[[str, str], Awaitable[bool]],
+        digest_window: timedelta = timedelta(seconds=60),
+        max_batch: int = 25,
+        max_attempts: int = 8,
+        base_delay: timedelta = timedelta(seconds=5),
+        max_delay: timedelta = timedelta(minutes=30),
+        poll_interval: float = 5.0,
+        max_concurrency: int = 10,
+        lock_ttl: timedelta = timedelta(minutes=2)
+    ):
+        self.db = db
+        self.send = send
+        self.digest_window = digest_window
+        self.max_batch = max_batch
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.lock_ttl = lock_ttl
+        self.owner_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self._wakeup = asyncio.Event()
+        self._loop_task: Optional[asyncio.Task] = None
+        self._supports_transactions: Optional[bool] = None
+
+    async def ensure_indexes(self):
+        await self.db.notification_outbox.create_index(
+            [("status", ASCENDING), ("next_attempt_at", ASCENDING)],
+            name="status_next_attempt_at"
+        )
+        await self.db.notification_outbox.create_index(
+            [("recipient", ASCENDING), ("status", ASCENDING), ("created_at", ASCENDING)],
+            name="recipient_status_created_at"
+        )
+        await self.db.notification_outbox.create_index(
+            [("task_id", ASCENDING), ("created_at", ASCENDING)],
+            name="task_id_created_at"
+        )
+        # Delivered messages are kept for 30 days for delivery lookups
+        await self.db.notification_outbox.create_index(
+            [("delivered_at", ASCENDING)],
+            expireAfterSeconds=30 * 24 * 3600,
+            name="delivered_ttl"
+        )
+        await self.db.notification_outbox_locks.create_index(
+            [("expires_at", ASCENDING)],
+            expireAfterSeconds=0,
+            name="lock_ttl"
+        )
+
+    async def _transactions_available(self) -> bool:
+        # Multi-document transactions need a replica set or a sharded cluster
+        if self._supports_transactions is None:
+            try:
+                hello = await self.db.client.admin.command("hello")
+                self._supports_transactions = bool(hello.get("setName")) or hello.get("msg") == "isdbgrid"
+            except Exception as e:
+                # Not cached, so the next write checks again
+                logger.warning(f"Could not detect transaction support: {str(e)}")
+                return False
+        return self._supports_transactions
+
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Session for writing a task and its notifications atomically. Yields a
+        session inside a transaction on replica sets and None on a standalone
+        server, where the writes simply happen one after another.
+        """
+        if not await self._transactions_available():
+            yield None
+            return
+
+        async with await self.db.client.start_session() as session:
+            async with session.start_transaction():
+                yield session
+        # Committed: let the dispatcher see the new notifications right away
+        self._wakeup.set()
+
+    async def enqueue(
+        self,
+        recipient: str,
+        message: str,
+        kind: str,
+        summary: Optional[str] = None,
+        task_id: Optional[str] = None,
+        urgent: bool = False,
+        session=None
+    ) -> Dict:
+        """
+        Store a notification for delivery. Notifications with a summary wait
+        for the digest window so bursts go out as one message; urgent ones
+        are sent right away together with anything already waiting.
+        Pass the session from transaction() to commit it with a task write.
+        """
+        now = datetime.utcnow()
+        digestible = bool(summary) and not urgent
+        next_attempt_at = now
+        if digestible:
+            # The digest window opens with the first notification of a burst;
+            # later ones join it instead of pushing delivery further out
+            waiting = await self.db.notification_outbox.find_one(
+                {"recipient": recipient, "status": PENDING, "attempts": 0, "summary": {"$nin": [None, ""]}},
+                {"_id": 0, "next_attempt_at": 1},
+                sort=[("next_attempt_at", ASCENDING)],
+                session=session
+            )
+            next_attempt_at = waiting["next_attempt_at"] if waiting else now + self.digest_window
+        notification = {
+            "id": str(uuid.uuid4()),
+            "recipient": recipient,
+            "kind": kind,
+            "message": message,
+            "summary": summary,
+            "task_id": task_id,
+            "status": PENDING,
+            "attempts": 0,
+            "last_error": None,
+            "created_at": now,
+            "next_attempt_at": next_attempt_at,
+            "delivered_at": None
+        }
+        await self.db.notification_outbox.insert_one(notification, session=session)
+
+        if not digestible:
+            # Preserve order: earlier notifications waiting for a digest go first
+            await self.db.notification_outbox.update_many(
+                {"recipient": recipient, "status": PENDING, "attempts": 0, "next_attempt_at": {"$gt": now}},
+                {"$set": {"next_attempt_at": now}},
+                session=session
+            )
+            self._wakeup.set()
+
+        notification.pop("_id", None)
+        return notification
+
+    async def enqueue_many(self, recipients: List[str], message: str, kind: str, task_id: Optional[str] = None) -> int:
+        """Store the same immediate notification for many recipients with one insert"""
+        if not recipients:
+            return 0
+
+        now = datetime.utcnow()
+        await self.db.notification_outbox.insert_many([
+            {
+                "id": str(uuid.uuid4()),
+                "recipient": recipient,
+                "kind": kind,
+                "message": message,
+                "summary": None,
+                "task_id": task_id,
+                "status": PENDING,
+                "attempts": 0,
+                "last_error": None,
+                "created_at": now,
+                "next_attempt_at": now,
+                "delivered_at": None
+            }
+            for recipient in recipients
+        ], ordered=False)
+
+        # Preserve order: earlier notifications waiting for a digest go first
+        await self.db.notification_outbox.update_many(
+            {"recipient": {"$in": recipients}, "status": PENDING, "attempts": 0, "next_attempt_at": {"$gt": now}},
+            {"$set": {"next_attempt_at": now}}
+        )
+        self._wakeup.set()
+        return len(recipients)
+
+    def _backoff(self, attempts: int) -> timedelta:
+        """Exponential backoff with equal jitter so retries do not line up"""
+        delay = min(self.max_delay.total_seconds(), self.base_delay.total_seconds() * (2 ** (attempts - 1)))
+        return timedelta(seconds=delay / 2 + random.uniform(0, delay / 2))
+
+    async def _acquire_recipient(self, recipient: str) -> bool:
+        now = datetime.utcnow()
+        try:
+            await self.db.notification_outbox_locks.insert_one({
+                "_id": recipient,
+                "owner": self.owner_id,
+                "expires_at": now + self.lock_ttl
+            })
+            return True
+        except DuplicateKeyError:
+            return False
+
+    async def _release_recipient(self, recipient: str):
+        await self.db.notification_outbox_locks.delete_one({"_id": recipient, "owner": self.owner_id})
+
+    async def _deliver_recipient(self, recipient: str) -> int:
+        """Send the recipient's due notifications in creation order; returns the number delivered"""
+        async with self.semaphore:
+            if not await self._acquire_recipient(recipient):
+                return 0  # Another worker is delivering to this recipient
+
+            try:
+                now = datetime.utcnow()
+                queued = await self.db.notification_outbox.find(
+                    {"recipient": recipient, "status": PENDING},
+                    {"_id": 0}
+                ).sort("created_at", ASCENDING).limit(self.max_batch).to_list(self.max_batch)
+
+                # Nothing overtakes the oldest notification while it waits for a retry.
+                # Notifications without a summary are sent on their own; otherwise every
+                # due notification with a summary goes out together as one digest
+                if not queued or queued[0]["next_attempt_at"] > now:
+                    return 0
+                if queued[0].get("summary"):
+                    batch = [
+                        notification for notification in queued
+                        if notification.get("summary") and notification["next_attempt_at"] <= now
+                    ]
+                else:
+                    batch = queued[:1]
+
+                ids = [notification["id"] for notification in batch]
+                await self.db.notification_outbox.update_many(
+                    {"id": {"$in": ids}},
+                    {"$set": {"status": SENDING, "sending_at": now}}
+                )
+
+                error = None
+                try:
+                    if not await self.send(recipient, build_digest(batch)):
+                        error = "WhatsApp service rejected the message"
+                except Exception as e:
+                    error = str(e)
+
+                if error is None:
+                    await self.db.notification_outbox.update_many(
+                        {"id": {"$in": ids}},
+                        {"$set": {"status": DELIVERED, "delivered_at": datetime.utcnow(), "last_error": None},
+                         "$inc": {"attempts": 1}}
+                    )
+                    return len(batch)
+
+                attempts = max(notification["attempts"] for notification in batch) + 1
+                retry_at = datetime.utcnow() + self._backoff(attempts)
+                await self.db.notification_outbox.update_many(
+                    {"id": {"$in": ids}},
+                    {"$set": {"status": PENDING, "next_attempt_at": retry_at, "last_error": error},
+                     "$inc": {"attempts": 1}}
+                )
+                dead = await self.db.notification_outbox.update_many(
+                    {"id": {"$in": ids}, "attempts": {"$gte": self.max_attempts}},
+                    {"$set": {"status": DEAD_LETTER, "dead_lettered_at": datetime.utcnow()}}
+                )
+                if dead.modified_count:
+                    logger.error(f"Dead-lettered {dead.modified_count} notifications for {recipient}: {error}")
+                else:
+                    logger.warning(f"Notification delivery to {recipient} failed (attempt {attempts}): {error}")
+                return 0
+            finally:
+                await self._release_recipient(recipient)
+
+    async def _recover_stale(self):
+        """Return notifications left in 'sending' by a crashed worker to the queue"""
+        cutoff = datetime.utcnow() - self.lock_ttl
+        await self.db.notification_outbox.update_many(
+            {"status": SENDING, "sending_at": {"$lt": cutoff}},
+            {"$set": {"status": PENDING}}
+        )
+
+    async def dispatch_once(self, limit: int = 500) -> int:
+        """Deliver every recipient that has a due notification"""
+        now = datetime.utcnow()
+        due = await self.db.notification_outbox.find(
+            {"status": PENDING, "next_attempt_at": {"$lte": now}},
+            {"_id": 0, "recipient": 1}
+        ).sort("next_attempt_at", ASCENDING).limit(limit).to_list(limit)
+
+        recipients = list(dict.fromkeys(notification["recipient"] for notification in due))
+        if not recipients:
+            return 0
+
+        results = await asyncio.gather(
+            *[self._deliver_recipient(recipient) for recipient in recipients],
+            return_exceptions=True
+        )
+        return sum(result for result in results if isinstance(result, int))
+
+    async def _loop(self):
+        while True:
+            try:
+                await self._recover_stale()
+                await self.dispatch_once()
+            except Exception as e:
+                logger.error(f"Notification dispatcher error: {str(e)}")
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def start(self):
+        if self._loop_task is None:
+            self._loop_task = asyncio.create_task(self._loop())
+            logger.info(f"Notification dispatcher started as {self.owner_id}")
+
+    async def stop(self):
+        if self._loop_task:
+            self._loop_task.cancel()
+            self._loop_task = None
+
+    async def delivery_status(self, task_id: str) -> List[Dict]:
+        """Delivery history of every notification sent about a task"""
+        return await self.db.notification_outbox.find(
+            {"task_id": task_id},
+            {"_id": 0, "id": 1, "recipient": 1, "kind": 1, "status": 1, "attempts": 1,
+             "last_error": 1, "created_at": 1, "next_attempt_at": 1, "delivered_at": 1}
+        ).sort("created_at", ASCENDING).to_list(100)
+
+    async def retry_dead_letters(self, task_id: Optional[str] = None) -> int:
+        """Requeue dead-lettered notifications (optionally only for one task)"""
+        query = {"status": DEAD_LETTER}
+        if task_id:
+            query["task_id"] = task_id
+        result = await self.db.notification_outbox.update_many(
+            query,
+            {"$set": {"status": PENDING, "attempts": 0, "next_attempt_at": datetime.utcnow()}}
+        )
+        if result.modified_count:
+            self._wakeup.set()
+        return result.modified_count
@@ -0,0 +1,145 @@
+from pymongo import ASCENDING, DESCENDING, UpdateOne
+from datetime import datetime
+from typing import List, Dict, Optional
+
+# Weights used to build the urgency-importance score (higher = do it sooner)
+PRIORITY_WEIGHTS = {
+    "urgent": 40,
+    "high": 30,
+    "medium": 20,
+    "low": 10
+}
+
+QUADRANT_WEIGHTS = {
+    "do": 30,        # Urgent & Important
+    "decide": 20,    # Important & Not Urgent
+    "delegate": 10,  # Urgent & Not Important
+    "delete": 0      # Neither Urgent nor Important
+}
+
+PENDING_STATUSES = ["todo", "in_progress", "overdue"]
+
+# compute_priority_score changes when a task is this close to its due date...
+DUE_BUCKET_HOURS = [0, 24, 72, 168]
+# ...and once a day while it ages, up to this many days
+MAX_AGE_DAYS = 14
+
+
+def _value(field):
+    """Return the raw value of an Enum member or plain string"""
+    return getattr(field, "value", field)
+
+
+def classify_quadrant(priority, due_date: Optional[datetime], now: Optional[datetime] = None) -> str:
+    """Classify a task into an Eisenhower quadrant from its priority and due date"""
+    is_important = _value(priority) in ["high", "urgent"]
+
+    if not due_date:
+        return "decide" if is_important else "delete"
+
+    now = now or datetime.utcnow()
+    days_until_due = (due_date.replace(tzinfo=None) - now).days
+    is_urgent = days_until_due <= 2  # 2 days or less is urgent
+
+    if is_urgent and is_important:
+        return "do"
+    elif is_important:
+        return "decide"
+    elif is_urgent:
+        return "delegate"
+    else:
+        return "delete"
+
+
+def compute_priority_score(task: Dict, now: Optional[datetime] = None) -> float:
+    """
+    Calculate a numeric urgency-importance score for a task.
+    Combines priority, Eisenhower quadrant, due date proximity and task age.
+    """
+    now = now or datetime.utcnow()
+
+    priority = _value(task.get("priority")) or "medium"
+    quadrant = _value(task.get("eisenhower_quadrant")) or "decide"
+    score = PRIORITY_WEIGHTS.get(priority, 20) + QUADRANT_WEIGHTS.get(quadrant, 10)
+
+    # Due date proximity
+    due_date = task.get("due_date")
+    if isinstance(due_date, datetime):
+        hours_left = (due_date.replace(tzinfo=None) - now).total_seconds() / 3600
+        if hours_left < 0:
+            score += 30    # Overdue
+        elif hours_left <= 24:
+            score += 25
+        elif hours_left <= 72:
+            score += 20
+        elif hours_left <= 168:
+            score += 10
+
+    # Older tasks slowly bubble up so nothing starves (capped at two weeks)
+    created_at = task.get("created_at")
+    if isinstance(created_at, datetime):
+        age_days = max(0, (now - created_at.replace(tzinfo=None)).days)
+        score += min(age_days, MAX_AGE_DAYS) * 0.5
+
+    return round(score, 2)
+
+
+class PriorityService:
+    def __init__(self, db):
+        self.db = db
+
+    async def ensure_indexes(self):
+        """Create the index backing per-user top-N queries"""
+        await self.db.tasks.create_index(
+            [("assigned_to", ASCENDING), ("status", ASCENDING), ("priority_score", DESCENDING)],
+            name="assigned_status_priority_score"
+        )
+
+    async def refresh_scores(self, query: Dict, batch_size: int = 500) -> int:
+        """Recompute scores for all tasks matching query using bulk writes"""
+        now = datetime.utcnow()
+        operations = []
+        updated = 0
+
+        cursor = self.db.tasks.find(
+            query,
+            {"id": 1, "priority": 1, "eisenhower_quadrant": 1, "due_date": 1, "created_at": 1}
+        )
+        async for task in cursor:
+            operations.append(UpdateOne(
+                {"id": task["id"]},
+                {"$set": {"priority_score": compute_priority_score(task, now)}}
+            ))
+            if len(operations) >= batch_size:
+                result = await self.db.tasks.bulk_write(operations, ordered=False)
+                updated += result.modified_count
+                operations = []
+
+        if operations:
+            result = await self.db.tasks.bulk_write(operations, ordered=False)
+            updated += result.modified_count
+
+        return updated
+
+    async def backfill_scores(self) -> int:
+        """Score legacy tasks that were created before priority_score existed"""
+        return await self.refresh_scores({"priority_score": {"$exists": False}})
+
+    async def top_tasks(
+        self,
+        user_id: str,
+        limit: int = 10,
+        statuses: Optional[List[str]] = None,
+        extra_filter: Optional[Dict] = None
+    ) -> List[Dict]:
+        """Get a user's top N pending tasks straight from the priority_score index"""
+        query = {
+            "assigned_to": user_id,
+            "status": {"$in": statuses or PENDING_STATUSES}
+        }
+        if extra_filter:
+            query.update(extra_filter)
+
+        return await self.db.tasks.find(query).sort(
+            "priority_score", DESCENDING
+        ).limit(limit).to_list(limit)
@@ -0,0 +1,154 @@
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+import time
+import uuid
+
+
+class InMemorySlidingWindow:
+    """Sliding-window log per key, for a single worker"""
+
+    def __init__(self, limit: int, window: timedelta, max_keys: int = 100000):
+        self.limit = limit
+        self.window = window.total_seconds()
+        self.max_keys = max_keys
+        self.hits: "OrderedDict[str, deque]" = OrderedDict()
+
+    def _current(self, key: str, now: float) -> Optional[deque]:
+        hits = self.hits.get(key)
+        if hits is None:
+            return None
+        self.hits.move_to_end(key)
+        while hits and hits[0] <= now - self.window:
+            hits.popleft()
+        return hits
+
+    async def acquire(self, key: str) -> Tuple[bool, float]:
+        """Record an attempt if the window has room; (allowed, seconds until it does)"""
+        now = time.monotonic()
+        hits = self._current(key, now)
+        if hits is None:
+            hits = self.hits[key] = deque()
+            if len(self.hits) > self.max_keys:
+                self.hits.popitem(last=False)
+        if len(hits) >= self.limit:
+            return False, hits[-self.limit] + self.window - now
+        hits.append(now)
+        return True, 0.0
+
+    async def release(self, key: str):
+        """Give back the most recent attempt"""
+        hits = self.hits.get(key)
+        if hits:
+            hits.pop()
+
+    async def reset(self, key: str):
+        self.hits.pop(key, None)
+
+
+class MongoSlidingWindow:
+    """
+    The same sliding-window log kept in Mongo so every worker shares it.
+    Each attempt is one atomic pipeline update that drops expired hits and
+    appends the new one only while the window has room, so concurrent
+    attempts cannot overshoot the limit.
+    """
+
+    def __init__(self, db, limit: int, window: timedelta, collection: str = "rate_limits"):
+        self.collection = db[collection]
+        self.limit = limit
+        self.window = window
+
+    async def ensure_indexes(self):
+        await self.collection.create_index(
+            [("expires_at", ASCENDING)],
+            expireAfterSeconds=0,
+            name="expires_at_ttl"
+        )
+
+    async def acquire(self, key: str) -> Tuple[bool, float]:
+        try:
+            return await self._acquire(key)
+        except DuplicateKeyError:
+            # Two first attempts raced on the upsert; the document exists now
+            return await self._acquire(key)
+
+    async def _acquire(self, key: str) -> Tuple[bool, float]:
+        now = datetime.utcnow()
+        token = uuid.uuid4().hex
+        record = await self.collection.find_one_and_update(
+            {"_id": key},
+            [
+                {"$set": {"hits": {"$filter": {
+                    "input": {"$ifNull": ["$hits", []]},
+                    "cond": {"$gt": ["$$this", now - self.window]}
+                }}}},
+                # Only the update that finds room gets its token recorded
+                {"$set": {"admitted": {"$cond": [{"$lt": [{"$size": "$hits"}, self.limit]}, token, None]}}},
+                {"$set": {
+                    "hits": {"$cond": [
+                        {"$eq": ["$admitted", token]},
+                        {"$concatArrays": ["$hits", [now]]},
+                        "$hits"
+                    ]},
+                    "expires_at": now + self.window
+                }}
+            ],
+            projection={"hits": 1, "admitted": 1},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        if record.get("admitted") == token:
+            return True, 0.0
+        return False, max(0.0, (record["hits"][-self.limit] + self.window - now).total_seconds())
+
+    async def release(self, key: str):
+        await self.collection.update_one(
+            {"_id": key, "hits.0": {"$exists": True}},
+            [{"$set": {"hits": {"$slice": ["$hits", {"$subtract": [{"$size": "$hits"}, 1]}]}}}]
+        )
+
+    async def reset(self, key: str):
+        await self.collection.delete_one({"_id": key})
+
+
+class LoginThrottle:
+    """Limits login attempts per client IP and per email before any password work"""
+
+    def __init__(self, limiter_factory, ip_limit: int, email_limit: int, window: timedelta):
+        self.by_ip = limiter_factory(ip_limit, window)
+        self.by_email = limiter_factory(email_limit, window)
+
+    async def ensure_indexes(self):
+        for limiter in (self.by_ip, self.by_email):
+            if hasattr(limiter, "ensure_indexes"):
+                await limiter.ensure_indexes()
+
+    @staticmethod
+    def _email_key(email: str) -> str:
+        return f"login:email:{email.strip().lower()}"
+
+    async def check(self, ip: Optional[str], email: str) -> Tuple[bool, float]:
+        """
+        (allowed, retry_after seconds). Reserves a slot in both windows
+        atomically before any password work, so parallel attempts cannot
+        all pass a check that none of them has recorded yet. A turned-away
+        attempt gives back what it reserved; a correct password clears the
+        email window (see succeeded).
+        """
+        ip_key = f"login:ip:{ip or 'unknown'}"
+        ip_allowed, ip_retry = await self.by_ip.acquire(ip_key)
+        if not ip_allowed:
+            return False, ip_retry
+
+        email_allowed, email_retry = await self.by_email.acquire(self._email_key(email))
+        if not email_allowed:
+            await self.by_ip.release(ip_key)
+            return False, email_retry
+        return True, 0.0
+
+    async def succeeded(self, email: str):
+        """A correct password clears the email's attempts (the IP window keeps running)"""
+        await self.by_email.reset(self._email_key(email))
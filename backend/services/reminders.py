@@ -0,0 +1,233 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEZONE = "UTC"
+DEFAULT_REMINDER_TIME = "09:00"
+
+
+def get_zone(timezone_name: Optional[str]) -> ZoneInfo:
+    """Resolve an IANA timezone name, falling back to UTC"""
+    try:
+        return ZoneInfo(timezone_name or DEFAULT_TIMEZONE)
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo(DEFAULT_TIMEZONE)
+
+
+def parse_reminder_time(reminder_time: Optional[str]) -> Tuple[int, int]:
+    """Parse an HH:MM local time string"""
+    hour, minute = (reminder_time or DEFAULT_REMINDER_TIME).split(":")
+    hour, minute = int(hour), int(minute)
+    if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        raise ValueError(f"Invalid reminder time: {reminder_time}")
+    return hour, minute
+
+
+def next_reminder_time(timezone_name: Optional[str], reminder_time: Optional[str], after: datetime) -> datetime:
+    """Next UTC (naive) moment after `after` when the user's local clock shows reminder_time"""
+    zone = get_zone(timezone_name)
+    hour, minute = parse_reminder_time(reminder_time)
+
+    local_now = after.replace(tzinfo=timezone.utc).astimezone(zone)
+    candidate = local_now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if candidate <= local_now:
+        candidate = (local_now + timedelta(days=1)).replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+    return candidate.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class HierarchicalTimingWheel:
+    """
+    Hierarchical timing wheel with minute ticks.
+    Level 0 holds the next hour by minute, level 1 the next day by hour,
+    level 2 the next week by day; items cascade down as time advances.
+    """
+
+    def __init__(self, start: datetime, tick: timedelta = timedelta(minutes=1), wheel_sizes=(60, 24, 7)):
+        self.tick = tick
+        self.origin = start.replace(second=0, microsecond=0)
+        self.current_tick = 0
+        self.wheel_sizes = list(wheel_sizes)
+
+        # Ticks covered by one slot at each level
+        self.spans = [1]
+        for size in self.wheel_sizes[:-1]:
+            self.spans.append(self.spans[-1] * size)
+
+        self.wheels: List[List[List[Tuple[int, Any]]]] = [[[] for _ in range(size)] for size in self.wheel_sizes]
+        self.overflow: List[Tuple[int, Any]] = []
+
+    def _tick_of(self, moment: datetime) -> int:
+        return int((moment - self.origin) / self.tick)
+
+    def _place(self, target_tick: int, item: Any):
+        delta = target_tick - self.current_tick
+        for level, size in enumerate(self.wheel_sizes):
+            if delta < self.spans[level] * size:
+                slot = (target_tick // self.spans[level]) % size
+                self.wheels[level][slot].append((target_tick, item))
+                return
+        self.overflow.append((target_tick, item))
+
+    def schedule(self, fire_at: datetime, item: Any):
+        # Anything due now or in the past fires on the next tick
+        self._place(max(self._tick_of(fire_at), self.current_tick + 1), item)
+
+    def _cascade(self, level: int):
+        slot = (self.current_tick // self.spans[level]) % self.wheel_sizes[level]
+        entries, self.wheels[level][slot] = self.wheels[level][slot], []
+        for target_tick, item in entries:
+            self._place(target_tick, item)
+
+    def advance(self, now: datetime) -> List[Any]:
+        """Move the wheel forward to `now` and return every expired item"""
+        expired = []
+        target = self._tick_of(now)
+
+        while self.current_tick < target:
+            self.current_tick += 1
+
+            top_span = self.spans[-1] * self.wheel_sizes[-1]
+            if self.overflow and self.current_tick % top_span == 0:
+                entries, self.overflow = self.overflow, []
+                for target_tick, item in entries:
+                    self._place(target_tick, item)
+
+            # Cascade from the highest level down before expiring level 0
+            for level in range(len(self.wheel_sizes) - 1, 0, -1):
+                if self.current_tick % self.spans[level] == 0:
+                    self._cascade(level)
+
+            slot = self.current_tick % self.wheel_sizes[0]
+            entries, self.wheels[0][slot] = self.wheels[0][slot], []
+            expired.extend(item for _, item in entries)
+
+        return expired
+
+
+class ReminderService:
+    """
+    Fires each user's daily reminder at their preferred local time.
+    Users are held in a timing wheel; per-user/per-day leases keep
+    multiple workers from sending the same reminder twice.
+    """
+
+    def __init__(
+        self,
+        db,
+        send_reminder: Callable[[Dict], Awaitable],
+        acquire_lease: Callable[..., Awaitable[bool]],
+        max_concurrency: int = 10,
+        reload_interval: timedelta = timedelta(hours=1)
+    ):
+        self.db = db
+        self.send_reminder = send_reminder
+        self.acquire_lease = acquire_lease
+        self.reload_interval = reload_interval
+        self.wheel = HierarchicalTimingWheel(datetime.utcnow())
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.preferences: Dict[str, Dict] = {}
+        self.scheduled: Dict[str, datetime] = {}
+        self._loop_task: Optional[asyncio.Task] = None
+
+    def schedule_user(self, user: Dict):
+        """(Re)schedule a user's next reminder from their profile settings"""
+        user_id = user["id"]
+        if not user.get("phone_number") or not user.get("reminders_enabled", True):
+            self.unschedule_user(user_id)
+            return
+
+        self.preferences[user_id] = {
+            "timezone": user.get("timezone") or DEFAULT_TIMEZONE,
+            "reminder_time": user.get("reminder_time") or DEFAULT_REMINDER_TIME
+        }
+        fire_at = next_reminder_time(
+            self.preferences[user_id]["timezone"],
+            self.preferences[user_id]["reminder_time"],
+            datetime.utcnow()
+        )
+        if self.scheduled.get(user_id) == fire_at:
+            return
+
+        # Old wheel entries are skipped when they expire (lazy cancellation)
+        self.scheduled[user_id] = fire_at
+        self.wheel.schedule(fire_at, (user_id, fire_at))
+
+    def unschedule_user(self, user_id: str):
+        self.preferences.pop(user_id, None)
+        self.scheduled.pop(user_id, None)
+
+    async def load_users(self):
+        users = await self.db.users.find(
+            {"phone_number": {"$nin": [None, ""]}},
+            {"_id": 0, "id": 1, "phone_number": 1, "timezone": 1, "reminder_time": 1, "reminders_enabled": 1}
+        ).to_list(None)
+        for user in users:
+            self.schedule_user(user)
+
+    async def _fire(self, user_id: str, fire_at: datetime):
+        async with self.semaphore:
+            try:
+                user = await self.db.users.find_one({"id": user_id})
+                if not user or not user.get("phone_number") or not user.get("reminders_enabled", True):
+                    return
+
+                # Preferences are only reloaded hourly; if the user moved their
+                # reminder since, this entry is stale and the new time wins
+                expected = next_reminder_time(user.get("timezone"), user.get("reminder_time"), fire_at - timedelta(minutes=1))
+                if expected != fire_at:
+                    self.schedule_user(user)
+                    return
+
+                # One reminder per user per local day, whatever time it fires at
+                local_date = fire_at.replace(tzinfo=timezone.utc).astimezone(get_zone(user.get("timezone"))).strftime('%Y%m%d')
+                if not await self.acquire_lease(f"reminder:{user_id}:{local_date}", expires_at=fire_at + timedelta(days=2)):
+                    return  # Another worker already sent it
+                await self.send_reminder(user)
+            except Exception as e:
+                logger.error(f"Reminder for {user_id} failed: {str(e)}")
+
+    def tick(self, now: datetime) -> int:
+        """Fire every reminder that came due and schedule each user's next one"""
+        fired = 0
+        for user_id, fire_at in self.wheel.advance(now):
+            if self.scheduled.get(user_id) != fire_at:
+                continue  # Stale entry from a rescheduled user
+
+            del self.scheduled[user_id]
+            asyncio.create_task(self._fire(user_id, fire_at))
+            fired += 1
+
+            self.schedule_user({"id": user_id, "phone_number": True, **self.preferences[user_id]})
+
+        return fired
+
+    async def _loop(self):
+        last_reload = datetime.utcnow()
+        while True:
+            now = datetime.utcnow()
+            try:
+                if now - last_reload >= self.reload_interval:
+                    await self.load_users()
+                    last_reload = now
+                self.tick(now)
+            except Exception as e:
+                logger.error(f"Reminder wheel error: {str(e)}")
+
+            next_minute = now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+            await asyncio.sleep(max(0.0, (next_minute - datetime.utcnow()).total_seconds()))
+
+    async def start(self):
+        await self.load_users()
+        if self._loop_task is None:
+            self._loop_task = asyncio.create_task(self._loop())
+            logger.info(f"Reminder wheel started with {len(self.scheduled)} users")
+
+    async def stop(self):
+        if self._loop_task:
+            self._loop_task.cancel()
+            self._loop_task = None
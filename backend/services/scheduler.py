@@ -0,0 +1,194 @@
+from pymongo import ASCENDING
+from pymongo.errors import DuplicateKeyError
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+import asyncio
+import logging
+import os
+import socket
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# (field name, min value, max value) for the five cron fields
+CRON_FIELDS = [
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day", 1, 31),
+    ("month", 1, 12),
+    ("weekday", 0, 6)  # 0 = Sunday, like standard cron
+]
+
+
+def _parse_cron_field(expression: str, min_value: int, max_value: int) -> Set[int]:
+    """Parse one cron field (supports *, */n, a-b, a-b/n and comma lists)"""
+    values = set()
+
+    for part in expression.split(","):
+        step = 1
+        if "/" in part:
+            part, step_str = part.split("/", 1)
+            step = int(step_str)
+
+        if part == "*":
+            start, end = min_value, max_value
+        elif "-" in part:
+            start_str, end_str = part.split("-", 1)
+            start, end = int(start_str), int(end_str)
+        else:
+            start = end = int(part)
+
+        if start < min_value or end > max_value or step < 1:
+            raise ValueError(f"Cron value out of range: {expression}")
+
+        values.update(range(start, end + 1, step))
+
+    return values
+
+
+class CronSchedule:
+    """Standard five-field cron expression: minute hour day month weekday"""
+
+    def __init__(self, expression: str):
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: {expression}")
+
+        self.expression = expression
+        self.fields = {
+            name: _parse_cron_field(part, min_value, max_value)
+            for part, (name, min_value, max_value) in zip(parts, CRON_FIELDS)
+        }
+        # Like cron, a day field starting with * does not restrict the date
+        self.day_restricted = not parts[2].startswith("*")
+        self.weekday_restricted = not parts[4].startswith("*")
+
+    def matches(self, moment: datetime) -> bool:
+        cron_weekday = (moment.weekday() + 1) % 7  # Python: Monday = 0
+        day_matches = moment.day in self.fields["day"]
+        weekday_matches = cron_weekday in self.fields["weekday"]
+        if self.day_restricted and self.weekday_restricted:
+            # Standard cron: when both are restricted, either one may match
+            date_matches = day_matches or weekday_matches
+        else:
+            date_matches = day_matches and weekday_matches
+        return (
+            moment.minute in self.fields["minute"]
+            and moment.hour in self.fields["hour"]
+            and moment.month in self.fields["month"]
+            and date_matches
+        )
+
+
+class ScheduledJob:
+    def __init__(self, name: str, schedule: CronSchedule, func: Callable[[], Awaitable]):
+        self.name = name
+        self.schedule = schedule
+        self.func = func
+
+
+class JobScheduler:
+    """
+    In-process cron scheduler safe for multiple workers/replicas.
+    Every worker evaluates the schedule, but a job only runs on the worker
+    that inserts the lease document for that (job, minute) tick first.
+    """
+
+    def __init__(self, db, lease_ttl: timedelta = timedelta(minutes=10)):
+        self.db = db
+        self.lease_ttl = lease_ttl
+        self.owner_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.jobs: List[ScheduledJob] = []
+        self._loop_task: Optional[asyncio.Task] = None
+        self._running: Set[asyncio.Task] = set()
+
+    def add_job(self, name: str, cron_expression: str, func: Callable[[], Awaitable]):
+        """Register an async job to run on a cron schedule (UTC)"""
+        self.jobs.append(ScheduledJob(name, CronSchedule(cron_expression), func))
+
+    async def ensure_indexes(self):
+        # Expired leases are removed by Mongo's TTL monitor
+        await self.db.scheduler_leases.create_index(
+            [("expires_at", ASCENDING)],
+            expireAfterSeconds=0,
+            name="lease_ttl"
+        )
+
+    async def acquire_lease(self, lease_id: str, **fields) -> bool:
+        """Atomically claim a lease; False if another worker already holds it"""
+        now = datetime.utcnow()
+        try:
+            await self.db.scheduler_leases.insert_one({
+                "_id": lease_id,
+                "owner": self.owner_id,
+                "acquired_at": now,
+                "expires_at": now + self.lease_ttl,
+                **fields
+            })
+            return True
+        except DuplicateKeyError:
+            return False
+
+    async def _acquire_tick(self, job: ScheduledJob, tick: datetime) -> bool:
+        return await self.acquire_lease(
+            f"{job.name}:{tick.strftime('%Y%m%d%H%M')}",
+            job=job.name,
+            tick=tick
+        )
+
+    async def _run_job(self, job: ScheduledJob, tick: datetime):
+        lease_id = f"{job.name}:{tick.strftime('%Y%m%d%H%M')}"
+        status, error = "completed", None
+        try:
+            await job.func()
+        except Exception as e:
+            status, error = "failed", str(e)
+            logger.error(f"Scheduled job {job.name} failed: {str(e)}")
+
+        await self.db.scheduler_leases.update_one(
+            {"_id": lease_id},
+            {"$set": {"status": status, "error": error, "finished_at": datetime.utcnow()}}
+        )
+
+    async def run_pending(self, tick: datetime) -> List[str]:
+        """Start every job due at this tick that this worker wins the lease for"""
+        started = []
+        for job in self.jobs:
+            if not job.schedule.matches(tick):
+                continue
+            if not await self._acquire_tick(job, tick):
+                continue
+
+            task = asyncio.create_task(self._run_job(job, tick))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+            started.append(job.name)
+
+        return started
+
+    async def _loop(self):
+        while True:
+            tick = datetime.utcnow().replace(second=0, microsecond=0)
+            try:
+                await self.run_pending(tick)
+            except Exception as e:
+                logger.error(f"Scheduler tick error: {str(e)}")
+
+            # Sleep until the start of the next minute
+            next_tick = tick + timedelta(minutes=1)
+            await asyncio.sleep(max(0.0, (next_tick - datetime.utcnow()).total_seconds()))
+
+    def start(self):
+        if self._loop_task is None:
+            self._loop_task = asyncio.create_task(self._loop())
+            logger.info(f"Scheduler started with {len(self.jobs)} jobs as {self.owner_id}")
+
+    async def stop(self):
+        if self._loop_task:
+            self._loop_task.cancel()
+            self._loop_task = None
+        for task in list(self._running):
+            task.cancel()
+
+    def describe(self) -> List[Dict]:
+        return [{"name": job.name, "schedule": job.schedule.expression} for job in self.jobs]
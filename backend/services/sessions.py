@@ -0,0 +1,83 @@
+from pymongo import ASCENDING
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+
+class ConversationSessionStore:
+    """
+    Short-lived per-phone conversation state for the WhatsApp bot, such as the
+    task ids behind the last numbered listing. Kept in an in-memory LRU with a
+    TTL; when persist is enabled, sessions live in Mongo instead and every
+    read goes there, so all workers (and restarts) see the latest state.
+    """
+
+    def __init__(self, db=None, ttl: timedelta = timedelta(minutes=30), max_sessions: int = 10000, persist: bool = False):
+        self.db = db
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.persist = persist and db is not None
+        self.sessions: "OrderedDict[str, Tuple[datetime, Dict]]" = OrderedDict()
+
+    async def ensure_indexes(self):
+        if self.persist:
+            await self.db.whatsapp_sessions.create_index(
+                [("expires_at", ASCENDING)],
+                expireAfterSeconds=0,
+                name="expires_at_ttl"
+            )
+
+    async def get(self, key: str) -> Optional[Dict]:
+        now = datetime.utcnow()
+        if self.persist:
+            # Mongo is the source of truth: another worker may have replaced
+            # the session since we last saw it. TTL deletion is lazy, so check
+            # expiry here as well
+            document = await self.db.whatsapp_sessions.find_one({"_id": key, "expires_at": {"$gt": now}})
+            return document["data"] if document else None
+
+        entry = self.sessions.get(key)
+        if entry:
+            expires_at, data = entry
+            if expires_at > now:
+                self.sessions.move_to_end(key)
+                return data
+            del self.sessions[key]
+
+        return None
+
+    def _remember(self, key: str, expires_at: datetime, data: Dict):
+        self.sessions[key] = (expires_at, data)
+        self.sessions.move_to_end(key)
+        while len(self.sessions) > self.max_sessions:
+            self.sessions.popitem(last=False)
+
+    async def update(self, key: str, **fields) -> Dict:
+        """Merge fields into the session and restart its TTL"""
+        data = dict(await self.get(key) or {})
+        data.update(fields)
+        expires_at = datetime.utcnow() + self.ttl
+
+        if self.persist:
+            await self.db.whatsapp_sessions.update_one(
+                {"_id": key},
+                {"$set": {"data": data, "expires_at": expires_at}},
+                upsert=True
+            )
+        else:
+            self._remember(key, expires_at, data)
+        return data
+
+    async def clear(self, key: str):
+        if self.persist:
+            await self.db.whatsapp_sessions.delete_one({"_id": key})
+        else:
+            self.sessions.pop(key, None)
+
+    async def set_listing(self, key: str, task_ids: List[str]):
+        """Remember which task each number in the last listing refers to"""
+        await self.update(key, listing=task_ids)
+
+    async def get_listing(self, key: str) -> Optional[List[str]]:
+        session = await self.get(key)
+        return session.get("listing") if session else None
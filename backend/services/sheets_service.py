@@ -2,12 +2,17 @@ from googleapiclient.discovery import build
 from google.oauth2.credentials import Credentials
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
+import asyncio
 import json
 
 class SheetsService:
     def __init__(self, credentials: Credentials):
         self.service = build('sheets', 'v4', credentials=credentials)
     
+    async def _execute(self, request):
+        """googleapiclient is blocking; run each HTTP call on a worker thread"""
+        return await asyncio.to_thread(request.execute)
+    
     async def create_spreadsheet(self, title: str):
         """Create new spreadsheet"""
         spreadsheet = {
@@ -23,9 +28,9 @@ class SheetsService:
             ]
         }
         
-        result = self.service.spreadsheets().create(
+        result = await self._execute(self.service.spreadsheets().create(
             body=spreadsheet
-        ).execute()
+        ))
         
         spreadsheet_id = result['spreadsheetId']
         
@@ -69,10 +74,10 @@ class SheetsService:
             'data': batch_data
         }
         
-        return self.service.spreadsheets().values().batchUpdate(
+        return await self._execute(self.service.spreadsheets().values().batchUpdate(
             spreadsheetId=spreadsheet_id,
             body=body
-        ).execute()
+        ))
     
     async def batch_export_tasks(self, spreadsheet_id: str, tasks_data: List[Dict]):
         """Export tasks to Google Sheets with Eisenhower Matrix analysis"""
@@ -135,10 +140,10 @@ class SheetsService:
         ]
         
         clear_body = {'ranges': [item['range'] for item in clear_batch]}
-        self.service.spreadsheets().values().batchClear(
+        await self._execute(self.service.spreadsheets().values().batchClear(
             spreadsheetId=spreadsheet_id,
             body=clear_body
-        ).execute()
+        ))
         
         # Add new data
         body = {
@@ -146,10 +151,10 @@ class SheetsService:
             'data': batch_data
         }
         
-        return self.service.spreadsheets().values().batchUpdate(
+        return await self._execute(self.service.spreadsheets().values().batchUpdate(
             spreadsheetId=spreadsheet_id,
             body=body
-        ).execute()
+        ))
     
     async def export_projects(self, spreadsheet_id: str, projects_data: List[Dict]):
         """Export projects to Google Sheets"""
@@ -169,22 +174,22 @@ class SheetsService:
             ])
         
         # Clear existing data
-        self.service.spreadsheets().values().clear(
+        await self._execute(self.service.spreadsheets().values().clear(
             spreadsheetId=spreadsheet_id,
             range='Projects!A2:H1000'
-        ).execute()
+        ))
         
         # Add new data
         body = {
             'values': project_rows
         }
         
-        return self.service.spreadsheets().values().update(
+        return await self._execute(self.service.spreadsheets().values().update(
             spreadsheetId=spreadsheet_id,
             range=f'Projects!A2:H{len(project_rows)+1}',
             valueInputOption='RAW',
             body=body
-        ).execute()
+        ))
     
     async def create_productivity_report(self, spreadsheet_id: str, report_data: Dict):
         """Create automated daily/weekly productivity reports"""
@@ -222,22 +227,22 @@ class SheetsService:
         ]
         
         # Clear existing report
-        self.service.spreadsheets().values().clear(
+        await self._execute(self.service.spreadsheets().values().clear(
             spreadsheetId=spreadsheet_id,
             range='Performance Report!A1:G1000'
-        ).execute()
+        ))
         
         # Add report data
         body = {
             'values': report_rows
         }
         
-        return self.service.spreadsheets().values().update(
+        return await self._execute(self.service.spreadsheets().values().update(
             spreadsheetId=spreadsheet_id,
             range='Performance Report!A1',
             valueInputOption='RAW',
             body=body
-        ).execute()
+        ))
     
     async def export_team_analytics(self, spreadsheet_id: str, team_data: List[Dict]):
         """Export team performance analytics"""
@@ -254,29 +259,29 @@ class SheetsService:
             ])
         
         # Clear existing data
-        self.service.spreadsheets().values().clear(
+        await self._execute(self.service.spreadsheets().values().clear(
             spreadsheetId=spreadsheet_id,
             range='Team Analytics!A2:F1000'
-        ).execute()
+        ))
         
         # Add team data
         body = {
             'values': team_rows
         }
         
-        return self.service.spreadsheets().values().update(
+        return await self._execute(self.service.spreadsheets().values().update(
             spreadsheetId=spreadsheet_id,
             range=f'Team Analytics!A2:F{len(team_rows)+1}',
             valueInputOption='RAW',
             body=body
-        ).execute()
+        ))
     
     async def import_tasks_from_sheet(self, spreadsheet_id: str, range_name: str = 'Tasks!A2:J'):
         """Import tasks from existing Google Sheets"""
-        result = self.service.spreadsheets().values().get(
+        result = await self._execute(self.service.spreadsheets().values().get(
             spreadsheetId=spreadsheet_id,
             range=range_name
-        ).execute()
+        ))
         
         values = result.get('values', [])
         tasks = []
@@ -360,26 +365,26 @@ class SheetsService:
         ])
         
         # Clear and update the Eisenhower Matrix sheet
-        self.service.spreadsheets().values().clear(
+        await self._execute(self.service.spreadsheets().values().clear(
             spreadsheetId=spreadsheet_id,
             range='Eisenhower Matrix!A1:D1000'
-        ).execute()
+        ))
         
         body = {
             'values': dashboard_rows
         }
         
-        return self.service.spreadsheets().values().update(
+        return await self._execute(self.service.spreadsheets().values().update(
             spreadsheet_id=spreadsheet_id,
             range='Eisenhower Matrix!A1',
             valueInputOption='RAW',
             body=body
-        ).execute()
+        ))
     
     async def schedule_automated_exports(self, user_id: str, schedule_type: str = 'daily'):
         """
-        Schedule automated exports (daily/weekly reports)
-        This would integrate with APScheduler or similar
+        Build the config for automated exports (daily/weekly reports).
+        Exports are run by the backend scheduler's sheet_exports job.
         """
         schedule_config = {
             'user_id': user_id,
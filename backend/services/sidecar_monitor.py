@@ -0,0 +1,137 @@
+from datetime import datetime
+from typing import Dict, Optional, Set
+import asyncio
+import httpx
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Fields that make up the status; a change in any of them is pushed to subscribers
+STATUS_FIELDS = ("connected", "status", "phone_number", "qr_available", "error")
+
+
+class SidecarHealthMonitor:
+    """
+    Polls the WhatsApp sidecar's /status from one background task and caches
+    the result. Readers get the cached state; subscribers (SSE streams) are
+    only notified when the state actually changes, so sidecar load does not
+    depend on how many browser tabs are open.
+    """
+
+    def __init__(self, base_url: str, interval: float = 5.0, timeout: float = 3.0):
+        self.base_url = base_url
+        self.interval = interval
+        self.timeout = timeout
+        self.state: Dict = {
+            "connected": False,
+            "status": "unknown",
+            "phone_number": None,
+            "user": None,
+            "qr_available": False,
+            "error": None,
+            "checked_at": None,
+            "changed_at": None
+        }
+        self.version = 0
+        self.subscribers: Set[asyncio.Queue] = set()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop_task: Optional[asyncio.Task] = None
+        self._refresh = asyncio.Event()
+
+    @staticmethod
+    def _phone_from_user(user: Optional[Dict]) -> Optional[str]:
+        # Baileys ids look like "15551234567:12@s.whatsapp.net"
+        if not user or not user.get("id"):
+            return None
+        return "+" + user["id"].split("@")[0].split(":")[0]
+
+    async def check(self) -> Dict:
+        """Poll the sidecar once and update the cached state"""
+        try:
+            response = await self._client.get(f"{self.base_url}/status", timeout=self.timeout)
+            data = response.json()
+            observed = {
+                "connected": bool(data.get("connected")),
+                "status": data.get("status", "unknown"),
+                "phone_number": self._phone_from_user(data.get("user")),
+                "user": data.get("user"),
+                "qr_available": bool(data.get("qr_available")),
+                "error": None
+            }
+        except Exception as e:
+            observed = {
+                "connected": False,
+                "status": "service_unavailable",
+                "phone_number": None,
+                "user": None,
+                "qr_available": False,
+                "error": str(e) or e.__class__.__name__
+            }
+
+        now = datetime.utcnow()
+        changed = any(observed[field] != self.state.get(field) for field in STATUS_FIELDS)
+        self.state = {**observed, "checked_at": now, "changed_at": now if changed else self.state["changed_at"]}
+
+        if changed:
+            self.version += 1
+            self._publish()
+        return self.state
+
+    def _publish(self):
+        snapshot = self.snapshot()
+        for queue in list(self.subscribers):
+            # Slow consumers only need the latest state
+            if queue.full():
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            queue.put_nowait(snapshot)
+
+    def snapshot(self) -> Dict:
+        state = dict(self.state)
+        state["version"] = self.version
+        state["message"] = (
+            "WhatsApp is connected and ready" if state["connected"]
+            else "WhatsApp service is not available" if state["status"] == "service_unavailable"
+            else f"WhatsApp status: {state['status']}"
+        )
+        return state
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=1)
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self.subscribers.discard(queue)
+
+    def request_refresh(self):
+        """Poll again right away (e.g. after a restart request)"""
+        self._refresh.set()
+
+    async def _loop(self):
+        while True:
+            try:
+                await self.check()
+            except Exception as e:
+                logger.error(f"Sidecar health check error: {str(e)}")
+
+            try:
+                await asyncio.wait_for(self._refresh.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._refresh.clear()
+
+    def start(self):
+        if self._loop_task is None:
+            self._client = httpx.AsyncClient()
+            self._loop_task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        if self._loop_task:
+            self._loop_task.cancel()
+            self._loop_task = None
+        if self._client:
+            await self._client.aclose()
+            self._client = None
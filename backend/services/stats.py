@@ -0,0 +1,66 @@
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from collections import defaultdict
+from typing import Dict, Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class UserStatsBuffer:
+    """
+    Buffers the denormalized per-user counters (tasks_assigned,
+    tasks_completed) and applies them with one unordered bulk write per
+    flush, so task writes do not pay an extra round trip for them.
+    """
+
+    def __init__(self, db, flush_interval: float = 1.0):
+        self.db = db
+        self.flush_interval = flush_interval
+        self.pending: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._loop_task: Optional[asyncio.Task] = None
+
+    def increment(self, user_id: Optional[str], field: str, amount: int = 1):
+        if user_id:
+            self.pending[user_id][field] += amount
+
+    async def flush(self) -> int:
+        if not self.pending:
+            return 0
+
+        pending, self.pending = self.pending, defaultdict(lambda: defaultdict(int))
+        operations = [
+            UpdateOne({"id": user_id}, {"$inc": dict(counters)})
+            for user_id, counters in pending.items()
+        ]
+        try:
+            await self.db.users.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            # Some increments were applied; retrying all of them would double count
+            logger.error(f"User stats flush partially failed: {e.details.get('writeErrors')}")
+        except Exception:
+            # Put the increments back so the next flush retries them
+            for user_id, counters in pending.items():
+                for field, amount in counters.items():
+                    self.pending[user_id][field] += amount
+            raise
+        return len(operations)
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"User stats flush error: {str(e)}")
+
+    def start(self):
+        if self._loop_task is None:
+            self._loop_task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        if self._loop_task:
+            self._loop_task.cancel()
+            self._loop_task = None
+        await self.flush()
@@ -0,0 +1,175 @@
+from pymongo import ASCENDING
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import base64
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+SYNCED_COLLECTIONS = ("tasks", "projects")
+
+
+class DeltaSync:
+    """
+    Incremental sync for offline clients. Every task/project write stamps
+    updated_at; deletes leave a tombstone in deleted_records so clients can
+    drop records they already have. Clients page through changes with an
+    opaque cursor holding an (updated_at, id) position per stream.
+    """
+
+    def __init__(self, db, tombstone_ttl: timedelta = timedelta(days=30),
+                 settle_time: timedelta = timedelta(seconds=2)):
+        self.db = db
+        self.tombstone_ttl = tombstone_ttl
+        # Writes stamped just before a read may not be visible yet, so the
+        # newest few seconds are left for the next sync
+        self.settle_time = settle_time
+
+    async def ensure_indexes(self):
+        for collection in SYNCED_COLLECTIONS:
+            await self.db[collection].create_index(
+                [("updated_at", ASCENDING), ("id", ASCENDING)],
+                name="updated_at_id"
+            )
+            # Records written before updated_at existed count as changed when created
+            await self.db[collection].update_many(
+                {"updated_at": {"$exists": False}},
+                [{"$set": {"updated_at": {"$ifNull": ["$created_at", datetime.utcnow()]}}}]
+            )
+
+        await self.db.deleted_records.create_index(
+            [("collection", ASCENDING), ("company_id", ASCENDING), ("deleted_at", ASCENDING), ("id", ASCENDING)],
+            name="collection_company_deleted_at_id"
+        )
+        # Clients offline for longer than this have to do a full reload
+        await self.db.deleted_records.create_index(
+            [("deleted_at", ASCENDING)],
+            expireAfterSeconds=int(self.tombstone_ttl.total_seconds()),
+            name="deleted_at_ttl"
+        )
+
+    async def record_deletions(self, collection: str, documents: List[Dict]):
+        """Leave tombstones for deleted documents (call after the delete succeeded)"""
+        if not documents:
+            return
+        now = datetime.utcnow()
+        await self.db.deleted_records.insert_many([
+            {
+                "collection": collection,
+                "id": document["id"],
+                "deleted_at": now,
+                # Tombstones are scoped like the records were: by company, and
+                # for records outside a company by the people who could see them
+                "company_id": document.get("company_id"),
+                "user_ids": [
+                    user_id for user_id in (
+                        document.get("assigned_to"), document.get("assigned_by"),
+                        document.get("owner_id"), *document.get("team_members", [])
+                    ) if user_id
+                ]
+            }
+            for document in documents
+        ], ordered=False)
+
+    @staticmethod
+    def _after(field: str, position: List) -> Dict:
+        since, after_id = position
+        if not after_id:
+            return {field: {"$gt": since}}
+        return {"$or": [
+            {field: {"$gt": since}},
+            {field: since, "id": {"$gt": after_id}}
+        ]}
+
+    async def _page(self, collection: str, field: str, query: Dict, position: Optional[List],
+                    projection: Dict, limit: int):
+        conditions = [query, {field: {"$lt": datetime.utcnow() - self.settle_time}}]
+        if position is not None:
+            conditions.append(self._after(field, position))
+        query = {"$and": conditions}
+
+        records = await self.db[collection].find(query, projection).sort(
+            [(field, ASCENDING), ("id", ASCENDING)]
+        ).limit(limit + 1).to_list(limit + 1)
+
+        has_more = len(records) > limit
+        records = records[:limit]
+        if records:
+            position = [records[-1][field], records[-1]["id"]]
+        return records, position, has_more
+
+    @staticmethod
+    def encode_cursor(positions: Dict[str, Optional[List]]) -> str:
+        payload = {
+            stream: [position[0].isoformat(), position[1]] if position else None
+            for stream, position in positions.items()
+        }
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Dict[str, Optional[List]]:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return {
+            stream: [datetime.fromisoformat(position[0]), position[1]] if position else None
+            for stream, position in payload.items()
+        }
+
+    async def changes(
+        self,
+        visible: Dict[str, Dict],
+        company_id: Optional[str],
+        positions: Dict[str, Optional[List]],
+        limit: int = 500,
+        user_ids: Optional[List[str]] = None
+    ) -> Dict:
+        """
+        One page of changes per collection. visible maps each collection to
+        the query selecting records the caller may see; positions maps each
+        stream to its [timestamp, id] cursor (None = from the beginning).
+        Deletions are those of the company's records, optionally narrowed to
+        records one of user_ids could see.
+        """
+        tombstone_scope = {"company_id": company_id}
+        if user_ids is not None:
+            tombstone_scope["user_ids"] = {"$in": user_ids}
+
+        response = {"deleted": {}, "has_more": False}
+        next_positions = {}
+
+        for collection in SYNCED_COLLECTIONS:
+            records, position, has_more = await self._page(
+                collection, "updated_at", visible[collection],
+                positions.get(collection), {"_id": 0}, limit
+            )
+            response[collection] = records
+            next_positions[collection] = position
+            response["has_more"] |= has_more
+
+            # Nothing to delete on an initial sync
+            stream = f"deleted_{collection}"
+            deleted_position = positions.get(stream, positions.get(collection))
+            deleted = []
+            if deleted_position is not None:
+                deleted, deleted_position, has_more = await self._page(
+                    "deleted_records", "deleted_at",
+                    {"collection": collection, **tombstone_scope},
+                    deleted_position, {"_id": 0, "id": 1, "deleted_at": 1}, limit
+                )
+                response["has_more"] |= has_more
+            else:
+                deleted_position = [datetime.utcnow() - self.settle_time, None]
+            response["deleted"][collection] = [tombstone["id"] for tombstone in deleted]
+            next_positions[stream] = deleted_position
+
+        response["cursor"] = self.encode_cursor(next_positions)
+        return response
+
+    def tombstones_expired(self, positions: Dict[str, Optional[List]]) -> bool:
+        """True when tombstones the client still needs may already have been purged"""
+        horizon = datetime.utcnow() - self.tombstone_ttl
+        return any(
+            position and position[0] < horizon
+            for stream, position in positions.items()
+            if stream.startswith("deleted_")
+        )
@@ -0,0 +1,200 @@
+from pymongo import ASCENDING, UpdateOne
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import logging
+import uuid
+
+from services.priority_service import (
+    DUE_BUCKET_HOURS, MAX_AGE_DAYS, PENDING_STATUSES, PriorityService, classify_quadrant, compute_priority_score
+)
+
+logger = logging.getLogger(__name__)
+
+OVERDUE_SOURCE_STATUSES = ["todo", "in_progress"]
+
+# A task becomes urgent once (due_date - now).days <= 2, i.e. less than 3 days out
+URGENCY_WINDOW = timedelta(days=3)
+
+
+class TaskSweeper:
+    def __init__(self, db, notifications=None):
+        self.db = db
+        self.priorities = PriorityService(db)
+        # NotificationOutbox that overdue alerts are queued on (optional)
+        self.notifications = notifications
+
+    def _transaction(self):
+        # Without an outbox there is nothing to commit alongside the task write
+        return self.notifications.transaction() if self.notifications is not None else nullcontext()
+
+    async def ensure_indexes(self):
+        """Create the due date index used to find tasks crossing time boundaries"""
+        await self.db.tasks.create_index(
+            [("status", ASCENDING), ("due_date", ASCENDING)],
+            name="status_due_date"
+        )
+        # Reads back the tasks one overdue sweep flipped
+        await self.db.tasks.create_index(
+            [("sweep_id", ASCENDING)],
+            sparse=True,
+            name="sweep_id"
+        )
+
+    async def _get_last_run(self, sweeper_name: str) -> Optional[datetime]:
+        state = await self.db.sweeper_state.find_one({"_id": sweeper_name})
+        return state.get("last_run") if state else None
+
+    async def _set_last_run(self, sweeper_name: str, last_run: datetime):
+        await self.db.sweeper_state.update_one(
+            {"_id": sweeper_name},
+            {"$set": {"last_run": last_run}},
+            upsert=True
+        )
+
+    async def sweep_eisenhower_quadrants(self, batch_size: int = 500) -> Dict:
+        """
+        Reclassify pending tasks whose due date crossed the 2-day urgency
+        boundary since the previous sweep
+        """
+        now = datetime.utcnow()
+        last_run = await self._get_last_run("eisenhower_quadrant")
+
+        due_date_filter = {"$lt": now + URGENCY_WINDOW}
+        if last_run:
+            # Only tasks that entered the urgency window since last run
+            due_date_filter["$gte"] = last_run + URGENCY_WINDOW
+        else:
+            due_date_filter["$ne"] = None
+
+        cursor = self.db.tasks.find(
+            {"status": {"$in": PENDING_STATUSES}, "due_date": due_date_filter},
+            {"id": 1, "priority": 1, "eisenhower_quadrant": 1, "due_date": 1, "created_at": 1}
+        )
+
+        operations = []
+        scanned = 0
+        reclassified = 0
+
+        async for task in cursor:
+            scanned += 1
+            quadrant = classify_quadrant(task.get("priority"), task["due_date"], now)
+            if quadrant == task.get("eisenhower_quadrant"):
+                continue
+
+            task["eisenhower_quadrant"] = quadrant
+            operations.append(UpdateOne(
+                {"id": task["id"]},
+                {
+                    "$set": {
+                        "eisenhower_quadrant": quadrant,
+                        "priority_score": compute_priority_score(task, now)
+                    },
+                    # Stamped when the batch is written, not when the sweep started,
+                    # so sync cursors that moved on meanwhile still see the change
+                    "$currentDate": {"updated_at": True},
+                    "$inc": {"version": 1}
+                }
+            ))
+            if len(operations) >= batch_size:
+                result = await self.db.tasks.bulk_write(operations, ordered=False)
+                reclassified += result.modified_count
+                operations = []
+
+        if operations:
+            result = await self.db.tasks.bulk_write(operations, ordered=False)
+            reclassified += result.modified_count
+
+        await self._set_last_run("eisenhower_quadrant", now)
+
+        if reclassified:
+            logger.info(f"Quadrant sweep reclassified {reclassified} of {scanned} tasks")
+
+        return {"scanned": scanned, "reclassified": reclassified}
+
+    async def sweep_priority_scores(self) -> Dict:
+        """
+        Rescore pending tasks whose time-dependent score inputs changed since
+        the previous sweep: a due-date bucket boundary was crossed, or the
+        task aged another whole day (within the age cap)
+        """
+        now = datetime.utcnow()
+        last_run = await self._get_last_run("priority_score")
+
+        query = {"status": {"$in": PENDING_STATUSES}}
+        if last_run:
+            crossed = [
+                {"due_date": {"$gt": last_run + timedelta(hours=hours), "$lte": now + timedelta(hours=hours)}}
+                for hours in DUE_BUCKET_HOURS
+            ] + [
+                {"created_at": {"$gt": last_run - timedelta(days=days), "$lte": now - timedelta(days=days)}}
+                for days in range(1, MAX_AGE_DAYS + 1)
+            ]
+            query["$or"] = crossed
+
+        rescored = await self.priorities.refresh_scores(query)
+        await self._set_last_run("priority_score", now)
+
+        if rescored:
+            logger.info(f"Priority sweep rescored {rescored} tasks")
+
+        return {"rescored": rescored}
+
+    async def _notify_overdue(self, tasks: List[Dict], session=None):
+        """Queue an overdue alert for each assignee with a phone number"""
+        assignees = {task.get("assigned_to") for task in tasks} - {None}
+        if not assignees:
+            return
+        phones = {
+            user["id"]: user["phone_number"]
+            async for user in self.db.users.find(
+                {"id": {"$in": list(assignees)}, "phone_number": {"$type": "string"}},
+                {"_id": 0, "id": 1, "phone_number": 1},
+                session=session
+            )
+        }
+
+        for task in tasks:
+            phone_number = phones.get(task.get("assigned_to"))
+            if not phone_number:
+                continue
+            title = task.get("title", "")
+            # The summary lets a burst of overdue tasks go out as one digest
+            await self.notifications.enqueue(
+                phone_number,
+                f"🔥 *Task Overdue*\n\n{title}\n\nType *list tasks* to see all tasks",
+                "task_overdue",
+                summary=title,
+                task_id=task["id"],
+                session=session
+            )
+
+    async def sweep_overdue(self) -> Dict:
+        """Flip past-due todo/in_progress tasks to overdue and notify their assignees"""
+        # One indexed update_many tags every task it flips with this run's id,
+        # so exactly those tasks are read back for the alerts. The flip and
+        # the alerts commit together where transactions are available
+        sweep_id = str(uuid.uuid4())
+        async with self._transaction() as session:
+            result = await self.db.tasks.update_many(
+                {"status": {"$in": OVERDUE_SOURCE_STATUSES}, "due_date": {"$lt": datetime.utcnow()}},
+                {
+                    "$set": {"status": "overdue", "sweep_id": sweep_id},
+                    # Stamped as each document is written, for sync watermarks
+                    "$currentDate": {"updated_at": True},
+                    "$inc": {"version": 1}
+                },
+                session=session
+            )
+            if result.modified_count and self.notifications is not None:
+                flipped = await self.db.tasks.find(
+                    {"sweep_id": sweep_id},
+                    {"_id": 0, "id": 1, "title": 1, "assigned_to": 1},
+                    session=session
+                ).to_list(None)
+                await self._notify_overdue(flipped, session=session)
+
+        if result.modified_count:
+            logger.info(f"Overdue sweep marked {result.modified_count} tasks overdue")
+
+        return {"marked_overdue": result.modified_count}
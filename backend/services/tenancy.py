@@ -0,0 +1,148 @@
+from pymongo import ASCENDING, DESCENDING
+from typing import Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TenantCollection:
+    """
+    A collection seen through one tenant: every filter gets the tenant
+    condition and every inserted document gets the tenant's company_id.
+    Only the operations the API uses are exposed.
+    """
+
+    def __init__(self, collection, tenant_filter: Dict, company_id: Optional[str]):
+        self.collection = collection
+        self.tenant_filter = tenant_filter
+        self.company_id = company_id
+
+    def scope(self, query: Optional[Dict] = None) -> Dict:
+        if not query:
+            return dict(self.tenant_filter)
+        return {"$and": [self.tenant_filter, query]}
+
+    def _stamp(self, document: Dict) -> Dict:
+        return {**document, "company_id": self.company_id}
+
+    def find(self, query: Optional[Dict] = None, *args, **kwargs):
+        return self.collection.find(self.scope(query), *args, **kwargs)
+
+    async def find_one(self, query: Optional[Dict] = None, *args, **kwargs):
+        return await self.collection.find_one(self.scope(query), *args, **kwargs)
+
+    async def count_documents(self, query: Optional[Dict] = None, **kwargs) -> int:
+        return await self.collection.count_documents(self.scope(query), **kwargs)
+
+    def aggregate(self, pipeline: List[Dict], **kwargs):
+        return self.collection.aggregate([{"$match": self.scope()}, *pipeline], **kwargs)
+
+    async def insert_one(self, document: Dict):
+        return await self.collection.insert_one(self._stamp(document))
+
+    async def insert_many(self, documents: List[Dict], **kwargs):
+        return await self.collection.insert_many([self._stamp(document) for document in documents], **kwargs)
+
+    async def update_one(self, query: Dict, update, **kwargs):
+        return await self.collection.update_one(self.scope(query), update, **kwargs)
+
+    async def update_many(self, query: Dict, update, **kwargs):
+        return await self.collection.update_many(self.scope(query), update, **kwargs)
+
+    async def find_one_and_update(self, query: Dict, update, **kwargs):
+        return await self.collection.find_one_and_update(self.scope(query), update, **kwargs)
+
+    async def find_one_and_delete(self, query: Dict, **kwargs):
+        return await self.collection.find_one_and_delete(self.scope(query), **kwargs)
+
+    async def delete_many(self, query: Optional[Dict] = None):
+        return await self.collection.delete_many(self.scope(query))
+
+
+class TenantRepository:
+    """
+    Entry point for tenant-scoped data access, built from the current user.
+    Members of a company see their company's slice; users without a company
+    only see their own records.
+    """
+
+    def __init__(self, db, user_id: str, company_id: Optional[str]):
+        self.db = db
+        self.user_id = user_id
+        self.company_id = company_id
+
+        if company_id:
+            tenant = {"company_id": company_id}
+            filters = {"users": tenant, "tasks": tenant, "projects": tenant}
+        else:
+            filters = {
+                "users": {"id": user_id},
+                "tasks": {"company_id": None, "$or": [{"assigned_to": user_id}, {"assigned_by": user_id}]},
+                "projects": {"company_id": None, "$or": [{"owner_id": user_id}, {"team_members": user_id}]}
+            }
+
+        self.users = TenantCollection(db.users, filters["users"], company_id)
+        self.tasks = TenantCollection(db.tasks, filters["tasks"], company_id)
+        self.projects = TenantCollection(db.projects, filters["projects"], company_id)
+
+
+async def ensure_tenant_indexes(db):
+    """Indexes led by company_id for the per-tenant queries"""
+    await db.tasks.create_index(
+        [("company_id", ASCENDING), ("assigned_to", ASCENDING), ("status", ASCENDING), ("priority_score", DESCENDING)],
+        name="company_assigned_status_priority_score"
+    )
+    await db.tasks.create_index(
+        [("company_id", ASCENDING), ("status", ASCENDING)],
+        name="company_status"
+    )
+    await db.tasks.create_index(
+        [("company_id", ASCENDING), ("project_id", ASCENDING)],
+        name="company_project"
+    )
+    await db.tasks.create_index(
+        [("company_id", ASCENDING), ("updated_at", ASCENDING), ("id", ASCENDING)],
+        name="company_updated_at_id"
+    )
+    await db.projects.create_index(
+        [("company_id", ASCENDING), ("created_at", ASCENDING)],
+        name="company_created_at"
+    )
+    await db.projects.create_index(
+        [("company_id", ASCENDING), ("updated_at", ASCENDING), ("id", ASCENDING)],
+        name="company_updated_at_id"
+    )
+
+
+async def backfill_company_ids(db) -> Dict[str, int]:
+    """
+    Copy company_id onto tasks and projects written before they carried it,
+    taken from the assignee/assigner or owner. Records with no company user
+    get an explicit None so the migration does not revisit them.
+    """
+    missing = {"company_id": {"$exists": False}}
+    if not await db.tasks.count_documents(missing, limit=1) and not await db.projects.count_documents(missing, limit=1):
+        return {"tasks": 0, "projects": 0}
+
+    members: Dict[str, List[str]] = {}
+    async for user in db.users.find({"company_id": {"$ne": None}}, {"_id": 0, "id": 1, "company_id": 1}):
+        members.setdefault(user["company_id"], []).append(user["id"])
+
+    counts = {"tasks": 0, "projects": 0}
+    for company_id, user_ids in members.items():
+        result = await db.tasks.update_many(
+            {**missing, "$or": [{"assigned_by": {"$in": user_ids}}, {"assigned_to": {"$in": user_ids}}]},
+            {"$set": {"company_id": company_id}}
+        )
+        counts["tasks"] += result.modified_count
+        result = await db.projects.update_many(
+            {**missing, "owner_id": {"$in": user_ids}},
+            {"$set": {"company_id": company_id}}
+        )
+        counts["projects"] += result.modified_count
+
+    await db.tasks.update_many(missing, {"$set": {"company_id": None}})
+    await db.projects.update_many(missing, {"$set": {"company_id": None}})
+
+    logger.info(f"Backfilled company_id on {counts['tasks']} tasks and {counts['projects']} projects")
+    return counts
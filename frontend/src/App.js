@@ -19,6 +19,43 @@ import UserManual from "./components/UserManual";
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
 
+// Tasks, projects, users and analytics are scoped to the signed-in user's company
+axios.interceptors.request.use((config) => {
+  const token = localStorage.getItem('token');
+  if (token && !config.headers.Authorization) {
+    config.headers.Authorization = `Bearer ${token}`;
+  }
+  return config;
+});
+
+// Access tokens are short-lived; renew once with the refresh token and retry
+let refreshing = null;
+axios.interceptors.response.use(undefined, async (error) => {
+  const original = error.config;
+  const refreshToken = localStorage.getItem('refresh_token');
+  if (error.response?.status !== 401 || !refreshToken || original._retried || original.url.endsWith('/auth/refresh')) {
+    return Promise.reject(error);
+  }
+  original._retried = true;
+
+  try {
+    // Concurrent 401s share one refresh, since each refresh token only works once
+    refreshing = refreshing || axios.post(`${API}/auth/refresh`, { refresh_token: refreshToken });
+    const response = await refreshing;
+    localStorage.setItem('token', response.data.access_token);
+    localStorage.setItem('refresh_token', response.data.refresh_token);
+  } catch (refreshError) {
+    localStorage.removeItem('token');
+    localStorage.removeItem('refresh_token');
+    return Promise.reject(error);
+  } finally {
+    refreshing = null;
+  }
+
+  original.headers.Authorization = `Bearer ${localStorage.getItem('token')}`;
+  return axios(original);
+});
+
 // Navigation Component
 const Navigation = ({ activeSection, setActiveSection, onLogout, user }) => {
   const [showMoreMenu, setShowMoreMenu] = useState(false);
@@ -207,7 +244,12 @@ function App() {
   };
 
   const handleLogout = () => {
+    const refreshToken = localStorage.getItem('refresh_token');
+    if (refreshToken) {
+      axios.post(`${API}/auth/logout`, { refresh_token: refreshToken }).catch(console.error);
+    }
     localStorage.removeItem('token');
+    localStorage.removeItem('refresh_token');
     localStorage.removeItem('user');
     setUser(null);
     setIsAuthenticated(false);
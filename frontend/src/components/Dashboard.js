@@ -1,5 +1,6 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import axios from 'axios';
+import useTaskFeed from './useTaskFeed';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
@@ -12,6 +13,18 @@ const Dashboard = () => {
     fetchAnalytics();
   }, []);
 
+  // Task changes move the numbers; refresh at most once every few seconds
+  const refreshTimer = useRef(null);
+  useEffect(() => () => clearTimeout(refreshTimer.current), []);
+  useTaskFeed((event) => {
+    if (!event.type.startsWith('task.') && event.type !== 'resync') return;
+    if (refreshTimer.current) return;
+    refreshTimer.current = setTimeout(() => {
+      refreshTimer.current = null;
+      fetchAnalytics();
+    }, 3000);
+  });
+
   const fetchAnalytics = async () => {
     try {
       const response = await axios.get(`${API}/analytics/dashboard`);
@@ -204,7 +217,7 @@ const Dashboard = () => {
           </h3>
           <button
             onClick={() => {
-              fetch(`${API}/populate-sample-data`, { method: 'POST' })
+              axios.post(`${API}/populate-sample-data`)
                 .then(() => {
                   window.location.reload();
                 })
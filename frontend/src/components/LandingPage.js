@@ -227,6 +227,7 @@ const LandingPage = ({ onLogin }) => {
       if (response.data.access_token) {
         // Store token and user data
         localStorage.setItem('token', response.data.access_token);
+        localStorage.setItem('refresh_token', response.data.refresh_token);
         localStorage.setItem('user', JSON.stringify(response.data.user));
         setShowLogin(false);
         onLogin(response.data.user);
@@ -244,13 +245,17 @@ const LandingPage = ({ onLogin }) => {
           errorMessage = 'Invalid email or password';
         } else if (error.response.status === 422) {
           errorMessage = 'Please enter valid email and password';
+        } else if (error.response.status === 429) {
+          const retryAfter = parseInt(error.response.headers['retry-after'], 10);
+          errorMessage = 'Too many login attempts. Please try again' +
+            (retryAfter ? ` in ${Math.ceil(retryAfter / 60)} minute(s)` : ' later');
         } else if (error.response.data?.detail) {
           errorMessage = error.response.data.detail;
         }
       } else if (error.message) {
         errorMessage += ': ' + error.message;
       }
-      
+
       alert('❌ ' + errorMessage);
     }
     setLoading(false);
@@ -317,6 +322,7 @@ const LandingPage = ({ onLogin }) => {
                     console.log('✅ Test login successful:', response.data);
                     if (response.data.access_token) {
                       localStorage.setItem('token', response.data.access_token);
+                      localStorage.setItem('refresh_token', response.data.refresh_token);
                       localStorage.setItem('user', JSON.stringify(response.data.user));
                       onLogin(response.data.user);
                     }
@@ -3,6 +3,8 @@ import axios from 'axios';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
+// WhatsApp rotates the pairing QR roughly every 20 seconds
+const QR_REFRESH_MS = 15000;
 
 const SimpleWhatsAppIntegration = ({ currentUser }) => {
   const [connectionStatus, setConnectionStatus] = useState('disconnected');
@@ -12,23 +14,56 @@ const SimpleWhatsAppIntegration = ({ currentUser }) => {
   const [isConnected, setIsConnected] = useState(false);
 
   useEffect(() => {
-    checkWhatsAppStatus();
-    // Auto-refresh status every 5 seconds
-    const interval = setInterval(checkWhatsAppStatus, 5000);
-    return () => clearInterval(interval);
+    // Status changes are pushed by the backend; poll only if the stream is unavailable
+    let interval = null;
+    let source = null;
+
+    if (window.EventSource) {
+      source = new EventSource(`${API}/whatsapp/status/stream`);
+      source.onmessage = (event) => handleStatus(JSON.parse(event.data));
+      source.onerror = () => {
+        if (source.readyState === EventSource.CLOSED && !interval) {
+          interval = setInterval(checkWhatsAppStatus, 5000);
+        }
+      };
+    } else {
+      checkWhatsAppStatus();
+      // Auto-refresh status every 5 seconds
+      interval = setInterval(checkWhatsAppStatus, 5000);
+    }
+
+    return () => {
+      if (source) source.close();
+      if (interval) clearInterval(interval);
+    };
   }, []);
 
+  // Once a QR code has been requested, keep it fresh until the phone is
+  // linked; the status stream does not announce a rotated code
+  const waitingForScan = !isConnected && Boolean(qrCode || connectionStatus === 'waiting_for_qr');
+
+  useEffect(() => {
+    if (!waitingForScan) return undefined;
+
+    const interval = setInterval(getQRCode, QR_REFRESH_MS);
+    return () => clearInterval(interval);
+  }, [waitingForScan]);
+
+  const handleStatus = (status) => {
+    if (status.connected) {
+      setConnectionStatus('connected');
+      setIsConnected(true);
+      setPhoneNumber(status.phone_number || '');
+    } else {
+      setConnectionStatus('disconnected');
+      setIsConnected(false);
+    }
+  };
+
   const checkWhatsAppStatus = async () => {
     try {
       const response = await axios.get(`${API}/whatsapp/status`);
-      if (response.data.connected) {
-        setConnectionStatus('connected');
-        setIsConnected(true);
-        setPhoneNumber(response.data.phone_number || '');
-      } else {
-        setConnectionStatus('disconnected');
-        setIsConnected(false);
-      }
+      handleStatus(response.data);
     } catch (error) {
       console.error('Error checking WhatsApp status:', error);
       setConnectionStatus('unavailable');
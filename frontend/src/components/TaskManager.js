@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import axios from 'axios';
+import useTaskFeed from './useTaskFeed';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
@@ -35,6 +36,32 @@ const TaskManager = ({ currentUser, users }) => {
     }
   };
 
+  // Apply live changes instead of refetching the whole list
+  useTaskFeed((event) => {
+    if (event.type === 'resync') {
+      fetchTasks();
+    } else if (event.type === 'task.deleted') {
+      setTasks((current) => current.filter((task) => task.id !== event.id));
+    } else if (event.type === 'task.created' || event.type === 'task.updated') {
+      setTasks((current) => {
+        const existing = current.find((task) => task.id === event.id);
+        const merged = event.task || (existing && { ...existing, ...event.changes });
+        if (!merged) {
+          // A partial update for a task we are not showing (e.g. it just matched the filter)
+          if (filter === 'all' || event.changes?.status === filter) fetchTasks();
+          return current;
+        }
+        (event.removed || []).forEach((field) => delete merged[field]);
+        if (filter !== 'all' && merged.status !== filter) {
+          return current.filter((task) => task.id !== event.id);
+        }
+        return existing
+          ? current.map((task) => (task.id === event.id ? merged : task))
+          : [merged, ...current];
+      });
+    }
+  });
+
   const createTask = async () => {
     try {
       console.log('Creating task with data:', newTask);
@@ -62,10 +89,18 @@ const TaskManager = ({ currentUser, users }) => {
   };
 
   const updateTask = async (taskId, updates) => {
+    const task = tasks.find((t) => t.id === taskId);
     try {
-      await axios.put(`${API}/tasks/${taskId}`, updates);
+      // Only overwrite the version we are looking at
+      const headers = task && task.version !== undefined ? { 'If-Match': `"${task.version}"` } : {};
+      await axios.put(`${API}/tasks/${taskId}`, updates, { headers });
       fetchTasks();
     } catch (error) {
+      if (error.response?.status === 412) {
+        alert('This task was changed by someone else. The latest version has been loaded.');
+        fetchTasks();
+        return;
+      }
       console.error('Error updating task:', error);
     }
   };
@@ -79,6 +114,23 @@ const TaskManager = ({ currentUser, users }) => {
     }
   };
 
+  const clearCompletedTasks = async () => {
+    const completed = tasks.filter((task) => task.status === 'completed');
+    if (completed.length === 0 || !window.confirm(`Delete ${completed.length} completed tasks?`)) return;
+    try {
+      // One request for the whole cleanup
+      const response = await axios.post(`${API}/tasks/bulk`, {
+        operations: completed.map((task) => ({ op: 'delete', id: task.id, version: task.version }))
+      });
+      if (response.data.failed) {
+        alert(`${response.data.failed} tasks changed in the meantime and were kept.`);
+      }
+      fetchTasks();
+    } catch (error) {
+      console.error('Error deleting completed tasks:', error);
+    }
+  };
+
   const getUserName = (userId) => {
     const user = users.find(u => u.id === userId);
     return user ? user.name : 'Unassigned';
@@ -173,6 +225,14 @@ const TaskManager = ({ currentUser, users }) => {
             {filterOption.label}
           </button>
         ))}
+        {tasks.some((task) => task.status === 'completed') && (
+          <button
+            onClick={clearCompletedTasks}
+            className="px-4 py-2 rounded-xl font-medium transition-all bg-white text-red-600 hover:bg-red-50"
+          >
+            Clear Completed
+          </button>
+        )}
       </div>
 
       {/* Tasks Grid */}
@@ -1,5 +1,6 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import axios from 'axios';
+import useTaskFeed from './useTaskFeed';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
@@ -14,6 +15,18 @@ const TeamPerformance = ({ users }) => {
     fetchTeamPerformance();
   }, []);
 
+  // Task changes move the numbers; refresh at most once every few seconds
+  const refreshTimer = useRef(null);
+  useEffect(() => () => clearTimeout(refreshTimer.current), []);
+  useTaskFeed((event) => {
+    if (!event.type.startsWith('task.') && event.type !== 'resync') return;
+    if (refreshTimer.current) return;
+    refreshTimer.current = setTimeout(() => {
+      refreshTimer.current = null;
+      fetchTeamPerformance();
+    }, 3000);
+  });
+
   const fetchTeamPerformance = async () => {
     try {
       const response = await axios.get(`${API}/analytics/team-performance`);
@@ -4,6 +4,8 @@ import SimpleWhatsAppIntegration from './SimpleWhatsAppIntegration';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
+// WhatsApp rotates the pairing QR roughly every 20 seconds
+const QR_REFRESH_MS = 15000;
 
 const WhatsAppIntegration = ({ currentUser }) => {
   const [whatsappStatus, setWhatsappStatus] = useState(null);
@@ -17,22 +19,55 @@ const WhatsAppIntegration = ({ currentUser }) => {
   const [sendingTeamMessage, setSendingTeamMessage] = useState(false);
 
   useEffect(() => {
-    checkWhatsAppStatus();
-    const interval = setInterval(checkWhatsAppStatus, 5000); // Check every 5 seconds
-    return () => clearInterval(interval);
+    // The backend pushes status changes; fall back to polling if the stream is unavailable
+    let interval = null;
+    let source = null;
+
+    if (window.EventSource) {
+      source = new EventSource(`${API}/whatsapp/status/stream`);
+      source.onmessage = (event) => handleStatus(JSON.parse(event.data));
+      source.onerror = () => {
+        if (source.readyState === EventSource.CLOSED && !interval) {
+          interval = setInterval(checkWhatsAppStatus, 5000);
+        }
+      };
+    } else {
+      checkWhatsAppStatus();
+      interval = setInterval(checkWhatsAppStatus, 5000); // Check every 5 seconds
+    }
+
+    return () => {
+      if (source) source.close();
+      if (interval) clearInterval(interval);
+    };
   }, []);
 
+  useEffect(() => {
+    // The status stream only reports status changes, not a rotated QR code,
+    // so keep re-fetching it while the service waits for a scan
+    const waitingForScan = whatsappStatus && !whatsappStatus.connected &&
+      ['qr_ready', 'disconnected'].includes(whatsappStatus.status);
+    if (!waitingForScan) return undefined;
+
+    const interval = setInterval(fetchQRCode, QR_REFRESH_MS);
+    return () => clearInterval(interval);
+  }, [whatsappStatus?.connected, whatsappStatus?.status]);
+
+  const handleStatus = (status) => {
+    setWhatsappStatus(status);
+    
+    // If QR code is needed, fetch it
+    if (status.status === 'qr_ready' || (!status.connected && !qrCode)) {
+      fetchQRCode();
+    } else if (status.connected) {
+      setQrCode(null);
+    }
+  };
+
   const checkWhatsAppStatus = async () => {
     try {
       const response = await axios.get(`${API}/whatsapp/status`);
-      setWhatsappStatus(response.data);
-      
-      // If QR code is needed, fetch it
-      if (response.data.status === 'qr_ready' || (!response.data.connected && !qrCode)) {
-        fetchQRCode();
-      } else if (response.data.connected) {
-        setQrCode(null);
-      }
+      handleStatus(response.data);
     } catch (error) {
       console.error('Error checking WhatsApp status:', error);
       setWhatsappStatus({
@@ -0,0 +1,70 @@
+import { useEffect, useRef } from 'react';
+import axios from 'axios';
+
+const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
+const API = `${BACKEND_URL}/api`;
+const WS_URL = `${(BACKEND_URL || '').replace(/^http/, 'ws')}/api/ws`;
+
+// Subscribes to live task/project changes; reconnects with backoff when the socket drops
+const useTaskFeed = (onEvent) => {
+  const handlerRef = useRef(onEvent);
+  handlerRef.current = onEvent;
+
+  useEffect(() => {
+    if (!localStorage.getItem('token')) return undefined;
+
+    let socket = null;
+    let retryTimer = null;
+    let attempts = 0;
+    let closed = false;
+
+    const connect = () => {
+      // Read the token on every attempt: it may have been refreshed since the last one
+      const token = localStorage.getItem('token');
+      if (!token) return;
+      let opened = false;
+      socket = new WebSocket(`${WS_URL}?token=${encodeURIComponent(token)}`);
+
+      socket.onopen = () => {
+        opened = true;
+        // Anything may have changed while disconnected
+        if (attempts > 0) handlerRef.current({ type: 'resync' });
+        attempts = 0;
+      };
+
+      socket.onmessage = (message) => {
+        const event = JSON.parse(message.data);
+        if (event.type !== 'ping' && event.type !== 'hello') {
+          handlerRef.current(event);
+        }
+      };
+
+      socket.onclose = async (event) => {
+        if (closed) return;
+        if (event.code === 4401 || !opened) {
+          // Check the session over HTTP; the axios interceptor refreshes an
+          // expired access token, and a 401 after that means we are logged out
+          try {
+            await axios.get(`${API}/auth/me`);
+          } catch (error) {
+            if (error.response?.status === 401) return;
+          }
+          if (closed) return;
+        }
+        attempts += 1;
+        const delay = Math.min(30000, 1000 * 2 ** attempts);
+        retryTimer = setTimeout(connect, delay);
+      };
+    };
+
+    connect();
+
+    return () => {
+      closed = true;
+      clearTimeout(retryTimer);
+      if (socket) socket.close();
+    };
+  }, []);
+};
+
+export default useTaskFeed;
@@ -0,0 +1,108 @@
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend")
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# SDKs that must only be imported when a route first needs them
+LAZY_MODULES = [
+    "openai",
+    "anthropic",
+    "google.generativeai",
+    "googleapiclient.discovery",
+    "google_auth_oauthlib.flow",
+    "google.oauth2.credentials",
+    "qrcode",
+    "requests",
+]
+
+RUNS = 5
+
+# Runs in a fresh interpreter so every measurement is a cold import
+IMPORT_APP = """
+import json, sys, time
+start = time.perf_counter()
+import server
+elapsed = time.perf_counter() - start
+from routers import find_duplicate_routes
+print(json.dumps({
+    "seconds": elapsed,
+    "routes": len(server.app.routes),
+    "duplicates": find_duplicate_routes(server.app),
+    "loaded": [name for name in %r if name in sys.modules],
+}))
+"""
+
+IMPORT_MODULE = """
+import json, time
+start = time.perf_counter()
+try:
+    import %s
+    print(json.dumps({"seconds": time.perf_counter() - start}))
+except ImportError:
+    print(json.dumps({"seconds": None}))
+"""
+
+
+def run_child(code: str) -> dict:
+    env = dict(os.environ)
+    # The Mongo client connects lazily, so importing the app needs no server
+    env.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    env.setdefault("DB_NAME", "startup_benchmark")
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run_benchmark():
+    logger.info(f"Cold-importing the API app {RUNS} times")
+
+    try:
+        samples = [run_child(IMPORT_APP % (LAZY_MODULES,)) for _ in range(RUNS)]
+    except RuntimeError as e:
+        logger.error(f"App failed to import: {e}")
+        return False
+
+    times = sorted(sample["seconds"] for sample in samples)
+    logger.info(f"{'app import (median)':<40} {statistics.median(times) * 1000:>8.0f} ms")
+    logger.info(f"{'app import (min / max)':<40} {times[0] * 1000:>8.0f} / {times[-1] * 1000:.0f} ms")
+    logger.info(f"{'registered routes':<40} {samples[0]['routes']:>8}")
+
+    # What the lazy imports keep off the startup path
+    for name in LAZY_MODULES:
+        cost = run_child(IMPORT_MODULE % name)["seconds"]
+        if cost is None:
+            logger.info(f"{name:<40} {'not installed':>12}")
+        else:
+            logger.info(f"{name:<40} {cost * 1000:>8.0f} ms deferred to first use")
+
+    success = True
+    if samples[0]["duplicates"]:
+        logger.error(f"Duplicate route registrations: {', '.join(samples[0]['duplicates'])}")
+        success = False
+    if samples[0]["loaded"]:
+        logger.error(f"Imported at startup instead of on first use: {', '.join(samples[0]['loaded'])}")
+        success = False
+
+    if success:
+        logger.info("No duplicate routes and no integration SDKs loaded at startup")
+    return success
+
+
+if __name__ == "__main__":
+    success = run_benchmark()
+    sys.exit(0 if success else 1)
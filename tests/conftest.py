@@ -0,0 +1,63 @@
+import os
+import sys
+import uuid
+
+import pytest
+
+# The backend runs from its own directory (uvicorn server:app), so its
+# modules import each other as top-level packages
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+TEST_MONGO_URL = os.environ.get("TEST_MONGO_URL", "mongodb://localhost:27017")
+
+
+@pytest.fixture
+def mongo_db_name():
+    """A throwaway database name on TEST_MONGO_URL; skips when no server is reachable"""
+    from pymongo import MongoClient
+    from pymongo.errors import PyMongoError
+
+    client = MongoClient(TEST_MONGO_URL, serverSelectionTimeoutMS=500)
+    try:
+        client.admin.command("ping")
+    except PyMongoError:
+        pytest.skip(f"MongoDB is not reachable at {TEST_MONGO_URL}")
+
+    name = f"test_{uuid.uuid4().hex[:12]}"
+    yield name
+    client.drop_database(name)
+    client.close()
+
+
+def motor_db(name: str):
+    """Motor handle for a test database; create it inside the test's event loop"""
+    from motor.motor_asyncio import AsyncIOMotorClient
+    return AsyncIOMotorClient(TEST_MONGO_URL)[name]
+
+
+class HookedTasks:
+    """tasks collection that runs a hook right before each bulk write"""
+
+    def __init__(self, collection, before_write):
+        self.collection = collection
+        self.before_write = before_write
+
+    async def bulk_write(self, *args, **kwargs):
+        await self.before_write()
+        return await self.collection.bulk_write(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.collection, name)
+
+
+class HookedDb:
+    """Database whose tasks collection lets a test interleave a concurrent write"""
+
+    def __init__(self, db, before_write):
+        self.db = db
+        self.tasks = HookedTasks(db.tasks, before_write)
+
+    def __getattr__(self, name):
+        return getattr(self.db, name)
@@ -0,0 +1,75 @@
+import asyncio
+import uuid
+from datetime import timedelta
+
+from services.auth_sessions import BloomFilter, RefreshSessionStore
+from tests.conftest import motor_db
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    members = [str(uuid.uuid4()) for _ in range(1000)]
+    for member in members:
+        bloom.add(member)
+
+    assert all(member in bloom for member in members)
+    false_positives = sum(str(uuid.uuid4()) in bloom for _ in range(10000))
+    assert false_positives < 300
+
+
+def test_rotation_replaces_the_token_and_keeps_the_session(mongo_db_name):
+    async def scenario():
+        store = RefreshSessionStore(motor_db(mongo_db_name))
+        await store.ensure_indexes()
+        session_id, first = await store.create("u1")
+
+        rotated = await store.rotate(first)
+        assert rotated["session_id"] == session_id and rotated["user_id"] == "u1"
+        assert rotated["refresh_token"] != first
+        assert (await store.rotate(rotated["refresh_token"]))["session_id"] == session_id
+        assert await store.rotate("not-a-token") is None
+
+    asyncio.run(scenario())
+
+
+def test_reusing_a_rotated_token_revokes_the_family(mongo_db_name):
+    async def scenario():
+        store = RefreshSessionStore(motor_db(mongo_db_name), secret="s", reuse_grace=timedelta(0))
+        session_id, first = await store.create("u1")
+        second = (await store.rotate(first))["refresh_token"]
+
+        await asyncio.sleep(0.01)
+        assert await store.rotate(first) is None
+        assert await store.is_revoked(session_id)
+        # The legitimate holder's newer token dies with the family
+        assert await store.rotate(second) is None
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_refreshes_within_the_grace_window_share_a_successor(mongo_db_name):
+    async def scenario():
+        store = RefreshSessionStore(motor_db(mongo_db_name), secret="s", reuse_grace=timedelta(seconds=30))
+        session_id, first = await store.create("u1")
+
+        results = await asyncio.gather(*(store.rotate(first) for _ in range(3)))
+        assert all(result and result["session_id"] == session_id for result in results)
+        assert len({result["refresh_token"] for result in results}) == 1
+        assert not await store.is_revoked(session_id)
+
+    asyncio.run(scenario())
+
+
+def test_revocations_reach_other_workers_on_sync(mongo_db_name):
+    async def scenario():
+        db = motor_db(mongo_db_name)
+        worker_a, worker_b = RefreshSessionStore(db), RefreshSessionStore(db)
+        await worker_b.sync()
+        session_id, token = await worker_a.create("u1")
+
+        assert await worker_a.revoke_token(token)
+        assert not await worker_b.is_revoked(session_id)
+        await worker_b.sync()
+        assert await worker_b.is_revoked(session_id)
+
+    asyncio.run(scenario())
@@ -0,0 +1,60 @@
+import asyncio
+from datetime import datetime
+
+from models import BulkTaskOperation, BulkTaskRequest, TaskCreate, TaskUpdate
+from services.sync import DeltaSync
+from services.tenancy import TenantRepository
+from tests.conftest import HookedDb, motor_db
+
+
+def _task(task_id, **fields):
+    now = datetime.utcnow()
+    return {"id": task_id, "title": task_id, "status": "todo", "priority": "medium", "assigned_to": "u1",
+            "assigned_by": "u1", "company_id": "c1", "version": 0, "created_at": now, "updated_at": now, **fields}
+
+
+def test_bulk_reports_each_operation_and_concurrent_edits_as_conflicts(mongo_db_name, monkeypatch):
+    import routers.tasks as tasks_router
+
+    async def scenario():
+        db = motor_db(mongo_db_name)
+        await db.users.insert_many([{"id": "u1", "company_id": "c1"}, {"id": "u2", "company_id": "c1"},
+                                    {"id": "x1", "company_id": "c2"}])
+        await db.tasks.insert_many([_task(task_id) for task_id in ("t1", "t2", "t3", "t4")] +
+                                   [_task("other", company_id="c2", assigned_to="x1", assigned_by="x1")])
+
+        async def someone_else_edits():
+            # Lands between the endpoint's read and its bulk write
+            await db.tasks.update_many({"id": {"$in": ["t2", "t4"]}}, {"$set": {"title": "edited"}, "$inc": {"version": 1}})
+
+        monkeypatch.setattr(tasks_router, "db", HookedDb(db, someone_else_edits))
+        monkeypatch.setattr(tasks_router, "delta_sync", DeltaSync(db))
+
+        response = await tasks_router.bulk_task_operations(
+            BulkTaskRequest(operations=[
+                BulkTaskOperation(op="status", id="t1", status="completed"),
+                BulkTaskOperation(op="update", id="t2", changes=TaskUpdate(title="mine")),
+                BulkTaskOperation(op="delete", id="t3"),
+                BulkTaskOperation(op="delete", id="t4"),
+                BulkTaskOperation(op="reassign", id="t1", assigned_to="u2"),
+                BulkTaskOperation(op="update", id="other", changes=TaskUpdate(title="theirs")),
+                BulkTaskOperation(op="update", id="t3", version=5, changes=TaskUpdate(title="stale")),
+                BulkTaskOperation(op="create", task=TaskCreate(title="new", assigned_to="x1")),
+                BulkTaskOperation(op="create", task=TaskCreate(title="new", assigned_to="u2")),
+            ]),
+            tenant=TenantRepository(db, "u1", "c1")
+        )
+
+        statuses = [result["status"] for result in response["results"]]
+        assert statuses == ["ok", "conflict", "ok", "conflict", "error", "not_found", "error", "error", "ok"]
+        assert response["results"][0]["version"] == 1
+        assert (response["succeeded"], response["failed"]) == (3, 6)
+
+        stored = {task["id"]: task for task in await db.tasks.find({}, {"_id": 0}).to_list(None)}
+        assert stored["t1"]["status"] == "completed" and stored["t1"]["updated_at"] > stored["t1"]["created_at"]
+        assert stored["t2"]["title"] == "edited"
+        assert "t3" not in stored and "t4" in stored
+        assert stored["other"]["title"] == "other"
+        assert await db.deleted_records.count_documents({"id": "t3"}) == 1
+
+    asyncio.run(scenario())
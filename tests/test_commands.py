@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+from services.commands import CommandRouter, int_arg, split_arg, text_arg
+
+
+async def echo(user, **kwargs):
+    return kwargs
+
+
+async def unknown(user, text):
+    return f"unknown: {text}"
+
+
+def _router():
+    router = CommandRouter(fallback=unknown)
+    router.register("create task", echo, prefixes=("create task:", "add task:"), parser=text_arg("description"),
+                    usage="usage: create task: <description>")
+    router.register("assign task", echo, prefixes=("assign task to ",), parser=split_arg("assignee", "description"))
+    router.register("complete task", echo, prefixes=("complete task", "done task"), parser=int_arg("number"))
+    router.register("list tasks", echo, phrases=("list tasks", "tasks"))
+    return router
+
+
+def test_phrases_match_exactly_and_prefixes_keep_the_rest():
+    router = _router()
+    command, rest = router.match("tasks")
+    assert command.name == "list tasks" and rest == ""
+    command, rest = router.match("add task: buy milk")
+    assert command.name == "create task" and rest == " buy milk"
+    assert router.match("tasks please") == (None, "tasks please")
+
+
+def test_longest_prefix_wins_whatever_the_registration_order():
+    router = CommandRouter()
+    router.register("short", echo, prefixes=("remind",))
+    router.register("long", echo, prefixes=("remind me at",))
+    # A shorter prefix registered later regroups the buckets
+    router.register("shorter", echo, prefixes=("re",))
+    assert router.match("remind me at 9")[0].name == "long"
+    assert router.match("remind team")[0].name == "short"
+    assert router.match("reply")[0].name == "shorter"
+
+
+def test_duplicate_phrases_and_prefixes_are_rejected():
+    router = _router()
+    with pytest.raises(ValueError):
+        router.register("again", echo, phrases=("tasks",))
+    with pytest.raises(ValueError):
+        router.register("again", echo, prefixes=("done task",))
+
+
+def test_dispatch_parses_arguments_and_reports_usage():
+    router = _router()
+
+    async def scenario():
+        assert await router.dispatch(None, "create task: buy milk") == {"description": "buy milk"}
+        assert await router.dispatch(None, "assign task to john: review docs") == {"assignee": "john", "description": "review docs"}
+        assert await router.dispatch(None, "done task number 3") == {"number": 3}
+        assert await router.dispatch(None, "create task:") == "usage: create task: <description>"
+        assert await router.dispatch(None, "complete task") == "📝 Missing details for *complete task*"
+        assert await router.dispatch(None, "hello") == "unknown: hello"
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("message, expected", [
+    ("create task: buy groceries", "create task"),
+    ("assign task to john: review documents", "assign task"),
+    ("show team", "team list"),
+    ("broadcast: meeting in 10 minutes", "message team"),
+    ("my tasks", "list tasks"),
+    ("complete task 3", "complete task"),
+    ("dashboard", "stats"),
+    ("advice", "coach"),
+    ("?", "help"),
+])
+def test_server_command_table(message, expected):
+    from routers.whatsapp import whatsapp_commands
+    assert whatsapp_commands.match(message)[0].name == expected
@@ -0,0 +1,64 @@
+import asyncio
+from datetime import timedelta
+
+from services.idempotency import COMPLETED, PROCESSING, InboundMessageStore
+from tests.conftest import motor_db
+
+
+def test_redelivery_gets_the_recorded_reply(mongo_db_name):
+    async def scenario():
+        store = InboundMessageStore(motor_db(mongo_db_name), wait_timeout=1.0)
+        await store.ensure_indexes()
+
+        claims = await asyncio.gather(*(store.claim("m1", "+1") for _ in range(5)))
+        assert claims.count(None) == 1
+        assert all(record["status"] == PROCESSING for record in claims if record)
+
+        await store.complete("m1", "Task created")
+        record = await store.claim("m1", "+1")
+        assert record["status"] == COMPLETED and record["reply"] == "Task created"
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_redelivery_waits_for_the_first_reply(mongo_db_name):
+    async def scenario():
+        store = InboundMessageStore(motor_db(mongo_db_name), wait_timeout=2.0)
+        assert await store.claim("m1", "+1") is None
+        pending = await store.claim("m1", "+1")
+
+        async def finish_later():
+            await asyncio.sleep(0.3)
+            await store.complete("m1", "Done")
+
+        record, _ = await asyncio.gather(store.wait_for_reply("m1", pending), finish_later())
+        assert record["reply"] == "Done"
+
+    asyncio.run(scenario())
+
+
+def test_one_redelivery_takes_over_a_stale_claim(mongo_db_name):
+    async def scenario():
+        store = InboundMessageStore(motor_db(mongo_db_name), claim_timeout=timedelta(milliseconds=100))
+        await store.ensure_indexes()
+        assert await store.claim("m1", "+1") is None
+
+        # Still fresh: the worker that claimed it may be running the command
+        assert (await store.claim("m1", "+1"))["status"] == PROCESSING
+
+        await asyncio.sleep(0.2)
+        claims = await asyncio.gather(*(store.claim("m1", "+1") for _ in range(5)))
+        assert claims.count(None) == 1
+
+    asyncio.run(scenario())
+
+
+def test_released_messages_run_again(mongo_db_name):
+    async def scenario():
+        store = InboundMessageStore(motor_db(mongo_db_name))
+        await store.ensure_indexes()
+        assert await store.claim("m1", "+1") is None
+        await store.release("m1")
+        assert await store.claim("m1", "+1") is None
+
+    asyncio.run(scenario())
@@ -0,0 +1,128 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from services.notifications import DEAD_LETTER, DELIVERED, PENDING, SENDING, NotificationOutbox, build_digest
+from tests.conftest import motor_db
+
+
+def _assignment(title):
+    return {"kind": "task_assigned", "message": f"New task: {title}", "summary": title}
+
+
+def test_single_notification_is_sent_as_is():
+    assert build_digest([_assignment("Ship it")]) == "New task: Ship it"
+
+
+def test_digest_lists_each_summary_under_one_header():
+    digest = build_digest([_assignment("A"), _assignment("B")])
+    assert digest.startswith("📋 *2 New Tasks Assigned!*")
+    assert "1. A\n2. B\n" in digest
+
+
+def test_mixed_kinds_get_the_generic_header():
+    digest = build_digest([_assignment("A"), {"kind": "task_completed", "message": "Done: B", "summary": None}])
+    assert digest.startswith("🔔 *2 Updates*")
+    assert "2. Done: B" in digest
+
+
+def _outbox(db, sent, **kwargs):
+    async def send(recipient, message):
+        sent.append((recipient, message))
+        return True
+    return NotificationOutbox(db, send, **kwargs)
+
+
+def test_a_burst_shares_the_first_notifications_digest_window(mongo_db_name):
+    async def scenario():
+        db = motor_db(mongo_db_name)
+        sent = []
+        outbox = _outbox(db, sent, digest_window=timedelta(milliseconds=300))
+        await outbox.ensure_indexes()
+
+        first = await outbox.enqueue("+1", "New task: A", "task_assigned", summary="A")
+        await asyncio.sleep(0.2)
+        second = await outbox.enqueue("+1", "New task: B", "task_assigned", summary="B")
+        # Joining the open window does not push delivery further out
+        assert abs(second["next_attempt_at"] - first["next_attempt_at"]) < timedelta(milliseconds=1)
+
+        assert await outbox.dispatch_once() == 0
+        await asyncio.sleep(0.15)
+        assert await outbox.dispatch_once() == 2
+        assert len(sent) == 1 and "1. A\n2. B\n" in sent[0][1]
+
+    asyncio.run(scenario())
+
+
+def test_urgent_notifications_flush_the_waiting_digest_first(mongo_db_name):
+    async def scenario():
+        db = motor_db(mongo_db_name)
+        sent = []
+        outbox = _outbox(db, sent, digest_window=timedelta(minutes=5))
+
+        await outbox.enqueue("+1", "New task: A", "task_assigned", summary="A")
+        await outbox.enqueue("+1", "Overdue!", "task_overdue", urgent=True)
+        assert await outbox.dispatch_once() == 1
+        assert await outbox.dispatch_once() == 1
+        assert [message for _, message in sent] == ["New task: A", "Overdue!"]
+
+    asyncio.run(scenario())
+
+
+def test_backoff_grows_exponentially_with_jitter_up_to_the_cap():
+    outbox = NotificationOutbox(None, None, base_delay=timedelta(seconds=4), max_delay=timedelta(seconds=60))
+    for attempts, full in [(1, 4), (2, 8), (3, 16), (5, 60), (10, 60)]:
+        for _ in range(20):
+            delay = outbox._backoff(attempts).total_seconds()
+            assert full / 2 <= delay <= full
+
+
+def test_failed_deliveries_retry_then_dead_letter(mongo_db_name):
+    async def scenario():
+        db = motor_db(mongo_db_name)
+        attempts = []
+
+        async def send(recipient, message):
+            attempts.append(message)
+            if len(attempts) <= 2:
+                raise RuntimeError("sidecar down")
+            return True
+
+        outbox = NotificationOutbox(db, send, max_attempts=2, base_delay=timedelta(milliseconds=10))
+        notification = await outbox.enqueue("+1", "Overdue!", "task_overdue", task_id="t1", urgent=True)
+
+        assert await outbox.dispatch_once() == 0
+        [row] = await outbox.delivery_status("t1")
+        assert row["status"] == PENDING and row["attempts"] == 1 and row["last_error"] == "sidecar down"
+        assert row["next_attempt_at"] > notification["next_attempt_at"]
+
+        await asyncio.sleep(0.05)
+        assert await outbox.dispatch_once() == 0
+        [row] = await outbox.delivery_status("t1")
+        assert row["status"] == DEAD_LETTER and row["attempts"] == 2
+
+        # Dead letters stay out of the queue until they are requeued
+        assert await outbox.dispatch_once() == 0
+        assert await outbox.retry_dead_letters("t1") == 1
+        assert await outbox.dispatch_once() == 1
+        [row] = await outbox.delivery_status("t1")
+        assert row["status"] == DELIVERED and attempts == ["Overdue!"] * 3
+
+    asyncio.run(scenario())
+
+
+def test_messages_left_sending_by_a_crashed_worker_are_requeued(mongo_db_name):
+    async def scenario():
+        db = motor_db(mongo_db_name)
+        sent = []
+        outbox = _outbox(db, sent, lock_ttl=timedelta(milliseconds=50))
+        await outbox.enqueue("+1", "Hello", "task_assigned", task_id="t1", urgent=True)
+        await db.notification_outbox.update_many({}, {"$set": {"status": SENDING, "sending_at": datetime.utcnow()}})
+
+        await outbox._recover_stale()
+        assert await outbox.dispatch_once() == 0
+        await asyncio.sleep(0.1)
+        await outbox._recover_stale()
+        assert await outbox.dispatch_once() == 1
+        assert sent == [("+1", "Hello")]
+
+    asyncio.run(scenario())
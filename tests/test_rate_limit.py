@@ -0,0 +1,90 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from services.rate_limit import InMemorySlidingWindow, LoginThrottle, MongoSlidingWindow
+from tests.conftest import motor_db
+
+WINDOW = timedelta(minutes=5)
+
+
+def test_window_admits_up_to_the_limit():
+    async def scenario():
+        window = InMemorySlidingWindow(2, WINDOW)
+        assert (await window.acquire("k"))[0]
+        assert (await window.acquire("k"))[0]
+        allowed, retry_after = await window.acquire("k")
+        assert not allowed and 0 < retry_after <= WINDOW.total_seconds()
+
+        await window.release("k")
+        assert (await window.acquire("k"))[0]
+
+    asyncio.run(scenario())
+
+
+def test_expired_hits_free_the_window():
+    async def scenario():
+        window = InMemorySlidingWindow(1, timedelta(milliseconds=20))
+        assert (await window.acquire("k"))[0]
+        assert not (await window.acquire("k"))[0]
+        await asyncio.sleep(0.03)
+        assert (await window.acquire("k"))[0]
+
+    asyncio.run(scenario())
+
+
+def test_parallel_logins_cannot_overshoot_the_email_limit():
+    async def scenario():
+        throttle = LoginThrottle(InMemorySlidingWindow, ip_limit=100, email_limit=5, window=WINDOW)
+        results = await asyncio.gather(*(throttle.check(f"10.0.0.{n}", "a@example.com") for n in range(20)))
+        assert sum(allowed for allowed, _ in results) == 5
+
+    asyncio.run(scenario())
+
+
+def test_blocked_email_refunds_the_ip_slot():
+    async def scenario():
+        throttle = LoginThrottle(InMemorySlidingWindow, ip_limit=3, email_limit=1, window=WINDOW)
+        assert (await throttle.check("1.2.3.4", "a@example.com"))[0]
+        # The email is locked out; these must not use up the IP's attempts
+        for _ in range(5):
+            assert not (await throttle.check("1.2.3.4", "a@example.com"))[0]
+        assert (await throttle.check("1.2.3.4", "b@example.com"))[0]
+        assert (await throttle.check("1.2.3.4", "c@example.com"))[0]
+        assert not (await throttle.check("1.2.3.4", "d@example.com"))[0]
+
+    asyncio.run(scenario())
+
+
+def test_success_clears_the_email_window():
+    async def scenario():
+        throttle = LoginThrottle(InMemorySlidingWindow, ip_limit=100, email_limit=2, window=WINDOW)
+        assert (await throttle.check("1.2.3.4", " A@example.com"))[0]
+        assert (await throttle.check("1.2.3.4", "a@example.com"))[0]
+        assert not (await throttle.check("1.2.3.4", "a@example.com"))[0]
+
+        await throttle.succeeded("a@example.com")
+        assert (await throttle.check("1.2.3.4", "a@example.com"))[0]
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("limit", [1, 3])
+def test_mongo_window_reserves_atomically(mongo_db_name, limit):
+    async def scenario():
+        window = MongoSlidingWindow(motor_db(mongo_db_name), limit, WINDOW)
+        await window.ensure_indexes()
+
+        results = await asyncio.gather(*(window.acquire("k") for _ in range(10)))
+        assert sum(allowed for allowed, _ in results) == limit
+        assert all(0 < retry_after <= WINDOW.total_seconds() for allowed, retry_after in results if not allowed)
+
+        await window.release("k")
+        assert (await window.acquire("k"))[0]
+        assert not (await window.acquire("k"))[0]
+
+        await window.reset("k")
+        assert (await window.acquire("k"))[0]
+
+    asyncio.run(scenario())
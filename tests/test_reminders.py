@@ -0,0 +1,89 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from services.reminders import HierarchicalTimingWheel, ReminderService, next_reminder_time
+from services.scheduler import JobScheduler
+from tests.conftest import motor_db
+
+START = datetime(2026, 3, 2, 8, 0, 30)
+
+
+def _advance_by_minutes(wheel, start, minutes):
+    fired = {}
+    for minute in range(1, minutes + 1):
+        for item in wheel.advance(start + timedelta(minutes=minute)):
+            fired[item] = minute
+    return fired
+
+
+def test_wheel_fires_items_on_their_tick_across_levels():
+    wheel = HierarchicalTimingWheel(START)
+    delays = {"next minute": 1, "in an hour": 59, "two hours": 125, "tomorrow": 26 * 60 + 7, "next week": 8 * 24 * 60 + 3}
+    for item, minutes in delays.items():
+        wheel.schedule(START + timedelta(minutes=minutes), item)
+
+    assert _advance_by_minutes(wheel, START, 9 * 24 * 60) == delays
+
+
+def test_wheel_fires_past_items_on_the_next_tick_and_catches_up_after_a_stall():
+    wheel = HierarchicalTimingWheel(START)
+    wheel.schedule(START - timedelta(hours=1), "late")
+    wheel.schedule(START + timedelta(minutes=90), "later")
+
+    assert wheel.advance(START) == []
+    # A single advance over a long gap still expires everything in between
+    assert wheel.advance(START + timedelta(hours=3)) == ["late", "later"]
+
+
+def test_next_reminder_uses_the_users_local_clock():
+    after = datetime(2026, 3, 2, 2, 0)  # 07:30 in Kolkata
+    assert next_reminder_time("Asia/Kolkata", "09:00", after) == datetime(2026, 3, 2, 3, 30)
+    assert next_reminder_time("Asia/Kolkata", "07:00", after) == datetime(2026, 3, 3, 1, 30)
+    assert next_reminder_time("Not/AZone", "09:00", after) == datetime(2026, 3, 2, 9, 0)
+
+
+def test_next_reminder_follows_daylight_saving_changes():
+    # New York moves to EDT on 2026-03-08
+    before = next_reminder_time("America/New_York", "09:00", datetime(2026, 3, 7, 15, 0))
+    after = next_reminder_time("America/New_York", "09:00", before)
+    assert before == datetime(2026, 3, 8, 13, 0)
+    assert after == datetime(2026, 3, 9, 13, 0)
+    assert next_reminder_time("America/New_York", "09:00", datetime(2026, 3, 6, 15, 0)) == datetime(2026, 3, 7, 14, 0)
+
+
+def test_rescheduling_a_user_supersedes_the_old_wheel_entry():
+    service = ReminderService(None, send_reminder=None, acquire_lease=None)
+    user = {"id": "u1", "phone_number": "+1555", "timezone": "UTC", "reminder_time": "09:00"}
+    service.schedule_user(user)
+    first = service.scheduled["u1"]
+
+    service.schedule_user({**user, "reminder_time": "10:00"})
+    assert service.scheduled["u1"] == first + timedelta(hours=1)
+
+    service.schedule_user({**user, "reminders_enabled": False})
+    assert "u1" not in service.scheduled and "u1" not in service.preferences
+
+
+def test_each_user_gets_one_reminder_per_local_day_across_workers(mongo_db_name):
+    async def scenario():
+        db = motor_db(mongo_db_name)
+        user = {"id": "u1", "phone_number": "+1555", "timezone": "Asia/Kolkata", "reminder_time": "09:00"}
+        await db.users.insert_one(dict(user))
+        sent = []
+
+        async def send_reminder(recipient):
+            sent.append(recipient["id"])
+
+        fire_at = next_reminder_time("Asia/Kolkata", "09:00", datetime.utcnow())
+        workers = []
+        for _ in range(2):
+            scheduler = JobScheduler(db)
+            workers.append(ReminderService(db, send_reminder, scheduler.acquire_lease))
+        await asyncio.gather(*(worker._fire("u1", fire_at) for worker in workers))
+        assert sent == ["u1"]
+
+        # A stale entry for a time the user has since moved away from is dropped
+        await workers[0]._fire("u1", fire_at + timedelta(hours=1))
+        assert sent == ["u1"]
+
+    asyncio.run(scenario())
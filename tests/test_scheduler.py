@@ -0,0 +1,75 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from services.scheduler import CronSchedule, JobScheduler
+from tests.conftest import motor_db
+
+# 2026-03-01 is a Sunday, 2026-03-02 a Monday
+SUNDAY_FIRST = datetime(2026, 3, 1, 9, 0)
+MONDAY = datetime(2026, 3, 2, 9, 0)
+FRIDAY_13TH = datetime(2026, 3, 13, 9, 0)
+TUESDAY = datetime(2026, 3, 3, 9, 0)
+
+
+def test_fields_parse_ranges_steps_and_lists():
+    schedule = CronSchedule("*/15 8-18/5 * * 1,3,5")
+    assert schedule.fields["minute"] == {0, 15, 30, 45}
+    assert schedule.fields["hour"] == {8, 13, 18}
+    assert schedule.fields["weekday"] == {1, 3, 5}
+
+
+@pytest.mark.parametrize("expression", ["* * * *", "60 * * * *", "* 24 * * *", "*/0 * * * *", "* * 0 * *"])
+def test_invalid_expressions_are_rejected(expression):
+    with pytest.raises(ValueError):
+        CronSchedule(expression)
+
+
+def test_day_and_weekday_both_restricted_match_either():
+    # Like cron: "the 1st of the month, or any Monday"
+    schedule = CronSchedule("0 9 1 * 1")
+    assert schedule.matches(SUNDAY_FIRST)
+    assert schedule.matches(MONDAY)
+    assert not schedule.matches(TUESDAY)
+
+
+def test_only_one_of_day_and_weekday_restricted_must_match():
+    assert CronSchedule("0 9 * * 1").matches(MONDAY)
+    assert not CronSchedule("0 9 * * 1").matches(SUNDAY_FIRST)
+    assert CronSchedule("0 9 13 * *").matches(FRIDAY_13TH)
+    assert not CronSchedule("0 9 13 * *").matches(MONDAY)
+    # A stepped star still counts as unrestricted
+    assert not CronSchedule("0 9 */2 * 1").matches(MONDAY)
+
+
+def test_time_fields_must_all_match():
+    schedule = CronSchedule("30 9 * * *")
+    assert schedule.matches(MONDAY.replace(minute=30))
+    assert not schedule.matches(MONDAY)
+    assert not schedule.matches(MONDAY.replace(hour=10, minute=30))
+
+
+def test_only_one_worker_runs_each_tick(mongo_db_name):
+    async def scenario():
+        db = motor_db(mongo_db_name)
+        runs = []
+
+        async def job():
+            runs.append(1)
+
+        workers = [JobScheduler(db) for _ in range(3)]
+        for worker in workers:
+            worker.add_job("daily", "0 9 * * *", job)
+        await workers[0].ensure_indexes()
+
+        started = await asyncio.gather(*(worker.run_pending(MONDAY) for worker in workers))
+        assert sorted(len(names) for names in started) == [0, 0, 1]
+        assert [await worker.run_pending(TUESDAY.replace(hour=10)) for worker in workers] == [[], [], []]
+
+        await asyncio.gather(*(task for worker in workers for task in list(worker._running)))
+        assert runs == [1]
+        lease = await db.scheduler_leases.find_one({"job": "daily"})
+        assert lease["status"] == "completed"
+
+    asyncio.run(scenario())
@@ -0,0 +1,88 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from services.sync import DeltaSync
+from services.task_sweeper import TaskSweeper
+from tests.conftest import HookedDb, motor_db
+
+VISIBLE = {"tasks": {}, "projects": {}}
+
+
+def test_cursor_round_trip():
+    positions = {"tasks": [datetime(2026, 1, 2, 3, 4, 5, 678000), "abc"], "deleted_tasks": None}
+    assert DeltaSync.decode_cursor(DeltaSync.encode_cursor(positions)) == positions
+
+
+def test_long_writer_straddling_a_sync_cursor_is_not_lost(mongo_db_name):
+    async def scenario():
+        db = motor_db(mongo_db_name)
+        delta = DeltaSync(db, settle_time=timedelta(0))
+        now = datetime.utcnow()
+        await db.tasks.insert_one({
+            "id": "slow", "status": "todo", "priority": "high",
+            "due_date": now + timedelta(days=1), "eisenhower_quadrant": "schedule",
+            "created_at": now - timedelta(hours=1), "updated_at": now - timedelta(hours=1)
+        })
+
+        cursor = {}
+
+        async def client_syncs_mid_sweep():
+            # Another write lands and a client syncs past it while the sweep
+            # is still between reading its tasks and writing them
+            await asyncio.sleep(0.01)
+            await db.tasks.insert_one({"id": "marker", "status": "todo", "updated_at": datetime.utcnow()})
+            await asyncio.sleep(0.01)
+            page = await delta.changes(VISIBLE, None, {})
+            assert {task["id"] for task in page["tasks"]} == {"slow", "marker"}
+            cursor["value"] = page["cursor"]
+
+        sweeper = TaskSweeper(HookedDb(db, client_syncs_mid_sweep))
+        assert (await sweeper.sweep_eisenhower_quadrants())["reclassified"] == 1
+
+        await asyncio.sleep(0.01)
+        page = await delta.changes(VISIBLE, None, DeltaSync.decode_cursor(cursor["value"]))
+        assert [task["id"] for task in page["tasks"]] == ["slow"]
+        assert page["tasks"][0]["eisenhower_quadrant"] == "do"
+
+    asyncio.run(scenario())
+
+
+def test_tombstones_older_than_the_ttl_force_a_full_reload():
+    delta = DeltaSync(None, tombstone_ttl=timedelta(days=30))
+    recent = [datetime.utcnow() - timedelta(days=1), "a"]
+    old = [datetime.utcnow() - timedelta(days=31), "a"]
+    assert not delta.tombstones_expired({"tasks": old, "deleted_tasks": recent})
+    assert delta.tombstones_expired({"tasks": recent, "deleted_tasks": old})
+
+
+def test_watermark_pages_through_ties_and_returns_only_later_changes(mongo_db_name):
+    async def scenario():
+        db = motor_db(mongo_db_name)
+        delta = DeltaSync(db, settle_time=timedelta(0))
+        stamp = datetime.utcnow().replace(microsecond=0) - timedelta(minutes=1)
+        # Several writes in the same millisecond must not be split or skipped across pages
+        await db.tasks.insert_many([{"id": f"t{n}", "updated_at": stamp} for n in range(5)])
+
+        seen, positions = [], {}
+        while True:
+            page = await delta.changes(VISIBLE, None, positions, limit=2)
+            seen += [task["id"] for task in page["tasks"]]
+            positions = DeltaSync.decode_cursor(page["cursor"])
+            if not page["has_more"]:
+                break
+        assert seen == ["t0", "t1", "t2", "t3", "t4"]
+
+        page = await delta.changes(VISIBLE, None, positions)
+        assert page["tasks"] == [] and page["deleted"] == {"tasks": [], "projects": []}
+
+        await asyncio.sleep(0.01)
+        await db.tasks.update_one({"id": "t3"}, {"$set": {"title": "changed"}, "$currentDate": {"updated_at": True}})
+        await db.tasks.delete_one({"id": "t1"})
+        await delta.record_deletions("tasks", [{"id": "t1", "company_id": None}])
+        await asyncio.sleep(0.01)
+
+        page = await delta.changes(VISIBLE, None, positions)
+        assert [task["id"] for task in page["tasks"]] == ["t3"]
+        assert page["deleted"]["tasks"] == ["t1"]
+
+    asyncio.run(scenario())
@@ -15,6 +15,13 @@ let qrCode = null
 let connectionStatus = 'disconnected'
 let connectedUser = null
 
+// Inbound messages are buffered briefly and forwarded to FastAPI in batches
+const INBOUND_BATCH_WINDOW_MS = parseInt(process.env.INBOUND_BATCH_WINDOW_MS || '100', 10)
+const INBOUND_BATCH_MAX = parseInt(process.env.INBOUND_BATCH_MAX || '100', 10)
+let inboundQueue = []
+let inboundTimer = null
+let inboundChain = Promise.resolve()
+
 async function initWhatsApp() {
     try {
         console.log('🚀 Initializing WhatsApp connection...')
@@ -63,7 +70,7 @@ async function initWhatsApp() {
             if (type === 'notify') {
                 for (const message of messages) {
                     if (!message.key.fromMe && message.message) {
-                        await handleIncomingMessage(message)
+                        queueIncomingMessage(message)
                     }
                 }
             }
@@ -78,6 +85,73 @@ async function initWhatsApp() {
     }
 }
 
+function toInboundPayload(message) {
+    return {
+        phone_number: message.key.remoteJid.replace('@s.whatsapp.net', ''),
+        message: message.message.conversation ||
+                 message.message.extendedTextMessage?.text || '',
+        message_id: message.key.id,
+        timestamp: message.messageTimestamp
+    }
+}
+
+function queueIncomingMessage(message) {
+    inboundQueue.push(message)
+
+    if (inboundQueue.length >= INBOUND_BATCH_MAX) {
+        flushInboundQueue()
+    } else if (!inboundTimer) {
+        inboundTimer = setTimeout(flushInboundQueue, INBOUND_BATCH_WINDOW_MS)
+    }
+}
+
+function flushInboundQueue() {
+    if (inboundTimer) {
+        clearTimeout(inboundTimer)
+        inboundTimer = null
+    }
+    const batch = inboundQueue
+    inboundQueue = []
+    if (batch.length === 0) {
+        return inboundChain
+    }
+
+    // Batches run one after another so a sender's messages never overtake each other
+    inboundChain = inboundChain.then(() => handleIncomingBatch(batch))
+    return inboundChain
+}
+
+async function handleIncomingBatch(messages) {
+    if (messages.length === 1) {
+        return handleIncomingMessage(messages[0])
+    }
+
+    const payload = messages.map(toInboundPayload)
+    console.log(`📨 Received ${payload.length} messages, forwarding as a batch`)
+
+    let replies
+    try {
+        const response = await axios.post(`${FASTAPI_URL}/api/whatsapp/messages/batch`, {
+            messages: payload
+        })
+        replies = response.data.replies || {}
+    } catch (error) {
+        console.error('❌ Batch forwarding failed, falling back to single messages:', error.message)
+        for (const message of messages) {
+            await handleIncomingMessage(message)
+        }
+        return
+    }
+
+    // Send replies in the original order
+    for (const item of payload) {
+        const result = replies[item.message_id]
+        if (result && result.reply) {
+            await sendMessage(item.phone_number, result.reply)
+        }
+    }
+}
+
 async function handleIncomingMessage(message) {
     try {
         const phoneNumber = message.key.remoteJid.replace('@s.whatsapp.net', '')
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+
+from routers.whatsapp import whatsapp_commands
+from services.commands import CommandRouter
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Representative mix of inbound WhatsApp messages
+SAMPLE_MESSAGES = [
+    "create task: buy groceries",
+    "add task: call the bank",
+    "assign task to john: review documents due tomorrow",
+    "team list",
+    "message team: meeting in 10 minutes",
+    "list tasks",
+    "tasks",
+    "complete task 3",
+    "done task 1",
+    "stats",
+    "coach",
+    "help",
+    "what is this",
+    "create task:",
+]
+
+ITERATIONS = 200000
+
+
+async def noop(user, *args, **kwargs):
+    return ""
+
+
+def build_router(extra_commands: int = 0) -> CommandRouter:
+    """The server's WhatsApp command table with no-op handlers, plus optional filler commands"""
+    router = CommandRouter(fallback=noop)
+    for command in whatsapp_commands.commands:
+        router.register(
+            command.name,
+            noop,
+            phrases=tuple(phrase for phrase, owner in whatsapp_commands.phrases.items() if owner is command),
+            prefixes=tuple(prefix for prefix, owner in whatsapp_commands.prefixes.items() if owner is command),
+            parser=command.parser,
+            usage=command.usage
+        )
+
+    for i in range(extra_commands):
+        router.register(f"extra {i}", noop, phrases=(f"extra command {i}",), prefixes=(f"extra{i}:",))
+
+    return router
+
+
+def legacy_match(message_text: str) -> str:
+    """The previous top-to-bottom if/elif chain, for comparison"""
+    if message_text.startswith("create task:") or message_text.startswith("add task:"):
+        return "create task"
+    elif message_text.startswith("assign task to "):
+        return "assign task"
+    elif message_text in ["team list", "show team", "list team", "team members"]:
+        return "team list"
+    elif message_text.startswith("message team:") or message_text.startswith("broadcast:"):
+        return "message team"
+    elif message_text in ["list tasks", "show tasks", "my tasks", "tasks"]:
+        return "list tasks"
+    elif message_text.startswith("complete task") or message_text.startswith("done task"):
+        return "complete task"
+    elif message_text in ["stats", "status", "performance", "dashboard"]:
+        return "stats"
+    elif message_text in ["coach", "help me", "advice", "tips", "coaching"]:
+        return "coach"
+    elif message_text in ["help", "commands", "?", "menu"]:
+        return "help"
+    return "unknown"
+
+
+def measure(label: str, func) -> float:
+    start = time.perf_counter()
+    for i in range(ITERATIONS):
+        func(SAMPLE_MESSAGES[i % len(SAMPLE_MESSAGES)])
+    elapsed = time.perf_counter() - start
+    rate = ITERATIONS / elapsed
+    logger.info(f"{label:<40} {rate:>12,.0f} commands/sec")
+    return rate
+
+
+def measure_dispatch(label: str, router: CommandRouter) -> float:
+    async def run():
+        for i in range(ITERATIONS):
+            await router.dispatch({}, SAMPLE_MESSAGES[i % len(SAMPLE_MESSAGES)])
+
+    start = time.perf_counter()
+    asyncio.run(run())
+    elapsed = time.perf_counter() - start
+    rate = ITERATIONS / elapsed
+    logger.info(f"{label:<40} {rate:>12,.0f} commands/sec")
+    return rate
+
+
+def run_benchmark():
+    logger.info(f"Routing {ITERATIONS:,} messages ({len(SAMPLE_MESSAGES)} message shapes)")
+
+    measure("legacy if/elif chain (match only)", legacy_match)
+
+    router = build_router()
+    measure("command router (match only)", router.match)
+
+    # Adding commands must not slow down the existing ones
+    for extra in (100, 1000, 10000):
+        measure(f"command router + {extra} commands", build_router(extra).match)
+
+    measure_dispatch("command router (match + parse + call)", router)
+
+    # Sanity check: the router resolves every sample the same way as the old chain
+    for message in SAMPLE_MESSAGES:
+        command, _ = router.match(message)
+        expected = legacy_match(message)
+        actual = command.name if command else "unknown"
+        if actual != expected:
+            logger.error(f"Routing mismatch for '{message}': {actual} != {expected}")
+            return False
+
+    logger.info("All sample messages route to the same command as before")
+    return True
+
+
+if __name__ == "__main__":
+    success = run_benchmark()
+    sys.exit(0 if success else 1)